@@ -20,6 +20,13 @@ class AddonMetadata:
 class IAutolauncherAddon(ABC):
     """
     Abstract Base Class for all Autolauncher Addons.
+
+    An addon package should name its entry class in its __init__.py via
+    `ADDON_CLASS = MyAddon`. Packages without it are scanned for the first
+    IAutolauncherAddon subclass instead.
+
+    Addons are imported and constructed at startup, so keep module import and
+    __init__ cheap: import heavy optional dependencies inside the hooks that use them.
     """
 
     def __init__(self, manager):
@@ -4,15 +4,20 @@ Handles discovery, loading, and lifecycle management of Autolauncher Addons.
 """
 
 import os
+import compileall
 import importlib
 import sys
 from typing import Dict, List, Optional, Any
 from pathlib import Path
+from config import APP_VERSION
 from logger import get_logger
 from addon_interface import IAutolauncherAddon
 
 logger = get_logger(__name__)
 
+# Directory levels below addons/ to precompile: each addon's own modules, not its vendored lib/
+ADDON_COMPILE_DEPTH = 1
+
 class AddonManager:
     """
     Central manager for finding and running addons.
@@ -22,11 +27,16 @@ class AddonManager:
     def __init__(self, context=None):
         self.context = context  # MainController reference
         self.addons: Dict[str, IAutolauncherAddon] = {}
+        self._enabled_addons: List[IAutolauncherAddon] = []  # Hook dispatch list, rebuilt on state change
+        self._class_cache: Dict[str, type] = {}  # package_name -> addon class
         self.addon_dir = os.path.join(os.path.dirname(__file__), "addons")
+        self._addon_dir_ready = False  # Set once the directory is known to exist
         self._ensure_addon_dir()
 
     def _ensure_addon_dir(self):
         """Ensure the addons directory exists."""
+        if self._addon_dir_ready:
+            return
         if not os.path.exists(self.addon_dir):
             try:
                 os.makedirs(self.addon_dir)
@@ -35,31 +45,71 @@ class AddonManager:
                     f.write("# Addons package\n")
             except Exception as e:
                 logger.error(f"Failed to create addons directory: {e}")
+                return
+        self._addon_dir_ready = True
+        self.precompile_addons()
 
-    def discover_addons(self):
+    def precompile_addons(self, force: bool = False):
+        """
+        Compile addon sources to __pycache__ so startup imports skip parsing.
+        Runs once per application version (tracked by a marker file in the addons directory);
+        files that fail to compile are left to normal import-time compilation.
+        """
+        marker = os.path.join(self.addon_dir, ".compiled")
+        try:
+            if not force and os.path.exists(marker):
+                with open(marker, 'r') as f:
+                    if f.read().strip() == APP_VERSION:
+                        return
+            
+            if not compileall.compile_dir(self.addon_dir, maxlevels=ADDON_COMPILE_DEPTH,
+                                          quiet=1, force=force, legacy=False):
+                logger.debug("Some addon files could not be precompiled")
+            with open(marker, 'w') as f:
+                f.write(APP_VERSION)
+            logger.debug("Addon bytecode precompiled")
+        except Exception as e:
+            # Read-only install locations just fall back to normal import-time compilation
+            logger.debug(f"Could not precompile addons: {e}")
+
+    def discover_addons(self, force_reload: bool = False):
         """
         Scan the addons directory for valid addon packages.
         An addon is a subdirectory with an __init__.py and a main class implementing IAutolauncherAddon.
+        
+        Args:
+            force_reload: Re-execute already imported addon packages (explicit user reload only)
         """
         logger.info("Discovering addons...")
-        if not os.path.exists(self.addon_dir):
+        if not self._addon_dir_ready and not os.path.exists(self.addon_dir):
             return
+        self._addon_dir_ready = True
 
         # Add parent dir to sys.path to ensure imports work if needed
         parent_dir = os.path.dirname(self.addon_dir)
         if parent_dir not in sys.path:
             sys.path.append(parent_dir)
 
-        for item in os.listdir(self.addon_dir):
-            item_path = os.path.join(self.addon_dir, item)
-            if os.path.isdir(item_path) and os.path.exists(os.path.join(item_path, "__init__.py")):
-                self._load_addon(item)
+        # scandir yields type info from the directory read itself (no per-entry stat)
+        with os.scandir(self.addon_dir) as entries:
+            packages = [
+                entry.name for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+                and os.path.exists(os.path.join(entry.path, "__init__.py"))
+            ]
+        
+        for package_name in packages:
+            self._load_addon(package_name, force_reload=force_reload)
 
-    def _load_addon(self, package_name: str):
+    def _load_addon(self, package_name: str, force_reload: bool = False):
         """
         Dynamically load an addon module.
         Assumes the addon has a specific entry point (e.g., 'main.py' or just exposes a class in __init__).
         We will look for a class that inherits from IAutolauncherAddon in the package.
+        
+        An already imported package is reused from sys.modules unless force_reload is set.
+        Note that importlib.reload only re-executes the package __init__; submodules and
+        other transitive imports keep their old code until the application restarts.
         """
         try:
             # Support for Self-Contained Addons (Vendor Bundle Pattern)
@@ -72,25 +122,19 @@ class AddonManager:
 
             # Import the package: addons.package_name
             module_name = f"addons.{package_name}"
+            module = sys.modules.get(module_name)
             
-            # Since we modify the directory structure, we might need to invalidate caches or re-import
-            if module_name in sys.modules:
-                module = importlib.reload(sys.modules[module_name])
-            else:
-                module = importlib.import_module(module_name)
-            
-            # Find the Addon class
-            addon_class = None
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                try:
-                    if (isinstance(attr, type) and 
-                        issubclass(attr, IAutolauncherAddon) and 
-                        attr is not IAutolauncherAddon):
-                        addon_class = attr
-                        break
-                except TypeError:
-                    continue
+            # Reuse the resolved class while the imported package is current
+            addon_class = self._class_cache.get(package_name)
+            if addon_class is None or module is None or force_reload:
+                if module is None:
+                    module = importlib.import_module(module_name)
+                elif force_reload:
+                    module = importlib.reload(module)
+                
+                addon_class = self._find_addon_class(module)
+                if addon_class:
+                    self._class_cache[package_name] = addon_class
             
             if addon_class:
                 # Instantiate
@@ -109,6 +153,7 @@ class AddonManager:
                 else:
                     addon_instance._enabled = False
                     logger.info(f"Addon loaded (disabled): {addon_instance.metadata.name}")
+                self._refresh_enabled_addons()
             else:
                 logger.warning(f"No IAutolauncherAddon implementation found in {package_name}")
 
@@ -117,6 +162,28 @@ class AddonManager:
             import traceback
             logger.debug(traceback.format_exc())
 
+    def _find_addon_class(self, module) -> Optional[type]:
+        """
+        Resolve the addon entry class of a package.
+        Uses the module's ADDON_CLASS if declared, otherwise scans its attributes.
+        """
+        addon_class = getattr(module, 'ADDON_CLASS', None)
+        if (isinstance(addon_class, type) and 
+            issubclass(addon_class, IAutolauncherAddon) and 
+            addon_class is not IAutolauncherAddon):
+            return addon_class
+        
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            try:
+                if (isinstance(attr, type) and 
+                    issubclass(attr, IAutolauncherAddon) and 
+                    attr is not IAutolauncherAddon):
+                    return attr
+            except TypeError:
+                continue
+        return None
+
     def enable_addon(self, addon_id: str):
         """Enable an addon and persist state."""
         if addon_id in self.addons:
@@ -127,6 +194,7 @@ class AddonManager:
             try:
                 addon.on_enable()
                 addon._enabled = True
+                self._refresh_enabled_addons()
                 logger.info(f"Enabled addon: {addon_id}")
                 
                 # Update settings
@@ -150,6 +218,7 @@ class AddonManager:
             try:
                 addon.on_disable()
                 addon._enabled = False
+                self._refresh_enabled_addons()
                 logger.info(f"Disabled addon: {addon_id}")
                 
                 # Update settings
@@ -163,9 +232,13 @@ class AddonManager:
             except Exception as e:
                 logger.error(f"Error disabling addon {addon_id}: {e}")
 
+    def _refresh_enabled_addons(self):
+        """Rebuild the cached list of enabled addons used by the hook dispatchers."""
+        self._enabled_addons = [a for a in self.addons.values() if getattr(a, '_enabled', False)]
+
     def get_enabled_addons(self) -> List[IAutolauncherAddon]:
         """Return list of enabled addon instances."""
-        return [a for a in self.addons.values() if getattr(a, '_enabled', False)]
+        return list(self._enabled_addons)
     
     def get_all_addons(self) -> List[IAutolauncherAddon]:
         """Return all loaded addon instances."""
@@ -174,46 +247,45 @@ class AddonManager:
     # --- Hooks ---
 
     def notify_app_start(self):
-        for addon in self.addons.values():
-            if addon._enabled:
-                try: 
-                    addon.on_app_start()
-                except Exception as e:
-                    logger.error(f"Error in addon {addon.metadata.id}.on_app_start: {e}")
+        log_error = logger.error
+        for addon in self._enabled_addons:
+            try: 
+                addon.on_app_start()
+            except Exception as e:
+                log_error(f"Error in addon {addon.metadata.id}.on_app_start: {e}")
 
     def notify_app_shutdown(self):
-        for addon in self.addons.values():
-            if addon._enabled:
-                try:
-                    addon.on_app_shutdown()
-                except Exception as e:
-                    logger.error(f"Error in addon {addon.metadata.id}.on_app_shutdown: {e}")
+        log_error = logger.error
+        for addon in self._enabled_addons:
+            try:
+                addon.on_app_shutdown()
+            except Exception as e:
+                log_error(f"Error in addon {addon.metadata.id}.on_app_shutdown: {e}")
 
     def notify_task_start(self, task_data: Dict, process: Any):
-        for addon in self.addons.values():
-            if addon._enabled:
-                try:
-                    addon.on_task_start(task_data, process)
-                except Exception as e:
-                    logger.error(f"Error in addon {addon.metadata.id}.on_task_start: {e}")
+        log_error = logger.error
+        for addon in self._enabled_addons:
+            try:
+                addon.on_task_start(task_data, process)
+            except Exception as e:
+                log_error(f"Error in addon {addon.metadata.id}.on_task_start: {e}")
 
     def notify_task_end(self, task_id: int):
-        for addon in self.addons.values():
-            if addon._enabled:
-                try:
-                    addon.on_task_end(task_id)
-                except Exception as e:
-                    logger.error(f"Error in addon {addon.metadata.id}.on_task_end: {e}")
+        log_error = logger.error
+        for addon in self._enabled_addons:
+            try:
+                addon.on_task_end(task_id)
+            except Exception as e:
+                log_error(f"Error in addon {addon.metadata.id}.on_task_end: {e}")
 
     def get_all_indicators(self) -> List:
         """Get all UI indicators from enabled addons."""
         indicators = []
-        for addon in self.addons.values():
-            if addon._enabled:
-                try:
-                    widget = addon.get_indicator_widget()
-                    if widget:
-                        indicators.append(widget)
-                except Exception as e:
-                    logger.error(f"Error getting indicator from {addon.metadata.id}: {e}")
+        for addon in self._enabled_addons:
+            try:
+                widget = addon.get_indicator_widget()
+                if widget:
+                    indicators.append(widget)
+            except Exception as e:
+                logger.error(f"Error getting indicator from {addon.metadata.id}: {e}")
         return indicators
@@ -3,6 +3,8 @@ Addon View Module
 Displays and manages installed addons.
 """
 
+from functools import partial
+
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from PyQt6.QtCore import Qt
 from qfluentwidgets import (
@@ -31,6 +33,8 @@ class AddonView(ScrollArea):
         self.setObjectName("addonView")
         self.scrollWidget.setObjectName("scrollWidget")
         
+        self._addon_manager = None  # Set by populate_addons
+        
         self._init_ui()
         
     def _init_ui(self):
@@ -61,6 +65,8 @@ class AddonView(ScrollArea):
         # Clear existing (if needed, simplified for now)
         # self.addonsGroup.removeAllWidgets() # Not easily available, assumes single call
         
+        self._addon_manager = addon_manager
+        
         try:
             addons = addon_manager.get_all_addons()
             
@@ -72,40 +78,44 @@ class AddonView(ScrollArea):
                 )
                 return
 
-            for addon in addons:
-                meta = addon.metadata
-                is_enabled = getattr(addon, '_enabled', False)
-                
-                # Use PUZZLE or similar if EXTENSION is missing
-                icon = FluentIcon.LEGO if hasattr(FluentIcon, 'LEGO') else FluentIcon.PEOPLE
-                
-                card = SwitchSettingCard(
-                    icon,
-                    meta.name,
-                    f"{meta.description}\nVersion: {meta.version} | Author: {meta.author}",
-                    configItem=None,
-                    parent=self.addonsGroup
-                )
-                card.setChecked(is_enabled)
-                
-                # Connect signal
-                card.checkedChanged.connect(
-                    lambda checked, aid=meta.id: self._on_addon_toggled(addon_manager, aid, checked)
-                )
-                
-                self.addonsGroup.addSettingCard(card)
+            # Use PUZZLE or similar if EXTENSION is missing
+            icon = FluentIcon.LEGO if hasattr(FluentIcon, 'LEGO') else FluentIcon.PEOPLE
+            
+            # Add all cards with painting suspended so the layout settles in one pass
+            self.setUpdatesEnabled(False)
+            try:
+                for addon in addons:
+                    meta = addon.metadata
+                    is_enabled = getattr(addon, '_enabled', False)
+                    
+                    card = SwitchSettingCard(
+                        icon,
+                        meta.name,
+                        f"{meta.description}\nVersion: {meta.version} | Author: {meta.author}",
+                        configItem=None,
+                        parent=self.addonsGroup
+                    )
+                    card.setChecked(is_enabled)
+                    
+                    # Connect signal
+                    card.checkedChanged.connect(partial(self._on_addon_toggled, meta.id))
+                    
+                    self.addonsGroup.addSettingCard(card)
+            finally:
+                self.setUpdatesEnabled(True)
+            self.addonsGroup.adjustSize()
         
         except Exception as e:
             logger.error(f"Failed to populate addon view: {e}")
 
-    def _on_addon_toggled(self, manager, addon_id, is_checked):
+    def _on_addon_toggled(self, addon_id, is_checked):
         """Handle toggle."""
         try:
             if is_checked:
-                manager.enable_addon(addon_id)
+                self._addon_manager.enable_addon(addon_id)
                 status = "enabled"
             else:
-                manager.disable_addon(addon_id)
+                self._addon_manager.disable_addon(addon_id)
                 status = "disabled"
             
             InfoBar.success(
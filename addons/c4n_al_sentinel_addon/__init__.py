@@ -2,3 +2,5 @@
 c4n-ALSentinelAddon Package
 """
 from .sentinel import SentinelAddon
+
+ADDON_CLASS = SentinelAddon
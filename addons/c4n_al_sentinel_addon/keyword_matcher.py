@@ -0,0 +1,80 @@
+"""
+Keyword Matcher Module
+Case-insensitive multi-keyword substring matching for window titles and content.
+Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+falls back to a plain substring scan over the pre-lowered keywords.
+"""
+
+from typing import Iterable, Optional
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Lowercases ASCII A-Z bytewise; applied to UTF-16-LE text it only ever
+# affects code units whose high byte is zero (i.e. ASCII letters) at even offsets.
+_UTF16_ASCII_LOWER = bytes.maketrans(
+    bytes(range(ord("A"), ord("Z") + 1)),
+    bytes(range(ord("a"), ord("z") + 1))
+)
+
+
+class KeywordMatcher:
+    """
+    Matches a fixed set of keywords against arbitrary text in a single pass.
+    Keywords are lowered once at construction; callers pass text as-is.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(dict.fromkeys(kw.lower() for kw in keywords if kw))
+        self._automaton = None
+        
+        # UTF-16-LE forms for matching raw window-text buffers (ASCII keywords only)
+        self._utf16 = None
+        if all(kw.isascii() for kw in self.keywords):
+            self._utf16 = tuple(kw.encode("utf-16-le") for kw in self.keywords)
+
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for kw in self.keywords:
+                automaton.add_word(kw, kw)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def find(self, text: str) -> Optional[str]:
+        """Return the first keyword contained in `text`, or None."""
+        if not text:
+            return None
+        text_lower = text.lower()
+
+        if self._automaton is not None:
+            for _, kw in self._automaton.iter(text_lower):
+                return kw
+            return None
+
+        for kw in self.keywords:
+            if kw in text_lower:
+                return kw
+        return None
+
+    def find_utf16le(self, raw: bytes) -> Optional[str]:
+        """
+        Return the first keyword contained in raw UTF-16-LE text, or None.
+        Latin-1 text is matched bytewise without decoding; anything wider is
+        decoded and goes through find() so Unicode case folding still applies.
+        """
+        if self._utf16 is None or raw[1::2].count(0) != len(raw) // 2:
+            return self.find(raw.decode("utf-16-le", errors="replace"))
+
+        lowered = raw.translate(_UTF16_ASCII_LOWER)
+        for kw, kw_raw in zip(self.keywords, self._utf16):
+            idx = lowered.find(kw_raw)
+            while idx != -1:
+                if idx % 2 == 0:  # Aligned to a code unit
+                    return kw
+                idx = lowered.find(kw_raw, idx + 1)
+        return None
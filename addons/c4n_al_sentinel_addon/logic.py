@@ -6,22 +6,195 @@ Migrated and enhanced from legacy stuck_detector.py.
 
 import ctypes
 from ctypes import wintypes
+import io
 import os
 import tempfile
+import struct
 import sys
-from typing import List, Tuple, Optional
+import threading
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple, Optional
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import xxhash
+    _hash_pixels = xxhash.xxh3_64_intdigest
+except ImportError:
+    import zlib
+    _hash_pixels = zlib.crc32
 
 from logger import get_logger
+from config import CONFIRMATION_ENTER_FALLBACK
+from .keyword_matcher import KeywordMatcher
 
 logger = get_logger(__name__)
 
-# Windows API Constants
-EnumWindowsProc = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
-GetWindowThreadProcessId = ctypes.windll.user32.GetWindowThreadProcessId
-GetWindowTextLengthW = ctypes.windll.user32.GetWindowTextLengthW
-GetWindowTextW = ctypes.windll.user32.GetWindowTextW
-IsWindowVisible = ctypes.windll.user32.IsWindowVisible
+# Windows API bindings
+# Private DLL handles so the prototypes below don't leak onto ctypes.windll users elsewhere.
+_user32 = ctypes.WinDLL("user32")
+_gdi32 = ctypes.WinDLL("gdi32")
+
+EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+_user32.EnumWindows.argtypes = [EnumWindowsProc, wintypes.LPARAM]
+_user32.EnumWindows.restype = wintypes.BOOL
+_user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+_user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+_user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+_user32.GetWindowTextLengthW.restype = ctypes.c_int
+_user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+_user32.GetWindowTextW.restype = ctypes.c_int
+_user32.IsWindowVisible.argtypes = [wintypes.HWND]
+_user32.IsWindowVisible.restype = wintypes.BOOL
+_user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+_user32.GetWindowRect.restype = wintypes.BOOL
+
+GetWindowThreadProcessId = _user32.GetWindowThreadProcessId
+GetWindowTextLengthW = _user32.GetWindowTextLengthW
+GetWindowTextW = _user32.GetWindowTextW
+IsWindowVisible = _user32.IsWindowVisible
+
+# GDI capture (PrintWindow renders the window itself, even when occluded)
+PW_RENDERFULLCONTENT = 0x00000002
+BI_RGB = 0
+DIB_RGB_COLORS = 0
+
+_user32.GetWindowDC.restype = wintypes.HDC
+_user32.GetWindowDC.argtypes = [wintypes.HWND]
+_user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+_user32.PrintWindow.argtypes = [wintypes.HWND, wintypes.HDC, wintypes.UINT]
+_user32.SendInput.argtypes = [wintypes.UINT, ctypes.c_void_p, ctypes.c_int]
+_user32.SendInput.restype = wintypes.UINT
+_user32.GetForegroundWindow.restype = wintypes.HWND
+_gdi32.CreateCompatibleDC.restype = wintypes.HDC
+_gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+_gdi32.CreateCompatibleBitmap.restype = wintypes.HBITMAP
+_gdi32.CreateCompatibleBitmap.argtypes = [wintypes.HDC, ctypes.c_int, ctypes.c_int]
+_gdi32.SelectObject.restype = wintypes.HGDIOBJ
+_gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+_gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+_gdi32.DeleteDC.argtypes = [wintypes.HDC]
+_gdi32.GetDIBits.argtypes = [wintypes.HDC, wintypes.HBITMAP, wintypes.UINT, wintypes.UINT,
+                             ctypes.c_void_p, ctypes.c_void_p, wintypes.UINT]
+_gdi32.GetDIBits.restype = ctypes.c_int
+
+
+# Keyboard input (confirmation dialog Enter fallback)
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+VK_RETURN = 0x0D
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", wintypes.LONG),
+                ("dy", wintypes.LONG),
+                ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t)]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [("wVk", wintypes.WORD),
+                ("wScan", wintypes.WORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t)]
+
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member, so it sets sizeof(INPUT) as SendInput expects
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [("biSize", wintypes.DWORD),
+                ("biWidth", wintypes.LONG),
+                ("biHeight", wintypes.LONG),
+                ("biPlanes", wintypes.WORD),
+                ("biBitCount", wintypes.WORD),
+                ("biCompression", wintypes.DWORD),
+                ("biSizeImage", wintypes.DWORD),
+                ("biXPelsPerMeter", wintypes.LONG),
+                ("biYPelsPerMeter", wintypes.LONG),
+                ("biClrUsed", wintypes.DWORD),
+                ("biClrImportant", wintypes.DWORD)]
+
+
+# Process liveness via a held SYNCHRONIZE handle (also pins the PID against reuse)
+_kernel32 = ctypes.WinDLL("kernel32")
+_kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+_kernel32.OpenProcess.restype = wintypes.HANDLE
+_kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+_kernel32.WaitForSingleObject.restype = wintypes.DWORD
+_kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+_kernel32.CloseHandle.restype = wintypes.BOOL
+
+SYNCHRONIZE = 0x00100000
+WAIT_TIMEOUT = 0x00000102
+
+
+def open_process_handle(pid: int) -> Optional[int]:
+    """Open a wait-only handle to a process; None if it is gone or access is denied."""
+    return _kernel32.OpenProcess(SYNCHRONIZE, False, pid) or None
+
+
+def process_alive(handle: int) -> bool:
+    """True while the process behind `handle` has not exited (zero-timeout wait)."""
+    return _kernel32.WaitForSingleObject(handle, 0) == WAIT_TIMEOUT
+
+
+def close_process_handle(handle: int):
+    """Release a handle from open_process_handle()."""
+    _kernel32.CloseHandle(handle)
+
+
+# OCR worker protocol (see assets/scripts/ocr.cs --serve)
+OCR_END_MARKER = "::OCR-END::"
+OCR_TIMEOUT = 5  # seconds per request
+
+# UIA content scan bounds (COM cross-process calls dominate Sentinel cost)
+UIA_DESCENDANT_DEPTH = 3
+UIA_DESCENDANT_LIMIT = 50
+UIA_PROBE_WORKERS = 4
+
+
+class ProbeResult(NamedTuple):
+    """Outcome of one fused detection pass over a task's windows (see SentinelLogic.probe_task)."""
+    stuck_title: Optional[str] = None               # Window title containing a stuck keyword
+    dialog_hwnd: Optional[int] = None               # Window showing a confirmation dialog
+    content_hit: Optional[Tuple[str, str]] = None   # (keyword, text) found in window content
+    hwnds: Tuple[int, ...] = ()                     # The task's own windows probed for content/dialogs
+
+
+def init_com_thread() -> bool:
+    """
+    Join the calling thread to the process-wide COM multithreaded apartment, so
+    pywinauto calls on it do not set up their own apartment per call.
+    Returns True if the caller must call uninit_com_thread() when done.
+    """
+    try:
+        import pythoncom
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+        return True
+    except Exception:
+        # pywin32 missing, or the thread already lives in another apartment
+        return False
+
+
+def uninit_com_thread():
+    """Counterpart of a successful init_com_thread()."""
+    try:
+        import pythoncom
+        pythoncom.CoUninitialize()
+    except Exception:
+        pass
 
 class SentinelLogic:
     """
@@ -30,8 +203,33 @@ class SentinelLogic:
     """
 
     def __init__(self):
-        self._user32 = ctypes.windll.user32
-        self._setup_comtypes()
+        self._user32 = _user32
+        
+        # Window enumeration snapshot (shared by all checks within one tick)
+        self._win_cache: Optional[List[Tuple[str, int, int]]] = None
+        self._win_cache_ts = 0.0
+        self._win_cache_ttl = 0.25  # seconds
+        
+        # Compiled keyword matchers / button-label regexes, keyed by keyword tuple
+        self._matchers: Dict[Tuple[str, ...], KeywordMatcher] = {}
+        
+        # Reusable ctypes buffers / EnumWindows trampoline (one set per monitor thread)
+        self._tls = threading.local()
+        
+        # UIA probe pool (created on first multi-window probe)
+        self._uia_pool: Optional[ThreadPoolExecutor] = None
+        self._uia_pool_lock = threading.Lock()
+        
+        # Persistent OCR worker (started on first OCR request)
+        self._ocr_proc: Optional[subprocess.Popen] = None
+        self._ocr_lock = threading.Lock()
+        # hwnd -> (width, height, pixel hash, text) of the last OCR run
+        self._ocr_cache: Dict[int, Tuple[int, int, int, str]] = {}
+        
+        # Heavy optional modules, imported on first use
+        self._Application = None  # pywinauto.Application (also configures comtypes)
+        self._Image = None        # PIL.Image
+        self._ImageGrab = None    # PIL.ImageGrab
 
     def _setup_comtypes(self):
         """Configure comtypes cache directory."""
@@ -49,30 +247,243 @@ class SentinelLogic:
     def get_window_titles_and_pids(self) -> List[Tuple[str, int, int]]:
         """
         Return a list of (Window Title, PID, HWND) for all visible windows.
+        The result is cached for a short TTL so one Sentinel tick enumerates once.
         """
-        results = []
+        now = time.monotonic()
+        if self._win_cache is not None and now - self._win_cache_ts < self._win_cache_ttl:
+            return self._win_cache
+        
+        self._win_cache = self._enumerate_windows()
+        self._win_cache_ts = now
+        
+        # Forget OCR text of windows that are gone (a recycled HWND must not inherit it)
+        if self._ocr_cache:
+            live = {hwnd for _, _, hwnd in self._win_cache}
+            self._ocr_cache = {hwnd: entry for hwnd, entry in self._ocr_cache.items() if hwnd in live}
+        return self._win_cache
 
-        def foreach_window(hwnd, lParam):
-            if IsWindowVisible(hwnd):
-                length = GetWindowTextLengthW(hwnd)
-                if length > 0:
-                    buff = ctypes.create_unicode_buffer(length + 1)
-                    GetWindowTextW(hwnd, buff, length + 1)
-                    title = buff.value
-                    
-                    pid = wintypes.DWORD()
-                    GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-                    
-                    results.append((title, pid.value, hwnd))
-            return True
+    def get_windows_for_pids(self, pid_set: frozenset) -> List[Tuple[str, int, int]]:
+        """
+        Return (Window Title, PID, HWND) for visible windows owned by the given PIDs.
+        Filters on PID before fetching titles, so unrelated windows cost one syscall.
+        """
+        now = time.monotonic()
+        if self._win_cache is not None and now - self._win_cache_ts < self._win_cache_ttl:
+            return [w for w in self._win_cache if w[1] in pid_set]
+        return self._enumerate_windows(pid_set)
+
+    def find_window_title(self, pid_set: frozenset, matcher: KeywordMatcher) -> Optional[str]:
+        """
+        Return the title of the first visible window owned by `pid_set` that matches,
+        or None. Titles are matched on the raw UTF-16 buffer and enumeration stops at
+        the first hit.
+        """
+        now = time.monotonic()
+        if self._win_cache is not None and now - self._win_cache_ts < self._win_cache_ttl:
+            for title, pid, hwnd in self._win_cache:
+                if pid in pid_set and matcher.find(title):
+                    return title
+            return None
+        
+        hits = self._enumerate_windows(pid_set, matcher)
+        return hits[0][0] if hits else None
+
+    def invalidate_windows(self):
+        """Drop the cached window snapshot so the next lookup re-enumerates."""
+        self._win_cache = None
+        self._win_cache_ts = 0.0
+
+    def _enumerate_windows(self, pid_filter: Optional[frozenset] = None,
+                           title_matcher: Optional[KeywordMatcher] = None) -> List[Tuple[str, int, int]]:
+        """
+        Run EnumWindows and collect (Window Title, PID, HWND) for visible windows,
+        optionally restricted to windows owned by `pid_filter`. With a `title_matcher`
+        only the first matching window is collected.
+        """
+        tls = self._tls
+        if not hasattr(tls, "callback"):
+            # Per-thread scratch state, reused across enumerations
+            tls.title_buf = ctypes.create_unicode_buffer(1024)
+            tls.pid_out = wintypes.DWORD()
+            tls.callback = EnumWindowsProc(self._foreach_window)
 
-        self._user32.EnumWindows(EnumWindowsProc(foreach_window), 0)
+        results = []
+        tls.results = results
+        tls.pid_filter = pid_filter
+        tls.title_matcher = title_matcher
+        try:
+            self._user32.EnumWindows(tls.callback, 0)
+        finally:
+            tls.results = None
+            tls.pid_filter = None
+            tls.title_matcher = None
         return results
 
+    def _foreach_window(self, hwnd, lParam):
+        """EnumWindows callback; appends visible titled windows to the thread's result list."""
+        if IsWindowVisible(hwnd):
+            tls = self._tls
+            pid = tls.pid_out
+            GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+            
+            pid_filter = tls.pid_filter
+            if pid_filter is not None and pid.value not in pid_filter:
+                return True
+            
+            length = GetWindowTextLengthW(hwnd)
+            if length > 0:
+                buff = tls.title_buf
+                if length + 1 > len(buff):
+                    buff = ctypes.create_unicode_buffer(max(length + 1, len(buff) * 2))
+                    tls.title_buf = buff
+                # The length above is only an upper bound, and the title may have shrunk
+                # since; read just the characters copied now, not an older title's tail
+                copied = GetWindowTextW(hwnd, buff, len(buff))
+                if copied <= 0:
+                    return True
+                
+                title_matcher = tls.title_matcher
+                if title_matcher is not None:
+                    raw = ctypes.string_at(ctypes.addressof(buff), copied * 2)
+                    if not title_matcher.find_utf16le(raw):
+                        return True
+                    tls.results.append((buff.value, pid.value, hwnd))
+                    return False  # Stop enumeration at the first hit
+                
+                tls.results.append((buff.value, pid.value, hwnd))
+        return True
+
+    def _window_title(self, hwnd: int) -> str:
+        """Read one window's title directly via user32."""
+        length = GetWindowTextLengthW(hwnd)
+        if length <= 0:
+            return ""
+        buff = ctypes.create_unicode_buffer(length + 1)
+        GetWindowTextW(hwnd, buff, length + 1)
+        return buff.value
+
     def get_all_window_titles(self) -> List[str]:
         """Return just the titles of all visible windows."""
         return [r[0] for r in self.get_window_titles_and_pids()]
 
+    def probe(self, proc) -> Optional[Dict[str, Any]]:
+        """
+        Read name/status/ppid of a process with one snapshot (psutil oneshot).
+        Accepts a PID or an already constructed psutil.Process; returns None if it is gone.
+        """
+        import psutil
+        try:
+            if not isinstance(proc, psutil.Process):
+                proc = psutil.Process(proc)
+            with proc.oneshot():
+                return {
+                    'pid': proc.pid,
+                    'name': proc.name(),
+                    'status': proc.status(),
+                    'ppid': proc.ppid(),
+                }
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+
+    def get_matcher(self, keywords: Iterable[str]) -> KeywordMatcher:
+        """
+        Return the compiled matcher for a keyword list, building it on first use.
+        A prebuilt KeywordMatcher is returned as-is.
+        """
+        if isinstance(keywords, KeywordMatcher):
+            return keywords
+        key = tuple(keywords)
+        matcher = self._matchers.get(key)
+        if matcher is None:
+            matcher = self._matchers[key] = KeywordMatcher(key)
+        return matcher
+
+    # --- UI Automation Helpers ---
+
+    def _get_uia_window(self, hwnd: int):
+        """
+        Return a connected UIA window spec for the HWND.
+        Connections are memoized per thread for one tick (the window snapshot TTL).
+        """
+        tls = self._tls
+        now = time.monotonic()
+        cache = getattr(tls, "uia_cache", None)
+        if cache is None or now - tls.uia_cache_ts >= self._win_cache_ttl:
+            cache = tls.uia_cache = {}
+            tls.uia_cache_ts = now
+            
+        win = cache.get(hwnd)
+        if win is None:
+            app = self._get_application_class()(backend="uia").connect(handle=hwnd, timeout=1)
+            win = app.window(handle=hwnd)
+            cache[hwnd] = win
+        return win
+
+    def _get_application_class(self):
+        """Import pywinauto on first UIA use (comtypes cache is configured first)."""
+        if self._Application is None:
+            self._setup_comtypes()
+            from pywinauto import Application
+            self._Application = Application
+        return self._Application
+
+    def _iter_descendants(self, win, limit: int = UIA_DESCENDANT_LIMIT):
+        """Yield at most `limit` descendants, bounding the tree walk depth at the source."""
+        for i, child in enumerate(win.descendants(depth=UIA_DESCENDANT_DEPTH)):
+            if i >= limit:
+                break
+            yield child
+
+    def _probe_hwnd(self, hwnd: int, matcher: KeywordMatcher) -> Optional[Tuple[str, str]]:
+        """Scan one window's UIA descendants; return (keyword, text) of the first hit."""
+        try:
+            win = self._get_uia_window(hwnd)
+            for child in self._iter_descendants(win):
+                try:
+                    text = child.window_text()
+                    kw = matcher.find(text)
+                    if kw:
+                        return kw, text
+                except Exception:
+                    continue
+        except Exception:
+            pass
+        return None
+
+    def _probe_windows(self, hwnds: List[int], matcher: KeywordMatcher) -> Optional[Tuple[int, str, str]]:
+        """
+        Probe several windows concurrently (UIA calls mostly wait on COM IPC).
+        Returns the first (hwnd, keyword, text) hit; pending probes are cancelled.
+        """
+        if not hwnds:
+            return None
+        if len(hwnds) == 1:
+            hit = self._probe_hwnd(hwnds[0], matcher)
+            return (hwnds[0],) + hit if hit else None
+            
+        pool = self._get_uia_pool()
+        futures = {pool.submit(self._probe_hwnd, hwnd, matcher): hwnd for hwnd in hwnds}
+        try:
+            for future in as_completed(futures):
+                hit = future.result()
+                if hit:
+                    return (futures[future],) + hit
+        finally:
+            for future in futures:
+                future.cancel()
+        return None
+
+    def _get_uia_pool(self) -> ThreadPoolExecutor:
+        """Return the UIA probe pool, creating it on first use (or after shutdown)."""
+        with self._uia_pool_lock:
+            if self._uia_pool is None:
+                self._uia_pool = ThreadPoolExecutor(
+                    max_workers=UIA_PROBE_WORKERS,
+                    thread_name_prefix="sentinel-uia",
+                    initializer=init_com_thread
+                )
+            return self._uia_pool
+
     # --- State Detection ---
 
     def is_process_stuck(self, pids: List[int], keywords: List[str]) -> Optional[str]:
@@ -83,15 +494,8 @@ class SentinelLogic:
         if not pids or not keywords:
             return None
             
-        win_info = self.get_window_titles_and_pids()
-        
-        for title, pid, hwnd in win_info:
-            if pid in pids:
-                title_lower = title.lower()
-                for kw in keywords:
-                    if kw.lower() in title_lower:
-                        return title
-        return None
+        pid_set = frozenset(p for p in pids if p is not None)
+        return self.find_window_title(pid_set, self.get_matcher(keywords))
 
     def check_window_content(self, pids: List[int], keywords: List[str]) -> bool:
         """
@@ -101,31 +505,15 @@ class SentinelLogic:
             return False
             
         try:
-            from pywinauto import Application
-            
-            win_info = self.get_window_titles_and_pids()
-            target_hwnds = [hwnd for t, p, hwnd in win_info if p in pids]
+            pid_set = frozenset(p for p in pids if p is not None)
+            matcher = self.get_matcher(keywords)
+            target_hwnds = [hwnd for t, p, hwnd in self.get_windows_for_pids(pid_set)]
             
-            for hwnd in target_hwnds:
-                try:
-                    app = Application(backend="uia").connect(handle=hwnd, timeout=1)
-                    win = app.window(handle=hwnd)
-                    # Check first 50 descendants
-                    descendants = win.descendants()
-                    for i, child in enumerate(descendants):
-                        if i > 50: break
-                        try:
-                            text = child.window_text()
-                            if text:
-                                text_lower = text.lower()
-                                for kw in keywords:
-                                    if kw.lower() in text_lower:
-                                        logger.info(f"Sentinel: Found keyword '{kw}' in window content: '{text}'")
-                                        return True
-                        except:
-                            continue
-                except:
-                    continue
+            hit = self._probe_windows(target_hwnds, matcher)
+            if hit:
+                _, kw, text = hit
+                logger.info(f"Sentinel: Found keyword '{kw}' in window content: '{text}'")
+                return True
         except ImportError:
             pass
         except Exception as e:
@@ -133,6 +521,64 @@ class SentinelLogic:
             
         return False
 
+    def probe_task(self, pids: List[int], title_keywords: List[str],
+                   content_keywords: Optional[List[str]] = None,
+                   dialog_keywords: Optional[List[str]] = None) -> ProbeResult:
+        """
+        Run one tick's detection checks for a task over a single window snapshot.
+        Titles are always checked; window content (UIA) and confirmation dialogs only
+        when their keywords are given, and only while nothing stuck was found.
+        Keyword arguments may be plain lists or prebuilt KeywordMatchers.
+        When content or dialogs were checked, the task's windows are returned in `hwnds`
+        so the caller can run the (slower) OCR fallback on the same windows.
+        """
+        pid_set = frozenset(p for p in pids if p is not None)
+        if not pid_set:
+            return ProbeResult()
+        title_matcher = self.get_matcher(title_keywords) if title_keywords else None
+        
+        if not content_keywords and not dialog_keywords:
+            # Titles only: matched during enumeration, which stops at the first hit
+            if title_matcher:
+                return ProbeResult(stuck_title=self.find_window_title(pid_set, title_matcher))
+            return ProbeResult()
+        
+        win_info = self.get_window_titles_and_pids()
+        own_hwnds = []
+        for title, pid, hwnd in win_info:
+            if pid in pid_set:
+                if title_matcher and title_matcher.find(title):
+                    return ProbeResult(stuck_title=title)
+                own_hwnds.append(hwnd)
+        hwnds = tuple(own_hwnds)
+        
+        try:
+            if content_keywords:
+                hit = self._probe_windows(own_hwnds, self.get_matcher(content_keywords))
+                if hit:
+                    _, kw, text = hit
+                    logger.info(f"Sentinel: Found keyword '{kw}' in window content: '{text}'")
+                    return ProbeResult(content_hit=(kw, text), hwnds=hwnds)
+            
+            if dialog_keywords:
+                # The task's own windows plus any other window whose title names a dialog
+                matcher = self.get_matcher(dialog_keywords)
+                candidate_hwnds = own_hwnds + [
+                    hwnd for title, pid, hwnd in win_info
+                    if pid not in pid_set and matcher.find(title)
+                ]
+                hit = self._probe_windows(candidate_hwnds, matcher)
+                if hit:
+                    hwnd, kw, text = hit
+                    logger.info(f"Sentinel: Dialog detected ('{kw}' in '{text}')")
+                    return ProbeResult(dialog_hwnd=hwnd, hwnds=hwnds)
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.error(f"Sentinel UIA Error: {e}")
+        
+        return ProbeResult(hwnds=hwnds)
+
     def check_global_window_content(self, keywords: List[str]) -> bool:
         """Check all visible windows globally for keywords in content."""
         # This is expensive, so we only check top windows or limited set
@@ -146,55 +592,34 @@ class SentinelLogic:
     def check_window_content_ocr(self, hwnd: int) -> str:
         """
         Use Windows Native OCR to read text from a window's screenshot.
+        The screenshot is streamed as PNG bytes to a long-lived OCR worker process.
         """
-        temp_img = os.path.join(tempfile.gettempdir(), f"sentinel_ocr_{hwnd}.png")
         try:
-            from PIL import ImageGrab
-            
-            # Get window rect
-            rect = ctypes.wintypes.RECT()
-            self._user32.GetWindowRect(hwnd, ctypes.byref(rect))
-            
-            width = rect.right - rect.left
-            height = rect.bottom - rect.top
-            if width <= 0 or height <= 0:
-                return ""
-            
             # Capture
             try:
-                img = ImageGrab.grab(bbox=(rect.left, rect.top, rect.right, rect.bottom))
-                img.save(temp_img)
+                img = self._capture_window(hwnd)
+                if img is None:
+                    return ""
+                
+                # Unchanged window since the last call -> reuse its text
+                width, height = img.size
+                digest = _hash_pixels(img.tobytes())
+                cached = self._ocr_cache.get(hwnd)
+                if cached and cached[:3] == (width, height, digest):
+                    return cached[3]
+                
+                buf = io.BytesIO()
+                img.save(buf, "PNG")
+                png_bytes = buf.getvalue()
+            except ImportError:
+                raise
             except Exception as e:
                 logger.debug(f"Screen capture failed: {e}")
                 return ""
                 
-            # Locate OCR helper
-            # We assume we are in addons/c4n_al_sentinel_addon
-            # Helper is at ../../assets/scripts/ocr_helper.ps1 (relative to base dir)
-            
-            # Use current logic to find OCR tool from main app assets
-            # Assuming we run from main app context usually
-            base_dir = os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else os.getcwd() # Approximation
-            ocr_exe = os.path.join(base_dir, "ocr.exe")
-            
-            cmd = []
-            if os.path.exists(ocr_exe):
-                 cmd = [ocr_exe, temp_img]
-            else:
-                 ps_script = os.path.join(base_dir, "assets", "scripts", "ocr_helper.ps1")
-                 if not os.path.exists(ps_script):
-                      # Try fallback relative logic if cwd is different
-                      ps_script = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../assets/scripts/ocr_helper.ps1"))
-                 
-                 if os.path.exists(ps_script):
-                     cmd = ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-File", ps_script, temp_img]
-                 else:
-                     logger.warning("Sentinel: OCR helper script not found.")
-                     return ""
-            
-            # Run
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5, creationflags=subprocess.CREATE_NO_WINDOW)
-            return result.stdout.strip()
+            text = self._ocr_request(png_bytes)
+            self._ocr_cache[hwnd] = (width, height, digest, text)
+            return text
 
         except ImportError:
             logger.warning("Sentinel: Pillow not installed.")
@@ -202,112 +627,240 @@ class SentinelLogic:
         except Exception as e:
             logger.error(f"Sentinel OCR Error: {e}")
             return ""
+
+    def _capture_window(self, hwnd: int):
+        """
+        Capture a window into a PIL Image.
+        Uses PrintWindow into a memory DC so only the window's own pixels are read
+        (works for covered windows); falls back to a desktop grab if the window refuses.
+        """
+        if self._Image is None:
+            from PIL import Image
+            self._Image = Image
+        
+        rect = wintypes.RECT()
+        self._user32.GetWindowRect(hwnd, ctypes.byref(rect))
+        width = rect.right - rect.left
+        height = rect.bottom - rect.top
+        if width <= 0 or height <= 0:
+            return None
+        
+        window_dc = _user32.GetWindowDC(hwnd)
+        if not window_dc:
+            return None
+        mem_dc = _gdi32.CreateCompatibleDC(window_dc)
+        bitmap = _gdi32.CreateCompatibleBitmap(window_dc, width, height)
+        old_obj = _gdi32.SelectObject(mem_dc, bitmap)
+        try:
+            if not _user32.PrintWindow(hwnd, mem_dc, PW_RENDERFULLCONTENT):
+                if self._ImageGrab is None:
+                    from PIL import ImageGrab
+                    self._ImageGrab = ImageGrab
+                return self._ImageGrab.grab(bbox=(rect.left, rect.top, rect.right, rect.bottom))
+            
+            bmi = BITMAPINFOHEADER()
+            bmi.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+            bmi.biWidth = width
+            bmi.biHeight = -height  # Top-down rows
+            bmi.biPlanes = 1
+            bmi.biBitCount = 32
+            bmi.biCompression = BI_RGB
+            
+            pixels = ctypes.create_string_buffer(width * height * 4)
+            if not _gdi32.GetDIBits(mem_dc, bitmap, 0, height, pixels, ctypes.byref(bmi), DIB_RGB_COLORS):
+                return None
         finally:
-            if os.path.exists(temp_img):
+            _gdi32.SelectObject(mem_dc, old_obj)
+            _gdi32.DeleteObject(bitmap)
+            _gdi32.DeleteDC(mem_dc)
+            _user32.ReleaseDC(hwnd, window_dc)
+        
+        # GDI leaves the alpha byte undefined, so read it as padding
+        return self._Image.frombuffer("RGB", (width, height), pixels, "raw", "BGRX", 0, 1)
+
+    def _get_ocr_command(self) -> List[str]:
+        """
+        Locate the OCR helper and return the command line that starts it in serve mode.
+        Prefers the compiled ocr.exe, falls back to assets/scripts/ocr_helper.ps1.
+        """
+        # Use current logic to find OCR tool from main app assets
+        # Assuming we run from main app context usually
+        base_dir = os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else os.getcwd() # Approximation
+        ocr_exe = os.path.join(base_dir, "ocr.exe")
+        if os.path.exists(ocr_exe):
+            return [ocr_exe, "--serve"]
+        
+        ps_script = os.path.join(base_dir, "assets", "scripts", "ocr_helper.ps1")
+        if not os.path.exists(ps_script):
+            # Try fallback relative logic if cwd is different
+            ps_script = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../assets/scripts/ocr_helper.ps1"))
+        
+        if os.path.exists(ps_script):
+            return ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-File", ps_script, "-Serve"]
+        return []
+
+    def _ensure_ocr_worker(self) -> Optional[subprocess.Popen]:
+        """Start the OCR worker if it is not running. Caller must hold _ocr_lock."""
+        proc = self._ocr_proc
+        if proc is not None and proc.poll() is None:
+            return proc
+        
+        cmd = self._get_ocr_command()
+        if not cmd:
+            logger.warning("Sentinel: OCR helper script not found.")
+            return None
+        
+        self._ocr_proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+        logger.debug(f"Sentinel: OCR worker started (PID: {self._ocr_proc.pid})")
+        return self._ocr_proc
+
+    def _stop_ocr_worker(self):
+        """Terminate the OCR worker. Caller must hold _ocr_lock."""
+        proc, self._ocr_proc = self._ocr_proc, None
+        if proc is None:
+            return
+        try:
+            if proc.poll() is None:
+                proc.stdin.write(struct.pack("<I", 0))  # Zero-length frame = exit
+                proc.stdin.close()
+                proc.wait(timeout=1)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            proc.kill()
+
+    def _ocr_request(self, png_bytes: bytes) -> str:
+        """
+        Send one PNG frame to the OCR worker and return the recognized text.
+        A watchdog kills a hung worker after OCR_TIMEOUT seconds; a dead worker
+        is respawned once per request.
+        """
+        frame = struct.pack("<I", len(png_bytes)) + png_bytes
+        
+        with self._ocr_lock:
+            for _ in range(2):
+                proc = self._ensure_ocr_worker()
+                if proc is None:
+                    return ""
+                
+                watchdog = threading.Timer(OCR_TIMEOUT, proc.kill)
+                watchdog.start()
                 try:
-                    os.remove(temp_img)
-                except:
-                    pass
+                    proc.stdin.write(frame)
+                    proc.stdin.flush()
+                    
+                    lines = []
+                    while True:
+                        raw = proc.stdout.readline()
+                        if not raw:
+                            raise EOFError("OCR worker closed its output")
+                        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+                        if line == OCR_END_MARKER:
+                            return "\n".join(lines).strip()
+                        lines.append(line)
+                except (OSError, ValueError, EOFError) as e:
+                    logger.debug(f"Sentinel: OCR worker failed ({e}), restarting")
+                    self._stop_ocr_worker()
+                finally:
+                    watchdog.cancel()
+        return ""
+
+    def shutdown(self):
+        """Release long-lived resources (OCR worker, UIA probe pool)."""
+        with self._ocr_lock:
+            self._stop_ocr_worker()
+        with self._uia_pool_lock:
+            pool, self._uia_pool = self._uia_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     # --- Interaction ---
 
-    def find_confirmation_dialog(self, pids: List[Optional[int]], keywords: List[str]) -> bool:
-        """Check for confirmation dialogs."""
-        if not keywords: return False
+    def _send_enter(self) -> bool:
+        """Press and release Enter with a single SendInput call."""
+        inputs = (INPUT * 2)()
+        for inp, flags in zip(inputs, (0, KEYEVENTF_KEYUP)):
+            inp.type = INPUT_KEYBOARD
+            inp.ki.wVk = VK_RETURN
+            inp.ki.dwFlags = flags
+        return _user32.SendInput(2, inputs, ctypes.sizeof(INPUT)) == 2
+
+    def find_confirmation_dialog(self, pids: List[Optional[int]], keywords: List[str]) -> Optional[int]:
+        """Check for confirmation dialogs. Returns the HWND of the dialog window, or None."""
+        if not keywords: return None
         
         # Similar logic to original but properly implemented using get_window_titles_and_pids
         try:
              win_info = self.get_window_titles_and_pids()
              candidate_hwnds = []
-             tracked_pids = [p for p in pids if p is not None]
+             pid_set = frozenset(p for p in pids if p is not None)
+             matcher = self.get_matcher(keywords)
              
              for title, pid, hwnd in win_info:
-                 if pid in tracked_pids:
+                 if pid in pid_set:
                      candidate_hwnds.append(hwnd)
                      continue
                  
                  # Check title against keywords
-                 t_lower = title.lower()
-                 for kw in keywords:
-                     if kw.lower() in t_lower:
-                         candidate_hwnds.append(hwnd)
-                         break
+                 if matcher.find(title):
+                     candidate_hwnds.append(hwnd)
              
              # Fallback: check top windows if no candidates and None is in pids (global search)
              if None in pids and not candidate_hwnds:
                  candidate_hwnds = [hwnd for t, p, hwnd in win_info[:10]]
                  
-             from pywinauto import Application
-             
-             for hwnd in candidate_hwnds:
-                 try:
-                     app = Application(backend="uia").connect(handle=hwnd, timeout=1)
-                     win = app.window(handle=hwnd)
-                     descendants = win.descendants()
-                     for i, child in enumerate(descendants):
-                         if i > 50: break
-                         try:
-                             text = child.window_text()
-                             if text:
-                                 text_lower = text.lower()
-                                 for kw in keywords:
-                                     if kw.lower() in text_lower:
-                                         logger.info(f"Sentinel: Dialog detected ('{kw}' in '{text}')")
-                                         return True
-                         except: continue
-                 except: continue
+             hit = self._probe_windows(candidate_hwnds, matcher)
+             if hit:
+                 hwnd, kw, text = hit
+                 logger.info(f"Sentinel: Dialog detected ('{kw}' in '{text}')")
+                 return hwnd
         except ImportError:
             pass
-        return False
+        return None
 
-    def click_confirmation_button(self, pids: List[Optional[int]], button_labels: List[str]) -> bool:
-        """Find and click button."""
-        if not button_labels: return False
+    def click_confirmation_button(self, hwnd: int, button_labels: List[str]) -> bool:
+        """Find and click a button in the dialog window `hwnd` (see find_confirmation_dialog)."""
+        if not hwnd or not button_labels: return False
         
         try:
-             win_info = self.get_window_titles_and_pids()
-             candidate_hwnds = []
-             tracked_pids = [p for p in pids if p is not None]
+             # Label -> priority (earlier labels win when several buttons match)
+             label_rank = {}
+             for i, label in enumerate(button_labels):
+                 label_rank.setdefault(label.strip().lower(), i)
              
-             for title, pid, hwnd in win_info:
-                 if pid in tracked_pids:
-                     candidate_hwnds.append(hwnd)
-                 else:
-                     t_lower = title.lower()
-                     if any(kw in t_lower for kw in ["notice", "update", "patch", "launcher"]):
-                         candidate_hwnds.append(hwnd)
-             
-             from pywinauto import Application
-             
-             for hwnd in candidate_hwnds:
-                 try:
-                     app = Application(backend="uia").connect(handle=hwnd, timeout=1)
-                     win = app.window(handle=hwnd)
-                     win_title = win.window_text()
-                     
-                     for label in button_labels:
-                         # 1. Exact match Button
-                         try:
-                             btn = win.child_window(title=label, control_type="Button")
-                             if btn.exists(timeout=0.2):
-                                 logger.info(f"Sentinel: Clicking '{label}' in '{win_title}'")
-                                 btn.click_input()
-                                 return True
-                         except: pass
-                         
-                         # 2. Regex
-                         try:
-                             btn = win.child_window(title_re=f"(?i)^{label}$", control_type="Button")
-                             if btn.exists(timeout=0.2):
-                                 logger.info(f"Sentinel: Clicking '{label}' (regex) in '{win_title}'")
-                                 btn.click_input()
-                                 return True
-                         except: pass
-                 except: continue
+             try:
+                 win = self._get_uia_window(hwnd)
+                 
+                 # One tree walk collects every button; labels are matched in memory
+                 best, best_rank = None, len(button_labels)
+                 for btn in win.descendants(control_type="Button"):
+                     try:
+                         text = btn.window_text().replace("&", "").strip()
+                     except Exception:
+                         continue
+                     rank = label_rank.get(text.lower())
+                     if rank is not None and rank < best_rank:
+                         best, best_rank = (btn, text), rank
+                 
+                 # Whole label only (case-insensitive): "Restart" must never hit "Don't Restart"
+                 if best:
+                     btn, text = best
+                     logger.info(f"Sentinel: Clicking '{text}' in '{self._window_title(hwnd)}'")
+                     btn.click_input()
+                     return True
+             except Exception:
+                 pass
             
-             # Fallback Enter
-             import pyautogui
-             pyautogui.press('enter')
-             return True
-        except:
+             # Fallback Enter - only into the dialog window, never a random foreground app
+             if not CONFIRMATION_ENTER_FALLBACK:
+                 return False
+             if self._user32.GetForegroundWindow() != hwnd:
+                 return False
+             logger.info("Sentinel: No button matched, sending Enter to foreground dialog")
+             return self._send_enter()
+        except Exception:
              return False
@@ -3,11 +3,14 @@ Sentinel Addon
 Main implementation of the Sentinel Addon.
 """
 
+import heapq
+import itertools
+import logging
 import threading
 import time
-import psutil
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import QObject, pyqtSignal
@@ -18,11 +21,87 @@ from config import STUCK_DETECTION_KEYWORDS, STUCK_DETECTION_OCR_KEYWORDS, CONFI
 # TODO: Future Refactor - Move these keywords to per-addon configuration or per-game settings
 # instead of global config.py constants to support dynamic game definitions.
 
-from .logic import SentinelLogic
+from .logic import (
+    SentinelLogic, init_com_thread, uninit_com_thread,
+    open_process_handle, process_alive, close_process_handle
+)
 from .indicator import SentinelIndicator
+from .keyword_matcher import KeywordMatcher
 
 logger = get_logger(__name__)
 
+# Matchers for the global detection keywords, built once at import
+STUCK_TITLE_MATCHER = KeywordMatcher(STUCK_DETECTION_KEYWORDS)
+STUCK_CONTENT_MATCHER = KeywordMatcher(STUCK_DETECTION_OCR_KEYWORDS)
+CONFIRMATION_DIALOG_MATCHER = KeywordMatcher(CONFIRMATION_DIALOG_KEYWORDS)
+
+# Title keywords of potential games or known launchers for the visual clicker.
+# This avoids scanning every single window on the desktop.
+VISUAL_CANDIDATE_MATCHER = KeywordMatcher(
+    ("Wuthering", "Genshin", "Star Rail", "Launcher", "Client", "Fotoanzeige", "Screenshot")
+)
+# How long the visual clicker reuses its candidate window list before re-enumerating
+VISUAL_WINDOW_CACHE_TTL = 10.0  # seconds
+
+# Monitor cadence (all tasks share one ticker thread)
+MONITOR_TICK_INTERVAL = 2.0  # seconds between checks of one task
+MONITOR_DURATION = 120       # 2 minutes (User Requested Watchdog limit)
+CONTENT_CHECK_INTERVAL = 20.0  # seconds between window content (UIA) scans of one task
+DIALOG_CHECK_INTERVAL = 4.0    # seconds between confirmation dialog scans of one task
+CHILD_SCAN_INTERVAL = 4.0      # seconds between process-table scans for new child processes
+
+
+def _ppid_map() -> Dict[int, int]:
+    """Return {pid: parent_pid} for every running process in a single snapshot."""
+    import psutil # Deferred: only needed once a task is monitored
+    try:
+        return psutil._psplatform.ppid_map()
+    except (AttributeError, OSError, psutil.Error):
+        # Private API missing on this platform/psutil version
+        return {p.pid: p.info['ppid'] for p in psutil.process_iter(['ppid'])}
+
+
+def _living_descendants(roots: Set[int], known: Optional[Dict[int, bool]] = None) -> Set[int]:
+    """
+    Return the running PIDs among `roots` plus all of their running descendants.
+    `known` maps PIDs whose liveness is already established; other roots are
+    looked up in the process snapshot.
+    """
+    ppid = _ppid_map()
+    children_of: Dict[int, List[int]] = {}
+    for pid, parent in ppid.items():
+        if pid != parent:  # PID 0 is its own parent on Windows
+            children_of.setdefault(parent, []).append(pid)
+    
+    known = known or {}
+    alive = {pid for pid in roots if known.get(pid, pid in ppid)}
+    stack = list(alive)
+    while stack:
+        for child in children_of.get(stack.pop(), ()):
+            if child not in alive:
+                alive.add(child)
+                stack.append(child)
+    return alive
+
+@dataclass
+class TaskState:
+    """Sentinel bookkeeping for one task."""
+    task_id: int
+    task_name: str = "Unknown"
+    task_data: Dict = field(default_factory=dict)
+    process: Any = None
+    running: bool = False      # Monitor active
+    retries: int = 0           # Restarts issued for this task (kept across restarts)
+    dialog_persist: int = 0    # Consecutive dialog sightings without a successful click
+    tracked_pids: Set[int] = field(default_factory=set)
+    handles: Dict[int, int] = field(default_factory=dict) # pid -> SYNCHRONIZE handle (ticker thread only)
+    start_time: float = 0.0    # time.monotonic() when monitoring started
+    next_content_at: float = 0.0  # time.monotonic() of the next content (UIA) scan
+    next_dialog_at: float = 0.0   # time.monotonic() of the next dialog scan
+    next_child_scan_at: float = 0.0  # time.monotonic() of the next child-process scan
+    due: float = 0.0           # time.monotonic() of the next tick
+
+
 class SentinelAddon(IAutolauncherAddon):
     """
     Sentinel Addon: Watches for stuck updates/installers and auto-resolves them.
@@ -42,30 +121,69 @@ class SentinelAddon(IAutolauncherAddon):
         super().__init__(manager)
         self.logic = SentinelLogic()
         self.indicator = SentinelIndicator()
+        self._indicator_state = (False, "") # Last (active, task_name) sent to the indicator
+        self._indicator_lock = threading.Lock()
         
-        # Monitor State
-        self.active_monitors: Dict[int, bool] = {} # task_id -> is_running
-        self.retry_counts: Dict[int, int] = {} # task_id -> retries
-        self.dialog_persistence: Dict[int, int] = {} # task_id -> persistence_count
+        # Monitor State (guarded by _tick_lock)
+        self.tasks: Dict[int, TaskState] = {} # task_id -> state
+        self._active_count = 0 # Number of states with running=True
+
+        # Shared monitor ticker: min-heap of (due, seq, state), one entry per running state;
+        # entries of stopped states are dropped when they reach the top
+        self._tick_heap: List[Tuple[float, int, TaskState]] = []
+        self._tick_seq = itertools.count()
+        self._tick_lock = threading.Lock()
+        self._tick_wakeup = threading.Event()
+        self._ticker_thread: Optional[threading.Thread] = None
 
         # Visual Detection State
         self.detector = None
         self._visual_scanning_deadline = 0.0
         self._is_visual_scanning = False
+        self._visual_stop = threading.Event() # Set to interrupt the visual loop's waits
         self._visual_thread = None
         self.last_visual_fix_time = 0.0 # Timestamp of last successful visual click
+        self._hwnd_cache: List[Tuple[int, str]] = [] # (hwnd, title) of candidate windows
+        self._hwnd_cache_deadline = 0.0
         
-        # Use simple try-import for optional dependencies
-        try:
-            from .visual_detector import VisualDetector
-            self.VisualDetectorClass = VisualDetector
-        except ImportError as e:
-            self.VisualDetectorClass = None
-            logger.warning(f"Sentinel: VisualDetector dependencies not found. Visual features disabled. Error: {e}")
+        # Optional visual dependencies (OpenCV/NumPy/pywin32) are imported on first task start
+        self._visual_detector_class = None
+        self._visual_import_tried = False
+
+    @property
+    def VisualDetectorClass(self):
+        """VisualDetector class, or None if its dependencies are missing (imported on first use)."""
+        if not self._visual_import_tried:
+            self._visual_import_tried = True
+            # Use simple try-import for optional dependencies
+            try:
+                from .visual_detector import VisualDetector
+                self._visual_detector_class = VisualDetector
+            except ImportError as e:
+                logger.warning(f"Sentinel: VisualDetector dependencies not found. Visual features disabled. Error: {e}")
+        return self._visual_detector_class
 
     def get_indicator_widget(self) -> Optional[QWidget]:
         return self.indicator
 
+    def _set_indicator(self, active: bool, task_name: str = ""):
+        """Update the indicator only when its state actually changes."""
+        state = (active, task_name if active else "")
+        with self._indicator_lock:
+            if state == self._indicator_state:
+                return
+            self._indicator_state = state
+            self.indicator.set_active(active, task_name)
+
+    def on_disable(self):
+        """Release background helpers (UIA probe pool, OCR worker) while disabled."""
+        super().on_disable()
+        self.logic.shutdown()
+
+    def on_app_shutdown(self):
+        """Stop background helpers (UIA probe pool, OCR worker)."""
+        self.logic.shutdown()
+
     def on_task_start(self, task_data: Dict, process: Any):
         """Called when a task starts. We verify if monitoring is needed."""
         task_id = task_data.get('id')
@@ -78,20 +196,41 @@ class SentinelAddon(IAutolauncherAddon):
 
         pid = process.pid
         
-        # Start monitoring in a separate thread
-        self.active_monitors[task_id] = True
-        
         # Show indicator
-        self.indicator.set_active(True, task_name)
+        self._set_indicator(True, task_name)
         
-        # Start Monitoring
-        thread = threading.Thread(
-            target=self._monitor_loop,
-            args=(task_id, task_name, pid, task_data, process),
-            daemon=True,
-            name=f"SentinelMonitor-{task_id}"
+        # Start Monitoring (first check after the initial wait)
+        now = time.monotonic()
+        state = TaskState(
+            task_id=task_id,
+            task_name=task_name,
+            task_data=task_data,
+            process=process,
+            running=True,
+            start_time=now,
+            due=now + MONITOR_TICK_INTERVAL,
         )
-        thread.start()
+        self._track_pids(state, {pid})
+        with self._tick_lock:
+            previous = self.tasks.get(task_id)
+            if previous is not None:
+                # Restart of a known task: keep its counters
+                state.retries = previous.retries
+                state.dialog_persist = previous.dialog_persist
+                if previous.running:
+                    previous.running = False # Superseded; its heap entries are skipped
+                    self._active_count -= 1
+            self.tasks[task_id] = state
+            self._active_count += 1
+            heapq.heappush(self._tick_heap, (state.due, next(self._tick_seq), state))
+            if self._ticker_thread is None:
+                self._ticker_thread = threading.Thread(
+                    target=self._ticker_loop,
+                    daemon=True,
+                    name="SentinelMonitor"
+                )
+                self._ticker_thread.start()
+        self._tick_wakeup.set()
         logger.info(f"Sentinel: Monitoring started for '{task_name}' (PID: {pid})")
 
         # Start Visual Scanner (if supported)
@@ -101,20 +240,25 @@ class SentinelAddon(IAutolauncherAddon):
     def on_task_end(self, task_id: int):
         """Stop monitoring when task ends."""
         self._is_visual_scanning = False # Stop visual too
+        self._visual_stop.set()
         
-        if task_id in self.active_monitors:
-            self.active_monitors[task_id] = False # Flag loop to stop
-            logger.debug(f"Sentinel: Stopping monitor for task ID {task_id}")
+        with self._tick_lock:
+            state = self.tasks.get(task_id)
+            if state is not None and state.running:
+                logger.debug(f"Sentinel: Stopping monitor for task ID {task_id}")
+                self._stop_monitor(state) # Its pending tick is skipped by the ticker
+            idle = self._active_count == 0
             
         # Hide indicator if no more active monitors
-        if not any(self.active_monitors.values()):
-            self.indicator.set_active(False)
+        if idle:
+            self._set_indicator(False)
 
     def _start_visual_scan(self, task_name: str):
         """Start the visual scanning loop for 2 minutes."""
         self._visual_scanning_deadline = time.time() + (2 * 60) # 2 minutes
         self._is_visual_scanning = True
-        self.indicator.set_active(True, task_name) # Ensure active
+        self._visual_stop.clear()
+        self._set_indicator(True, task_name) # Ensure active
         
         if not self.detector and self.VisualDetectorClass:
             try:
@@ -140,173 +284,283 @@ class SentinelAddon(IAutolauncherAddon):
             logger.warning(f"Sentinel: Reference image not found at {image_path}")
             return
             
+        template = self.detector.load_template(image_path)
+        if template is None:
+            return
+            
         logger.info("Sentinel: Visual Clicker started.")
 
         try:
             from pywinauto import Desktop
-        except:
+        except ImportError as e:
+            logger.debug(f"Sentinel: pywinauto unavailable, visual clicker disabled: {e}")
             return
 
-        while self._is_visual_scanning:
-            if time.time() > self._visual_scanning_deadline:
-                logger.info("Sentinel: Visual scan timeout.")
-                self._is_visual_scanning = False
-                break
+        # One COM apartment and one Desktop for the whole scan
+        com_initialized = init_com_thread()
+        try:
+            desktop = Desktop(backend="win32")
+            while self._is_visual_scanning:
+                if time.time() > self._visual_scanning_deadline:
+                    logger.info("Sentinel: Visual scan timeout.")
+                    self._is_visual_scanning = False
+                    break
                 
-            try:
-                # Find Candidate Windows (Games/Launchers)
                 try:
-                    windows = Desktop(backend="win32").windows()
-                    for w in windows:
-                        t = w.window_text()
-                        # Simple keyword filtering for potential games or known launchers
-                        # This avoids scanning every single window on the desktop
-                        candidates = ["Wuthering", "Genshin", "Star Rail", "Launcher", "Client", "Fotoanzeige", "Screenshot"]
+                    # Find Candidate Windows (Games/Launchers)
+                    try:
+                        candidates = self._get_visual_candidates()
+                        matches = self.detector.scan_batch([(hwnd, template, 0.8) for hwnd, _ in candidates])
+                        # Act on the first match only: focusing and clicking moves windows, so the
+                        # other matches' coordinates are stale until the next round rescans them
+                        hit = next(((target_hwnd, t, match) for (target_hwnd, t), match
+                                    in zip(candidates, matches) if match), None)
+                        if hit:
+                            target_hwnd, t, match = hit
+                            logger.info(f"Sentinel: Visual match in '{t}'. Focusing and Clicking...")
+                            try:
+                                desktop.window(handle=target_hwnd).set_focus()
+                                time.sleep(0.5)
+                            except Exception as e:
+                                logger.warning(f"Sentinel: Failed to focus window: {e}")
                         
-                        if any(keyword in t for keyword in candidates):
-                            target_hwnd = w.handle
-                            match = self.detector.scan_for_template(target_hwnd, image_path, confidence=0.8)
-                            if match:
-                                logger.info(f"Sentinel: Visual match in '{t}'. Focusing and Clicking...")
-                                try:
-                                    w.set_focus()
-                                    time.sleep(0.5)
-                                except Exception as e:
-                                    logger.warning(f"Sentinel: Failed to focus window: {e}")
-                                
-                                if self.detector.click_at(*match):
-                                    self.last_visual_fix_time = time.time()
-                                    logger.info(f"Sentinel: Click registered. Expecting process restart.")
-                                
-                                time.sleep(2.0)
-                except Exception:
-                    pass
+                            if self.detector.click_at(*match):
+                                self.last_visual_fix_time = time.time()
+                                logger.info(f"Sentinel: Click registered. Expecting process restart.")
+                                # Window set is expected to change after a click
+                                self._hwnd_cache_deadline = 0.0
+                        
+                            self._visual_stop.wait(2.0)
+                    except OSError as e:
+                        # Window vanished or capture failed mid-scan; retry next round
+                        logger.debug(f"Sentinel: Visual scan skipped: {e}")
 
-            except Exception as e:
-                logger.error(f"Sentinel: Visual loop error: {e}")
+                except Exception as e:
+                    logger.error(f"Sentinel: Visual loop error: {e}")
             
-            time.sleep(5.0)
+                self._visual_stop.wait(5.0)
+        finally:
+            if com_initialized:
+                uninit_com_thread()
 
-    def _monitor_loop(self, task_id: int, task_name: str, initial_pid: int, task_data: Dict, process_obj: Any):
+    def _get_visual_candidates(self) -> List[Tuple[int, str]]:
         """
-        Background monitoring loop.
-        Runs for 5 minutes (300s).
+        Return (HWND, Title) of visible windows whose title looks like a game or launcher.
+        The list is kept for VISUAL_WINDOW_CACHE_TTL seconds between scans.
         """
-        start_time = time.time()
-        loop_count = 0
-        duration = 120 # 2 minutes (User Requested Watchdog limit)
-        
-        # Initial wait
-        time.sleep(2)
-        
-        tracked_pids = {initial_pid}
-        
-        while time.time() - start_time < duration:
-            # Check stop flag
-            if not self.active_monitors.get(task_id, False):
-                break
-                
-            # Verify main process is still alive using the object if possible
-            if process_obj.poll() is not None:
-                # Process finished naturally
-                break
-
-            # --- PID Tracking (Spawned Children) ---
-            current_living_pids = []
-            new_children = set()
-            
-            for t_pid in list(tracked_pids):
-                try:
-                    proc = psutil.Process(t_pid)
-                    if proc.is_running():
-                        current_living_pids.append(t_pid)
-                        try:
-                            children = proc.children(recursive=True)
-                            for child in children:
-                                if child.pid not in tracked_pids:
-                                    logger.debug(f"Sentinel: Tracking new child PID {child.pid}")
-                                    new_children.add(child.pid)
-                        except: pass
-                except: pass
+        now = time.monotonic()
+        if now >= self._hwnd_cache_deadline:
+            self._hwnd_cache = [
+                (hwnd, title)
+                for title, _pid, hwnd in self.logic.get_window_titles_and_pids()
+                if VISUAL_CANDIDATE_MATCHER.find(title)
+            ]
+            self._hwnd_cache_deadline = now + VISUAL_WINDOW_CACHE_TTL
+        return self._hwnd_cache
+
+    def _ticker_loop(self):
+        """
+        Single monitor thread for all tasks.
+        Runs each task's check when it is due and exits once no task is monitored.
+        """
+        while True:
+            self._tick_wakeup.clear()
+            with self._tick_lock:
+                if not self._tick_heap:
+                    self._ticker_thread = None
+                    return
+                due, _, state = self._tick_heap[0]
+                if not state.running:
+                    # Stopped or superseded by a restart
+                    heapq.heappop(self._tick_heap)
+                    self._release_handles(state)
+                    continue
+                delay = due - time.monotonic()
+                if delay <= 0:
+                    heapq.heappop(self._tick_heap)
             
-            if new_children:
-                tracked_pids.update(new_children)
-                current_living_pids.extend(list(new_children))
+            if delay > 0:
+                self._tick_wakeup.wait(delay)
+                continue
             
-            if not current_living_pids:
-                # Check if this exit was expected due to a visual fix (Update Restart)
-                if time.time() - self.last_visual_fix_time < 60:
-                    logger.info(f"Sentinel: Process finished after visual fix. Triggering restart for '{task_name}'.")
-                    time.sleep(5) # Allow meaningful exit
-                    self._handle_stuck_task(task_id, task_name, task_data)
-                    return
-
-                logger.debug(f"Sentinel: All tracked processes finished for '{task_name}'.")
-                break
+            try:
+                keep_going = self._tick(state)
+            except Exception as e:
+                logger.error(f"Sentinel: Monitor error for '{state.task_name}': {e}")
+                keep_going = False
             
-            pids_to_check = current_living_pids
+            with self._tick_lock:
+                if state.running and keep_going:
+                    state.due = time.monotonic() + MONITOR_TICK_INTERVAL
+                    heapq.heappush(self._tick_heap, (state.due, next(self._tick_seq), state))
+                    continue
+                self._release_handles(state)
+                if not state.running:
+                    continue # Stopped or restarted meanwhile
+                self._stop_monitor(state)
+                idle = self._active_count == 0
             
-            # --- Detection Logic ---
-            stuck_reason = None
+            # Determine if we should hide indicator
+            if idle:
+                self._set_indicator(False)
+
+    def _tick(self, state: TaskState) -> bool:
+        """
+        One monitoring pass for one task.
+        Returns True to keep monitoring, False once the task needs no more checks.
+        """
+        task_id = state.task_id
+        task_name = state.task_name
+        task_data = state.task_data
+        tracked_pids = state.tracked_pids
+        
+        # Watchdog limit
+        if time.monotonic() - state.start_time >= MONITOR_DURATION:
+            return False
             
-            # 1. Window Titles
-            stuck_title = self.logic.is_process_stuck(pids_to_check, STUCK_DETECTION_KEYWORDS)
-            if stuck_title:
-                stuck_reason = f"Window Title: {stuck_title}"
+        # Verify main process is still alive using the object if possible
+        if state.process.poll() is not None:
+            # Process finished naturally
+            return False
+
+        # --- PID Tracking (Spawned Children) ---
+        # Tracked PIDs are checked through their held handles every tick; the
+        # process-table snapshot that finds new descendants runs less often
+        handles = state.handles
+        known = {pid: process_alive(handle) for pid, handle in handles.items()}
+        for pid, is_alive in known.items():
+            if not is_alive:
+                # Exited for good; forget it so a reused PID is not mistaken for it
+                close_process_handle(handles.pop(pid))
+                tracked_pids.discard(pid)
+        
+        now = time.monotonic()
+        if now >= state.next_child_scan_at:
+            state.next_child_scan_at = now + CHILD_SCAN_INTERVAL
+            # PIDs without a handle (access denied) fall back to the snapshot
+            current_living_pids = _living_descendants(tracked_pids, known)
+            tracked_pids.intersection_update(current_living_pids)
+            new_children = current_living_pids.difference(tracked_pids)
             
-            # 2. OCR (periodic)
-            if not stuck_reason and loop_count % 10 == 0:
-                if self.logic.check_window_content(pids_to_check, STUCK_DETECTION_OCR_KEYWORDS):
-                    stuck_reason = "Window Content (UIA)"
-                elif self.logic.check_window_content_ocr(list(tracked_pids)[0]): # Check one window effectively
-                     # TODO: Logic check_window_content_ocr implementation above only took HWND, need to iterate
-                     # Actually logic.py impl takes HWND. We need internal helper here?
-                     # Let's just trust logic.check_window_content for now as primary.
-                     pass 
-
-            # --- Action: Stuck Detected -> Restart ---
-            if stuck_reason:
-                logger.warning(f"Sentinel: Task '{task_name}' STUCK on {stuck_reason}")
-                self._handle_stuck_task(task_id, task_name, task_data)
-                return # End thread
-
-            # --- Action: Confirmation Dialog -> Click ---
-            if loop_count % 2 == 0:
-                # TODO: Future Refactor - Abstract this dialog detection. 
-                # Currently relies on global CONFIRMATION_DIALOG_KEYWORDS which are tailored for specific games (e.g. WuWa).
-                # Should be configurable per task/addon.
-                if self.logic.find_confirmation_dialog(pids_to_check, CONFIRMATION_DIALOG_KEYWORDS):
-                    logger.info(f"Sentinel: Confirmation dialog found for '{task_name}'")
-                    
-                    self.dialog_persistence[task_id] = self.dialog_persistence.get(task_id, 0) + 1
+            if new_children:
+                if logger.isEnabledFor(logging.DEBUG):
+                    for child_pid in new_children:
+                        info = self.logic.probe(child_pid) or {}
+                        logger.debug(f"Sentinel: Tracking new child PID {child_pid} ({info.get('name', '?')})")
+                self._track_pids(state, new_children)
+        else:
+            # Between scans: dead handle-backed PIDs were dropped above, the rest
+            # keep the state of the last scan
+            current_living_pids = set(tracked_pids)
+        
+        current_living_pids = list(current_living_pids)
+        
+        if not current_living_pids:
+            # Check if this exit was expected due to a visual fix (Update Restart)
+            if time.time() - self.last_visual_fix_time < 60:
+                logger.info(f"Sentinel: Process finished after visual fix. Triggering restart for '{task_name}'.")
+                # Allow meaningful exit; restart off the ticker thread so other tasks keep being checked
+                self._run_in_background(self._handle_stuck_task, task_id, task_name, task_data, delay=5)
+                return False
+
+            logger.debug(f"Sentinel: All tracked processes finished for '{task_name}'.")
+            return False
+        
+        pids_to_check = current_living_pids
+        
+        # --- Detection Logic ---
+        # One pass over the task's windows: titles every tick, content (UIA) and
+        # confirmation dialogs whenever their own interval has elapsed
+        now = time.monotonic()
+        check_content = now >= state.next_content_at
+        if check_content:
+            state.next_content_at = now + CONTENT_CHECK_INTERVAL
+        check_dialog = now >= state.next_dialog_at
+        if check_dialog:
+            state.next_dialog_at = now + DIALOG_CHECK_INTERVAL
+        
+        probe = self.logic.probe_task(
+            pids_to_check,
+            STUCK_TITLE_MATCHER,
+            content_keywords=STUCK_CONTENT_MATCHER if check_content else None,
+            dialog_keywords=CONFIRMATION_DIALOG_MATCHER if check_dialog else None
+        )
+        
+        stuck_reason = None
+        if probe.stuck_title:
+            stuck_reason = f"Window Title: {probe.stuck_title}"
+        elif probe.content_hit:
+            stuck_reason = "Window Content (UIA)"
+        elif check_content:
+            # OCR fallback for windows whose text UIA cannot read (e.g. game-rendered UIs)
+            for hwnd in probe.hwnds:
+                keyword = STUCK_CONTENT_MATCHER.find(self.logic.check_window_content_ocr(hwnd))
+                if keyword:
+                    stuck_reason = f"Window Content (OCR): {keyword}"
+                    break
+
+        # --- Action: Stuck Detected -> Restart ---
+        if stuck_reason:
+            logger.warning(f"Sentinel: Task '{task_name}' STUCK on {stuck_reason}")
+            self._run_in_background(self._handle_stuck_task, task_id, task_name, task_data)
+            return False
+
+        # --- Action: Confirmation Dialog -> Click ---
+        if check_dialog:
+            # TODO: Future Refactor - Abstract this dialog detection. 
+            # Currently relies on global CONFIRMATION_DIALOG_KEYWORDS which are tailored for specific games (e.g. WuWa).
+            # Should be configurable per task/addon.
+            if probe.dialog_hwnd:
+                logger.info(f"Sentinel: Confirmation dialog found for '{task_name}'")
+                
+                state.dialog_persist += 1
+                
+                # Try Click
+                if self.logic.click_confirmation_button(probe.dialog_hwnd, CONFIRMATION_BUTTON_LABELS):
+                    logger.info(f"Sentinel: Successfully clicked button for '{task_name}'")
+                    state.dialog_persist = 0
                     
-                    # Try Click
-                    if self.logic.click_confirmation_button(pids_to_check + [None], CONFIRMATION_BUTTON_LABELS):
-                        logger.info(f"Sentinel: Successfully clicked button for '{task_name}'")
-                        self.dialog_persistence[task_id] = 0
-                        
-                        # Assuming update/patch complete -> Schedule Restart
-                        self._schedule_restart(task_id, task_name, task_data)
-                        return
-                    else:
-                        # Failed to click
-                        if self.dialog_persistence[task_id] >= 3:
-                             logger.error(f"Sentinel: Persistent unclickable dialog for '{task_name}'. Forcing restart.")
-                             self._handle_stuck_task(task_id, task_name, task_data)
-                             return
+                    # Assuming update/patch complete -> Schedule Restart
+                    self._schedule_restart(task_id, task_name, task_data)
+                    return False
                 else:
-                    self.dialog_persistence[task_id] = 0
+                    # Failed to click
+                    if state.dialog_persist >= 3:
+                         logger.error(f"Sentinel: Persistent unclickable dialog for '{task_name}'. Forcing restart.")
+                         self._run_in_background(self._handle_stuck_task, task_id, task_name, task_data)
+                         return False
+            else:
+                state.dialog_persist = 0
 
-            time.sleep(2)
-            loop_count += 1
-            
-        # Cleanup
-        if task_id in self.active_monitors:
-            del self.active_monitors[task_id]
-        
-        # Determine if we should hide indicator
-        if not any(self.active_monitors.values()):
-            self.indicator.set_active(False)
+        return True
+
+    def _track_pids(self, state: TaskState, pids: Set[int]):
+        """Add PIDs to a task and hold a wait handle for each (ticker thread, or before the state is queued)."""
+        for pid in pids:
+            handle = open_process_handle(pid)
+            if handle is not None:
+                state.handles[pid] = handle
+        state.tracked_pids.update(pids)
+
+    def _release_handles(self, state: TaskState):
+        """Close every process handle held for a task (ticker thread only)."""
+        handles, state.handles = state.handles, {}
+        for handle in handles.values():
+            close_process_handle(handle)
+
+    def _stop_monitor(self, state: TaskState):
+        """Mark a monitor as finished. Caller holds _tick_lock."""
+        if state.running:
+            state.running = False
+            self._active_count -= 1
+
+    def _run_in_background(self, func, *args, delay: float = 0):
+        """Run a blocking action (stop/restart) on its own thread so the ticker is not held up."""
+        def runner():
+            if delay:
+                time.sleep(delay)
+            func(*args)
+        threading.Thread(target=runner, daemon=True, name="SentinelAction").start()
 
     def _handle_stuck_task(self, task_id, task_name, task_data):
         """Stop and restart the stuck task."""
@@ -317,15 +571,17 @@ class SentinelAddon(IAutolauncherAddon):
         
         time.sleep(5)
         
-        # 2. Retry
-        retries = self.retry_counts.get(task_id, 0)
-        if retries < 3:
-            self.retry_counts[task_id] = retries + 1
-            logger.info(f"Sentinel: Restarting task '{task_name}' (Retry {retries + 1}/3)")
+        # 2. Retry (count under the lock; restart outside it, the start hook takes it too)
+        with self._tick_lock:
+            state = self.tasks.setdefault(task_id, TaskState(task_id, task_name, task_data))
+            retry = state.retries < 3
+            state.retries = state.retries + 1 if retry else 0
+            retries = state.retries
+        if retry:
+            logger.info(f"Sentinel: Restarting task '{task_name}' (Retry {retries}/3)")
             scheduler.execute_immediately(task_data)
         else:
             logger.error(f"Sentinel: Task '{task_name}' stuck repeatedly. Giving up.")
-            self.retry_counts[task_id] = 0
 
     def _schedule_restart(self, task_id, task_name, task_data):
         """Schedule a restart after a successful update click."""
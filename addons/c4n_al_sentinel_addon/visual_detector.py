@@ -2,21 +2,291 @@
 import logging
 import cv2
 import numpy as np
-import mss
+
+try:
+    import xxhash
+    _hash_pixels = xxhash.xxh3_64_intdigest
+except ImportError:
+    import zlib
+    _hash_pixels = zlib.crc32
 import win32gui
-import win32con
-import win32api
-import win32con
-import win32api
 import ctypes
+from ctypes import wintypes
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
-class VisualDetector:
+# Coarse-to-fine template matching
+PYRAMID_MAX_LEVELS = 2        # Each level halves both image dimensions
+PYRAMID_MIN_TEMPLATE = 12     # Smallest template side (px) worth matching at a coarse level
+PYRAMID_COARSE_SLACK = 0.15   # Coarse peaks are refined down to (confidence - slack)
+PYRAMID_MAX_CANDIDATES = 5    # Coarse peaks refined at full resolution per scan
+LAST_HIT_MARGIN = 8           # Slack (px) around the previous match location re-tested first
+MAX_MATCHES = 32              # Upper bound on occurrences returned by scan_for_template_all
+FRAME_HASH_SCALE = 0.125      # Captures are hashed at this scale to detect unchanged frames
+
+# Cheap grayscale pre-check that rejects most scans before the colour match
+PRECHECK_SCALE = 0.125        # Downscale factor of the pre-check
+PRECHECK_MIN_TEMPLATE = 8     # Smallest template side (px) at pre-check scale
+PRECHECK_SLACK = 0.2          # Pre-check passes at (confidence - slack)
+
+# Run full-frame matches through OpenCL (cv2.UMat) when a device is available
+USE_OPENCL = cv2.ocl.haveOpenCL()
+if USE_OPENCL:
+    cv2.ocl.setUseOpenCL(True)
+
+# A click is aborted if the user produced any input this recently
+USER_ACTIVE_WINDOW_MS = 100
+
+
+INPUT_MOUSE = 0
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+SRCCOPY = 0x00CC0020
+CAPTUREBLT = 0x40000000
+BI_RGB = 0
+DIB_RGB_COLORS = 0
+
+
+class LASTINPUTINFO(ctypes.Structure):
+    _fields_ = [("cbSize", wintypes.UINT),
+                ("dwTime", wintypes.DWORD)]
+
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [("biSize", wintypes.DWORD),
+                ("biWidth", wintypes.LONG),
+                ("biHeight", wintypes.LONG),
+                ("biPlanes", wintypes.WORD),
+                ("biBitCount", wintypes.WORD),
+                ("biCompression", wintypes.DWORD),
+                ("biSizeImage", wintypes.DWORD),
+                ("biXPelsPerMeter", wintypes.LONG),
+                ("biYPelsPerMeter", wintypes.LONG),
+                ("biClrUsed", wintypes.DWORD),
+                ("biClrImportant", wintypes.DWORD)]
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", wintypes.LONG),
+                ("dy", wintypes.LONG),
+                ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t)]
+
+
+class INPUT(ctypes.Structure):
+    # MOUSEINPUT is the largest member of the Win32 INPUT union, so the size matches
+    _fields_ = [("type", wintypes.DWORD),
+                ("mi", MOUSEINPUT)]
+
+
+# Private DLL handles so the prototypes below don't leak onto ctypes.windll users elsewhere.
+_user32 = ctypes.WinDLL("user32")
+_gdi32 = ctypes.WinDLL("gdi32")
+_kernel32 = ctypes.WinDLL("kernel32")
+_user32.GetWindowDC.argtypes = [wintypes.HWND]
+_user32.GetWindowDC.restype = wintypes.HDC
+_user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+_gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+_gdi32.CreateCompatibleDC.restype = wintypes.HDC
+_gdi32.CreateDIBSection.argtypes = [wintypes.HDC, ctypes.POINTER(BITMAPINFOHEADER), wintypes.UINT,
+                                    ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD]
+_gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+_gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+_gdi32.SelectObject.restype = wintypes.HGDIOBJ
+_gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+_gdi32.DeleteDC.argtypes = [wintypes.HDC]
+_gdi32.BitBlt.argtypes = [wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                          wintypes.HDC, ctypes.c_int, ctypes.c_int, wintypes.DWORD]
+_gdi32.BitBlt.restype = wintypes.BOOL
+_gdi32.GdiFlush.restype = wintypes.BOOL
+_user32.GetLastInputInfo.argtypes = [ctypes.POINTER(LASTINPUTINFO)]
+_user32.GetLastInputInfo.restype = wintypes.BOOL
+_kernel32.GetTickCount.restype = wintypes.DWORD
+_user32.SetCursorPos.argtypes = [ctypes.c_int, ctypes.c_int]
+_user32.SetCursorPos.restype = wintypes.BOOL
+_user32.SendInput.argtypes = [wintypes.UINT, ctypes.c_void_p, ctypes.c_int]
+_user32.SendInput.restype = wintypes.UINT
+
+# Left button down and up, built once and sent separately by click_at
+_CLICK_DOWN = INPUT(type=INPUT_MOUSE, mi=MOUSEINPUT(dwFlags=MOUSEEVENTF_LEFTDOWN))
+_CLICK_UP = INPUT(type=INPUT_MOUSE, mi=MOUSEINPUT(dwFlags=MOUSEEVENTF_LEFTUP))
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
+
+def _ms_since_last_input() -> int:
+    """Milliseconds since the last keyboard/mouse event in the session (no sampling sleep)."""
+    info = LASTINPUTINFO(ctypes.sizeof(LASTINPUTINFO), 0)
+    if not _user32.GetLastInputInfo(ctypes.byref(info)):
+        raise ctypes.WinError()
+    # Both are 32-bit tick counts that wrap after ~49.7 days
+    return (_kernel32.GetTickCount() - info.dwTime) & 0xFFFFFFFF
+
+
+# OpenCV worker threads; a quarter of the cores leaves the rest to the game being watched
+DEFAULT_CV_THREADS = max(1, (os.cpu_count() or 1) // 4)
+
+
+def _match_template(image, template):
+    """TM_CCOEFF_NORMED score map, computed via OpenCL when available."""
+    if USE_OPENCL and cv2.ocl.useOpenCL():
+        try:
+            return cv2.matchTemplate(cv2.UMat(image), cv2.UMat(template), cv2.TM_CCOEFF_NORMED).get()
+        except cv2.error:
+            pass # Driver rejected the kernel; use the CPU path
+    return cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
+
+def _match_masked(image, template, mask):
+    """
+    TM_CCOEFF_NORMED score map over the template's opaque pixels only.
+    Flat image patches divide by zero under a mask, so NaN/inf scores are zeroed.
+    """
+    result = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED, mask=mask)
+    result[~np.isfinite(result)] = 0.0
+    return result
+
+def _suppress_peaks(result, threshold, t_w, t_h, max_peaks):
+    """
+    Greedy non-max suppression over a score map (modified in place).
+    Returns top-left positions of peaks >= threshold, strongest first, at most one per template footprint.
+    """
+    peaks = []
+    while len(peaks) < max_peaks:
+        _, peak_val, _, (px, py) = cv2.minMaxLoc(result)
+        if peak_val < threshold:
+            break
+        peaks.append((px, py))
+        result[max(0, py - t_h + 1):py + t_h, max(0, px - t_w + 1):px + t_w] = -1.0
+    return peaks
+
+class _ScreenGrabber:
+    """
+    Copies screen regions into one reusable DIB section (no per-grab allocation).
+    The section only grows, to the largest region seen. GDI handles belong to the
+    creating thread, so keep one grabber per thread.
+    """
+
     def __init__(self):
-        self.sct = mss.mss()
-        logger.info("VisualDetector initialized (OpenCV + MSS)")
+        self._src_dc = _user32.GetWindowDC(None)
+        self._mem_dc = _gdi32.CreateCompatibleDC(self._src_dc)
+        self._bitmap = None
+        self._old_obj = None
+        self._pixels = np.empty((0, 0, 4), dtype=np.uint8)
+
+    def _reserve(self, width, height):
+        """Make the DIB section at least width x height."""
+        cap_h, cap_w = self._pixels.shape[:2]
+        if width <= cap_w and height <= cap_h:
+            return
+        width, height = max(width, cap_w), max(height, cap_h)
+        
+        bmi = BITMAPINFOHEADER()
+        bmi.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+        bmi.biWidth = width
+        bmi.biHeight = -height  # Top-down rows
+        bmi.biPlanes = 1
+        bmi.biBitCount = 32
+        bmi.biCompression = BI_RGB
+        bits = ctypes.c_void_p()
+        bitmap = _gdi32.CreateDIBSection(self._mem_dc, ctypes.byref(bmi), DIB_RGB_COLORS,
+                                         ctypes.byref(bits), None, 0)
+        if not bitmap:
+            raise ctypes.WinError()
+        
+        old_obj = _gdi32.SelectObject(self._mem_dc, bitmap)
+        if self._bitmap:
+            _gdi32.DeleteObject(self._bitmap)
+        else:
+            self._old_obj = old_obj
+        self._bitmap = bitmap
+        # View the section's memory directly; GDI owns it until DeleteObject
+        raw = (ctypes.c_ubyte * (width * height * 4)).from_address(bits.value)
+        self._pixels = np.frombuffer(raw, dtype=np.uint8).reshape(height, width, 4)
+
+    def grab(self, left, top, width, height) -> np.ndarray:
+        """BGRA view of a screen region; valid until the next grab on this grabber."""
+        self._reserve(width, height)
+        if not _gdi32.BitBlt(self._mem_dc, 0, 0, width, height, self._src_dc, left, top, SRCCOPY | CAPTUREBLT):
+            raise ctypes.WinError()
+        _gdi32.GdiFlush() # Finish queued GDI work before the bits are read directly
+        return self._pixels[:height, :width]
+
+    def __del__(self):
+        if self._bitmap:
+            _gdi32.SelectObject(self._mem_dc, self._old_obj)
+            _gdi32.DeleteObject(self._bitmap)
+        _gdi32.DeleteDC(self._mem_dc)
+        _user32.ReleaseDC(None, self._src_dc)
+
+class VisualDetector:
+    def __init__(self, threads: int = DEFAULT_CV_THREADS, opencl: bool = True):
+        """
+        `threads` caps OpenCV's parallel_for_ pool (process-wide).
+        `opencl=False` keeps matching off the GPU, e.g. while a game is using it.
+        """
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(threads)
+        if USE_OPENCL and not opencl:
+            cv2.ocl.setUseOpenCL(False)
+        
+        self._tls = threading.local() # One screen grabber per capturing thread
+        self._templates = {} # path -> decoded BGR template
+        self._masks = {}     # id(template) -> (template, opacity mask) for templates with transparent pixels
+        self._gray_templates = {} # id(template) -> (template, grayscale template)
+        self._pyramids = {}  # id(gray template) -> (gray template, [full, 1/2, 1/4 ...])
+        self._prechecks = {} # id(gray template) -> (gray template, scale, downscaled template)
+        self._last_hits = {} # (hwnd, id(template)) -> top-left of the last match in the client area
+        self._frame_results = {} # (hwnd, id(template), confidence) -> (template, frame digest, client-relative center or None)
+        self._pool = None    # scan_batch workers, created on first batch
+        self._pool_size = 0
+        logger.info(f"VisualDetector initialized (OpenCV + GDI, {threads} threads, "
+                    f"OpenCL {'on' if cv2.ocl.useOpenCL() else 'off'})")
+
+    def load_template(self, template_path: str):
+        """
+        Decode a template image once and keep it for later scans.
+        Transparent pixels (alpha == 0) are excluded from matching.
+        Returns the BGR array, or None if the image could not be loaded.
+        """
+        template = self._templates.get(template_path)
+        if template is None:
+            image = cv2.imread(template_path, cv2.IMREAD_UNCHANGED)
+            if image is None:
+                logger.error(f"Failed to load template image: {template_path}")
+                return None
+            if image.dtype == np.uint16:
+                image = (image >> 8).astype(np.uint8) # 16-bit PNGs; IMREAD_COLOR used to do this
+            if image.ndim == 2:
+                template = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+            elif image.shape[2] == 4:
+                template = cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
+                alpha = image[:, :, 3]
+                if not alpha.all():
+                    self._masks[id(template)] = (template, (alpha > 0).astype(np.uint8) * 255)
+            else:
+                template = image
+            self._templates[template_path] = template
+        return template
+
+    def _template_mask(self, template):
+        """Opacity mask of a template from load_template(), or None if it is fully opaque."""
+        entry = self._masks.get(id(template))
+        if entry is None or entry[0] is not template:
+            return None
+        return entry[1]
+
+    @property
+    def grabber(self):
+        """Screen grabber of the calling thread (GDI handles are bound to the thread that made them)."""
+        grabber = getattr(self._tls, "grabber", None)
+        if grabber is None:
+            grabber = self._tls.grabber = _ScreenGrabber()
+        return grabber
 
     def _get_window_rect(self, hwnd):
         """Get window RECT."""
@@ -26,67 +296,312 @@ class VisualDetector:
         except Exception:
             return None
 
-    def capture_window(self, hwnd) -> np.ndarray:
-        """Capture the specific window area using MSS."""
+    def _get_client_rect(self, hwnd):
+        """
+        Get the client area RECT in screen coordinates (no frame/title bar).
+        Returns None for minimized or vanished windows.
+        """
+        try:
+            if win32gui.IsIconic(hwnd):
+                return None
+            _, _, width, height = win32gui.GetClientRect(hwnd)
+            left, top = win32gui.ClientToScreen(hwnd, (0, 0))
+            return (left, top, left + width, top + height)
+        except Exception:
+            return None
+
+    def capture_window(self, hwnd):
+        """
+        Capture the specific window area.
+        Returns (BGR image, window RECT), or (None, None) if the window is gone.
+        """
         rect = self._get_window_rect(hwnd)
         if not rect:
-            return None
-        
-        # MSS monitor spec: {'top': t, 'left': l, 'width': w, 'height': h}
-        monitor = {
-            "left": rect[0],
-            "top": rect[1],
-            "width": rect[2] - rect[0],
-            "height": rect[3] - rect[1]
-        }
+            return None, None
+        return self._grab(rect), rect
+
+    def _grab(self, rect, gray: bool = False, reuse: bool = False) -> np.ndarray:
+        """
+        Capture a screen RECT (left, top, right, bottom) as a BGR (or grayscale) array.
+        With `reuse`, the result lands in a per-thread buffer that the next reusing
+        grab on the same thread overwrites.
+        """
+        width, height = rect[2] - rect[0], rect[3] - rect[1]
+        # BGRA view into the thread's DIB section (no copy)
+        img = self.grabber.grab(rect[0], rect[1], width, height)
+        # Convert to BGR (OpenCV standard) or grayscale - drop Alpha
+        code = cv2.COLOR_BGRA2GRAY if gray else cv2.COLOR_BGRA2BGR
+        if not reuse:
+            return cv2.cvtColor(img, code)
         
-        # Grab screen data
-        sct_img = self.sct.grab(monitor)
-        # Convert to numpy array (BGRA)
-        img = np.array(sct_img)
-        # Convert to BGR (OpenCV standard) - drop Alpha
-        img_bgr = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-        return img_bgr
+        shape = (height, width) if gray else (height, width, 3)
+        buf_name = "gray_buf" if gray else "bgr_buf"
+        buf = getattr(self._tls, buf_name, None)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype=np.uint8)
+            setattr(self._tls, buf_name, buf)
+        return cv2.cvtColor(img, code, dst=buf)
 
-    def scan_for_template(self, hwnd, template_path: str, confidence=0.8):
+    def _gray_template(self, template):
+        """Grayscale copy of a BGR template, converted once per template array."""
+        if template.ndim == 2:
+            return template
+        entry = self._gray_templates.get(id(template))
+        if entry is None or entry[0] is not template:
+            entry = self._gray_templates[id(template)] = (template, cv2.cvtColor(template, cv2.COLOR_BGR2GRAY))
+        return entry[1]
+
+    def scan_for_template(self, hwnd, template, confidence=0.8):
         """
         Scan window for template.
+        `template` is a BGR array from load_template() or a path to an image file.
         Returns: (center_x, center_y) in SCREEN coordinates if found, else None.
         """
-        # 1. Capture
-        screen_img = self.capture_window(hwnd)
-        if screen_img is None:
-            return None
+        return self.scan_for_templates(hwnd, [template], confidence)[0]
 
-        # 2. Load Template
-        template = cv2.imread(template_path)
-        if template is None:
-            logger.error(f"Failed to load template image: {template_path}")
-            return None
+    def scan_for_templates(self, hwnd, templates, confidence=0.8):
+        """
+        Scan window for several templates using a single capture.
+        Returns a list with one (center_x, center_y) SCREEN position or None per template.
+        """
+        # 1. Resolve Templates (decoded once per path)
+        resolved = [self.load_template(t) if isinstance(t, str) else t for t in templates]
+        results = [None] * len(resolved)
+        
+        # 2. Capture (client area only; skip windows that cannot contain any template)
+        rect = self._get_client_rect(hwnd)
+        if not rect:
+            return results
+        width, height = rect[2] - rect[0], rect[3] - rect[1]
+        fitting = [i for i, t in enumerate(resolved)
+                   if t is not None and t.shape[0] <= height and t.shape[1] <= width]
+        if not fitting:
+            return results
+        # Matching runs on one grayscale plane (a third of the work of BGR, same peaks for UI art)
+        screen_img = self._grab(rect, gray=True, reuse=True)
+        digest = self._frame_digest(screen_img)
+        
+        for i in fitting:
+            # An unchanged frame cannot change the answer; reuse the last result
+            key = (hwnd, id(resolved[i]), confidence)
+            cached = self._frame_results.get(key)
+            if cached is not None and cached[0] is resolved[i] and cached[1] == digest:
+                match = cached[2]
+            else:
+                match = self._locate(hwnd, screen_img, resolved[i], confidence)
+                self._frame_results[key] = (resolved[i], digest, match)
+            if match is not None:
+                # Convert to Global Screen Coordinates
+                results[i] = (rect[0] + match[0], rect[1] + match[1])
+        return results
 
-        # 3. Match
-        result = cv2.matchTemplate(screen_img, template, cv2.TM_CCOEFF_NORMED)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+    def _frame_digest(self, screen_img):
+        """Size + hash of a downscaled grayscale capture; equal digests mean an unchanged window."""
+        small = cv2.resize(screen_img, None, fx=FRAME_HASH_SCALE, fy=FRAME_HASH_SCALE, interpolation=cv2.INTER_AREA)
+        return (screen_img.shape, _hash_pixels(small.tobytes()))
 
-        if max_val >= confidence:
+    def scan_batch(self, jobs):
+        """
+        Run scans for several windows concurrently (OpenCV releases the GIL while matching).
+        `jobs` is a list of (hwnd, template, confidence); returns one SCREEN center or None per job, in order.
+        Each window is captured once, however many jobs target it.
+        """
+        by_hwnd = {}
+        for index, (hwnd, template, confidence) in enumerate(jobs):
+            by_hwnd.setdefault((hwnd, confidence), []).append((index, template))
+        
+        # Drop cached results of windows no longer scanned (closed, or a recycled HWND)
+        live = {hwnd for hwnd, _ in by_hwnd}
+        self._frame_results = {key: entry for key, entry in self._frame_results.items() if key[0] in live}
+        
+        # One worker per window, up to the core count (independent of OpenCV's own threads)
+        workers = max(1, min(len(by_hwnd), os.cpu_count() or 1))
+        if self._pool is None or workers > self._pool_size:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+            self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="VisualScan")
+            self._pool_size = workers
+        futures = {
+            key: self._pool.submit(self.scan_for_templates, key[0], [t for _, t in entries], key[1])
+            for key, entries in by_hwnd.items()
+        }
+        
+        results = [None] * len(jobs)
+        for key, entries in by_hwnd.items():
+            try:
+                matches = futures[key].result()
+            except OSError as e:
+                # Window vanished or capture failed; the other windows' results still count
+                logger.debug(f"Visual scan of window {key[0]} failed: {e}")
+                continue
+            for (index, _), match in zip(entries, matches):
+                results[index] = match
+        return results
+
+    def scan_for_template_all(self, hwnd, template, confidence=0.8, max_matches=MAX_MATCHES):
+        """
+        Find every non-overlapping occurrence of template in the window.
+        Returns a list of (center_x, center_y) SCREEN positions, strongest first.
+        """
+        if isinstance(template, str):
+            template = self.load_template(template)
+            if template is None:
+                return []
+        
+        rect = self._get_client_rect(hwnd)
+        if not rect:
+            return []
+        t_h, t_w = template.shape[:2]
+        if rect[2] - rect[0] < t_w or rect[3] - rect[1] < t_h:
+            return []
+        screen_img = self._grab(rect, gray=True, reuse=True)
+        mask = self._template_mask(template)
+        template = self._gray_template(template)
+        if mask is not None:
+            result = _match_masked(screen_img, template, mask)
+        elif self._precheck(screen_img, template, confidence):
+            result = _match_template(screen_img, template)
+        else:
+            return []
+        return [(rect[0] + x + t_w // 2, rect[1] + y + t_h // 2)
+                for x, y in _suppress_peaks(result, confidence, t_w, t_h, max_matches)]
+
+    def _locate(self, hwnd, screen_img, template, confidence):
+        """Center of `template` in the grayscale client capture, or None."""
+        hit_key = (hwnd, id(template))
+        mask = self._template_mask(template)
+        template = self._gray_template(template)
+        
+        # 3. Match (the previous location first; periodic scans usually find it unchanged)
+        max_val, max_loc = 0.0, None
+        last_hit = self._last_hits.pop(hit_key, None)
+        if last_hit is not None:
+            max_val, max_loc = self._match_roi(screen_img, template, last_hit[0], last_hit[1], LAST_HIT_MARGIN, mask)
+        
+        if max_loc is None or max_val < confidence:
+            if mask is not None:
+                # Masked templates skip the shrunken passes (the mask would have to shrink with them)
+                _, max_val, _, max_loc = cv2.minMaxLoc(_match_masked(screen_img, template, mask))
+            else:
+                if not self._precheck(screen_img, template, confidence):
+                    return None
+                max_val, max_loc = self._match_pyramid(screen_img, template, confidence)
+
+        if max_loc is not None and max_val >= confidence:
+            self._last_hits[hit_key] = max_loc
             logger.info(f"Target found! Confidence: {max_val:.2f}")
             
             # 4. Calculate Center
-            # max_loc is top-left in the *captured image* (relative to window)
+            # max_loc is top-left in the *captured image* (relative to the client area)
             t_h, t_w = template.shape[:2]
-            
-            rel_x = max_loc[0] + t_w // 2
-            rel_y = max_loc[1] + t_h // 2
-            
-            # Convert to Global Screen Coordinates
-            rect = self._get_window_rect(hwnd)
-            screen_x = rect[0] + rel_x
-            screen_y = rect[1] + rel_y
-            
-            return (screen_x, screen_y)
+            return (max_loc[0] + t_w // 2, max_loc[1] + t_h // 2)
         
         return None
 
+    def _precheck(self, screen_img, template, confidence) -> bool:
+        """
+        Match a downscaled copy first; False means the full match cannot reach
+        `confidence`. Templates too small to shrink always pass. Both images are grayscale.
+        """
+        entry = self._prechecks.get(id(template))
+        if entry is None or entry[0] is not template:
+            scale = max(PRECHECK_SCALE, PRECHECK_MIN_TEMPLATE / min(template.shape[:2]))
+            small_tmpl = None
+            if scale <= 0.5:
+                small_tmpl = cv2.resize(template, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            entry = self._prechecks[id(template)] = (template, scale, small_tmpl)
+        
+        _, scale, small_tmpl = entry
+        if small_tmpl is None:
+            return True
+        
+        small = cv2.resize(screen_img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        if small.shape[0] < small_tmpl.shape[0] or small.shape[1] < small_tmpl.shape[1]:
+            return True
+        _, max_val, _, _ = cv2.minMaxLoc(_match_template(small, small_tmpl))
+        return max_val >= confidence - PRECHECK_SLACK
+
+    def _template_pyramid(self, template):
+        """Return [template, pyrDown(template), ...], built once per template array."""
+        entry = self._pyramids.get(id(template))
+        if entry is not None and entry[0] is template:
+            return entry[1]
+        
+        levels = [template]
+        while (len(levels) <= PYRAMID_MAX_LEVELS and
+               min(levels[-1].shape[:2]) // 2 >= PYRAMID_MIN_TEMPLATE):
+            levels.append(cv2.pyrDown(levels[-1]))
+        # Keep a reference to the template so its id() cannot be reused
+        self._pyramids[id(template)] = (template, levels)
+        return levels
+
+    def _match_pyramid(self, screen_img, template, confidence):
+        """
+        Find the best TM_CCOEFF_NORMED match of `template` in `screen_img`.
+        Matches on downscaled copies first and only re-scores the strongest coarse
+        peaks at full resolution. Returns (max_val, max_loc); max_loc is None if
+        nothing came close.
+        """
+        t_h, t_w = template.shape[:2]
+        img_h, img_w = screen_img.shape[:2]
+        if img_h < t_h or img_w < t_w:
+            return 0.0, None
+        
+        levels = self._template_pyramid(template)
+        depth = len(levels) - 1
+        small_img = screen_img
+        for _ in range(depth):
+            small_img = cv2.pyrDown(small_img)
+        small_tmpl = levels[depth]
+        
+        if depth == 0 or small_img.shape[0] < small_tmpl.shape[0] or small_img.shape[1] < small_tmpl.shape[1]:
+            # Template too small to shrink (or window too small): plain full-resolution match
+            result = _match_template(screen_img, template)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            return max_val, max_loc
+        
+        coarse = _match_template(small_img, small_tmpl)
+        scale = 1 << depth
+        margin = 2 * scale
+        s_h, s_w = small_tmpl.shape[:2]
+        
+        best_val, best_loc = 0.0, None
+        for _ in range(PYRAMID_MAX_CANDIDATES):
+            _, peak_val, _, (px, py) = cv2.minMaxLoc(coarse)
+            if peak_val < confidence - PYRAMID_COARSE_SLACK:
+                break
+            # Suppress this peak so the next iteration finds a different one
+            coarse[max(0, py - s_h // 2):py + s_h // 2 + 1, max(0, px - s_w // 2):px + s_w // 2 + 1] = -1.0
+            
+            # Refine in a full-resolution ROI around the upscaled peak
+            fine_val, fine_loc = self._match_roi(screen_img, template, px * scale, py * scale, margin)
+            if fine_loc is not None and fine_val > best_val:
+                best_val, best_loc = fine_val, fine_loc
+        
+        return best_val, best_loc
+
+    def _match_roi(self, screen_img, template, x, y, margin, mask=None):
+        """
+        Match `template` (optionally masked) at full resolution only within `margin` px of top-left (x, y).
+        Returns (max_val, max_loc) in image coordinates; max_loc is None if the ROI is clipped too small.
+        """
+        t_h, t_w = template.shape[:2]
+        img_h, img_w = screen_img.shape[:2]
+        x0 = max(0, x - margin)
+        y0 = max(0, y - margin)
+        x1 = min(img_w, x + t_w + margin)
+        y1 = min(img_h, y + t_h + margin)
+        if y1 - y0 < t_h or x1 - x0 < t_w:
+            return 0.0, None
+        
+        roi = screen_img[y0:y1, x0:x1]
+        if mask is not None:
+            result = _match_masked(roi, template, mask)
+        else:
+            result = cv2.matchTemplate(roi, template, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, (fx, fy) = cv2.minMaxLoc(result)
+        return max_val, (x0 + fx, y0 + fy)
+
     def click_at(self, x, y):
         """
         Perform a click at screen coordinates using SendInput.
@@ -94,19 +609,8 @@ class VisualDetector:
         """
         try:
             # --- Safety Check: Is User using the mouse? ---
-            # We measure cursor position delta over 100ms
-            
-            # Helper to get pos
-            def get_pos():
-                pt = win32api.GetCursorPos() # Returns (x, y)
-                return pt
-            
-            start_pos = get_pos()
-            time.sleep(0.1)
-            end_pos = get_pos()
-            
-            dist = ((end_pos[0] - start_pos[0])**2 + (end_pos[1] - start_pos[1])**2) ** 0.5
-            if dist > 10: # Threshold: 10 pixels
+            # The session's last-input tick also catches motion that cursor sampling misses
+            if _ms_since_last_input() < USER_ACTIVE_WINDOW_MS:
                 logger.warning("Sentinel: Visual interaction ABORTED - User is moving the mouse!")
                 return False
                 
@@ -115,42 +619,17 @@ class VisualDetector:
             logger.info(f"Setting cursor to ({ix}, {iy})")
             
             # 1. Move Cursor
-            ctypes.windll.user32.SetCursorPos(ix, iy)
+            _user32.SetCursorPos(ix, iy)
             time.sleep(0.1)
 
-            # 2. Prepare Input Structures via ctypes
-            class MOUSEINPUT(ctypes.Structure):
-                _fields_ = [("dx", ctypes.c_long),
-                            ("dy", ctypes.c_long),
-                            ("mouseData", ctypes.c_ulong),
-                            ("dwFlags", ctypes.c_ulong),
-                            ("time", ctypes.c_ulong),
-                            ("dwExtraInfo", ctypes.c_void_p)]
-
-            class INPUT(ctypes.Structure):
-                _fields_ = [("type", ctypes.c_ulong),
-                            ("mi", MOUSEINPUT)]
-
-            # Constants
-            INPUT_MOUSE = 0
-            MOUSEEVENTF_LEFTDOWN = 0x0002
-            MOUSEEVENTF_LEFTUP = 0x0004
-            
-            # Create Inputs
-            inp_down = INPUT()
-            inp_down.type = INPUT_MOUSE
-            inp_down.mi.dwFlags = MOUSEEVENTF_LEFTDOWN
-            
-            inp_up = INPUT()
-            inp_up.type = INPUT_MOUSE
-            inp_up.mi.dwFlags = MOUSEEVENTF_LEFTUP
-            
-            # Send Down
-            ctypes.windll.user32.SendInput(1, ctypes.pointer(inp_down), ctypes.sizeof(inp_down))
+            # 2. Send Down
+            if _user32.SendInput(1, ctypes.byref(_CLICK_DOWN), _INPUT_SIZE) != 1:
+                raise ctypes.WinError()
             time.sleep(0.15) # Robust delay for games
             
-            # Send Up
-            ctypes.windll.user32.SendInput(1, ctypes.pointer(inp_up), ctypes.sizeof(inp_up))
+            # 3. Send Up
+            if _user32.SendInput(1, ctypes.byref(_CLICK_UP), _INPUT_SIZE) != 1:
+                raise ctypes.WinError()
             
             logger.info(f"Clicked successfully at ({ix}, {iy}) via SendInput")
             return True
@@ -1,29 +1,46 @@
 import sys
 import argparse
+import importlib
 import subprocess
 import os
 
-# Map commands to scripts
+# Map commands to script modules (each exposes main(argv) -> int)
 SCRIPTS = {
-    "snip": "snip.py",
-    "capture": "capture_window.py",
-    "inspect": "inspect_window.py",
-    "interact": "interact_window.py"
+    "snip": "snip",
+    "capture": "capture_window",
+    "inspect": "inspect_window",
+    "interact": "interact_window"
 }
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 VENV_PYTHON = os.path.join(BASE_DIR, "venv", "Scripts", "python.exe")
 
-def run_script(script_name, args):
-    script_path = os.path.join(BASE_DIR, script_name)
+def run_script(module_name, args):
+    """Run a script's main() in this interpreter; its heavy imports happen only for the chosen command."""
+    if BASE_DIR not in sys.path:
+        sys.path.insert(0, BASE_DIR)
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        if not os.path.exists(VENV_PYTHON):
+            raise
+        # Dependencies only live in the tool's venv
+        print(f"{module_name}: {e}; falling back to the venv interpreter")
+        return run_script_subprocess(module_name, args)
+    return module.main(args)
+
+def run_script_subprocess(module_name, args):
+    """Run a script in the venv interpreter (separate process)."""
+    script_path = os.path.join(BASE_DIR, module_name + ".py")
     cmd = [VENV_PYTHON, script_path] + args
     
     print(f"Running: {' '.join(cmd)}")
     try:
         subprocess.run(cmd, check=True)
     except subprocess.CalledProcessError as e:
-        print(f"Error running {script_name}: {e}")
-        sys.exit(e.returncode)
+        print(f"Error running {module_name}: {e}")
+        return e.returncode
+    return 0
 
 def main():
     parser = argparse.ArgumentParser(description="c4n Desktop Agent Tools")
@@ -53,19 +70,26 @@ def main():
     # but here we map explicitly.
     # Actually, simpler approach: just forward arguments based on command.
     
-    if len(sys.argv) < 2:
+    argv = sys.argv[1:]
+    # --subprocess: run the command in the venv interpreter instead of in-process
+    use_subprocess = argv[:1] == ["--subprocess"]
+    if use_subprocess:
+        argv = argv[1:]
+    
+    if not argv:
         parser.print_help()
         sys.exit(1)
         
-    command = sys.argv[1]
+    command = argv[0]
     if command not in SCRIPTS:
         print(f"Unknown command: {command}")
         parser.print_help()
         sys.exit(1)
         
     # Forward all remaining args to the specific script
-    script_args = sys.argv[2:]
-    run_script(SCRIPTS[command], script_args)
+    script_args = argv[1:]
+    runner = run_script_subprocess if use_subprocess else run_script
+    sys.exit(runner(SCRIPTS[command], script_args))
 
 if __name__ == "__main__":
     main()
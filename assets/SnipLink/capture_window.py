@@ -1,59 +1,156 @@
 import sys
 import time
 import argparse
+import ctypes
+from ctypes import wintypes
 import win32gui
-import win32con
-import win32process
-import win32com.client
-from PIL import ImageGrab
+from PIL import Image, ImageGrab
 
-def window_enum_handler(hwnd, resultList):
-    if win32gui.IsWindowVisible(hwnd) and win32gui.GetWindowText(hwnd) != '':
-        resultList.append((hwnd, win32gui.GetWindowText(hwnd)))
+try:
+    import mss
+except ImportError:
+    mss = None
 
-def get_window_by_title(title_query):
-    top_windows = []
-    win32gui.EnumWindows(window_enum_handler, top_windows)
+PNG_COMPRESS_LEVEL = 1 # Fastest zlib level; captures are saved once and rarely archived
+RETRY_DELAYS = (0.01, 0.05, 0.15, 0.5, 1.0) # Backoff (s) between window searches; the last repeats
+
+# GDI bindings for PrintWindow capture
+_user32 = ctypes.WinDLL("user32")
+_gdi32 = ctypes.WinDLL("gdi32")
+_user32.GetWindowDC.argtypes = [wintypes.HWND]
+_user32.GetWindowDC.restype = wintypes.HDC
+_user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+_user32.PrintWindow.argtypes = [wintypes.HWND, wintypes.HDC, wintypes.UINT]
+_user32.PrintWindow.restype = wintypes.BOOL
+EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+_user32.EnumWindows.argtypes = [EnumWindowsProc, wintypes.LPARAM]
+_user32.EnumWindows.restype = wintypes.BOOL
+_user32.IsWindowVisible.argtypes = [wintypes.HWND]
+_user32.IsWindowVisible.restype = wintypes.BOOL
+_user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+_user32.GetWindowTextLengthW.restype = ctypes.c_int
+_user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+_user32.GetWindowTextW.restype = ctypes.c_int
+_user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+_user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+_gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+_gdi32.CreateCompatibleDC.restype = wintypes.HDC
+_gdi32.CreateCompatibleBitmap.argtypes = [wintypes.HDC, ctypes.c_int, ctypes.c_int]
+_gdi32.CreateCompatibleBitmap.restype = wintypes.HBITMAP
+_gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+_gdi32.SelectObject.restype = wintypes.HGDIOBJ
+_gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+_gdi32.DeleteDC.argtypes = [wintypes.HDC]
+_gdi32.GetDIBits.argtypes = [wintypes.HDC, wintypes.HBITMAP, wintypes.UINT, wintypes.UINT,
+                             ctypes.c_void_p, ctypes.c_void_p, wintypes.UINT]
+_gdi32.GetDIBits.restype = ctypes.c_int
+
+PW_RENDERFULLCONTENT = 0x00000002
+BI_RGB = 0
+DIB_RGB_COLORS = 0
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [("biSize", wintypes.DWORD),
+                ("biWidth", wintypes.LONG),
+                ("biHeight", wintypes.LONG),
+                ("biPlanes", wintypes.WORD),
+                ("biBitCount", wintypes.WORD),
+                ("biCompression", wintypes.DWORD),
+                ("biSizeImage", wintypes.DWORD),
+                ("biXPelsPerMeter", wintypes.LONG),
+                ("biYPelsPerMeter", wintypes.LONG),
+                ("biClrUsed", wintypes.DWORD),
+                ("biClrImportant", wintypes.DWORD)]
+
+def _window_text(hwnd):
+    length = _user32.GetWindowTextLengthW(hwnd)
+    if length <= 0:
+        return ''
+    buf = ctypes.create_unicode_buffer(length + 1)
+    _user32.GetWindowTextW(hwnd, buf, length + 1)
+    return buf.value
+
+def find_window(predicate):
+    """
+    Return (hwnd, title) of the first visible, titled top-level window for which
+    predicate(hwnd, title) is true, or None. Enumeration stops at the first match.
+    """
+    found = []
     
+    def callback(hwnd, _):
+        if not _user32.IsWindowVisible(hwnd):
+            return True
+        title = _window_text(hwnd)
+        if title and predicate(hwnd, title):
+            found.append((hwnd, title))
+            return False # Stop enumerating
+        return True
+    
+    _user32.EnumWindows(EnumWindowsProc(callback), 0)
+    return found[0] if found else None
+
+def get_window_by_title(title_query):
     # Case insensitive search
     title_query = title_query.lower()
-    
-    # Filter for matches
-    matches = []
-    for hwnd, title in top_windows:
-        if title_query in title.lower():
-            matches.append((hwnd, title))
-            
-    if not matches:
-        return None
-        
-    # If multiple matches, prefer exact match or the one with the shortest title (likely the main window)
-    return matches[0]
+    return find_window(lambda hwnd, title: title_query in title.lower())
 
 def get_window_by_pid(pid):
-    top_windows = []
-    win32gui.EnumWindows(window_enum_handler, top_windows)
+    found_pid = wintypes.DWORD()
+    
+    def owned_by_pid(hwnd, title):
+        _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(found_pid))
+        return found_pid.value == pid
     
-    for hwnd, title in top_windows:
-        _, found_pid = win32process.GetWindowThreadProcessId(hwnd)
-        if found_pid == pid:
-            return (hwnd, title)
-    return None
+    return find_window(owned_by_pid)
 
-def bring_to_front(hwnd):
+def grab_screen(rect):
+    """Capture a screen RECT (left, top, right, bottom); MSS copies only that region."""
+    if mss is None:
+        return ImageGrab.grab(bbox=rect)
+    x1, y1, x2, y2 = rect
+    with mss.mss() as sct:
+        shot = sct.grab({"left": x1, "top": y1, "width": x2 - x1, "height": y2 - y1})
+    return Image.frombuffer("RGB", shot.size, shot.raw, "raw", "BGRX", 0, 1)
+
+def grab_window(hwnd, rect):
+    """
+    Capture a window's own pixels with PrintWindow (no focus change, works when covered).
+    Falls back to a screen grab of `rect` if the window refuses to render.
+    """
+    x1, y1, x2, y2 = rect
+    width, height = x2 - x1, y2 - y1
+    
+    window_dc = _user32.GetWindowDC(hwnd)
+    if not window_dc:
+        return grab_screen(rect)
+    mem_dc = _gdi32.CreateCompatibleDC(window_dc)
+    bitmap = _gdi32.CreateCompatibleBitmap(window_dc, width, height)
+    old_obj = _gdi32.SelectObject(mem_dc, bitmap)
     try:
-        win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+        if not _user32.PrintWindow(hwnd, mem_dc, PW_RENDERFULLCONTENT):
+            return grab_screen(rect)
         
-        # This is a bit hacky but often necessary on modern Windows to steal focus
-        shell = win32com.client.Dispatch("WScript.Shell")
-        shell.SendKeys('%')
+        bmi = BITMAPINFOHEADER()
+        bmi.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+        bmi.biWidth = width
+        bmi.biHeight = -height  # Top-down rows
+        bmi.biPlanes = 1
+        bmi.biBitCount = 32
+        bmi.biCompression = BI_RGB
         
-        win32gui.SetForegroundWindow(hwnd)
-        time.sleep(0.5) # Wait for animation
-    except Exception as e:
-        print(f"Warning: Could not bring window to front: {e}")
+        pixels = ctypes.create_string_buffer(width * height * 4)
+        if not _gdi32.GetDIBits(mem_dc, bitmap, 0, height, pixels, ctypes.byref(bmi), DIB_RGB_COLORS):
+            return grab_screen(rect)
+    finally:
+        _gdi32.SelectObject(mem_dc, old_obj)
+        _gdi32.DeleteObject(bitmap)
+        _gdi32.DeleteDC(mem_dc)
+        _user32.ReleaseDC(hwnd, window_dc)
+    
+    # GDI leaves the alpha byte undefined, so read it as padding
+    return Image.frombuffer("RGB", (width, height), pixels, "raw", "BGRX", 0, 1)
 
-def capture_window(target, mode="title", output_file="window_capture.png", retries=5):
+def capture_window(target, mode="title", output_file="window_capture.png", retries=8):
     match = None
     
     print(f"Searching for window ({mode}='{target}')...")
@@ -69,7 +166,7 @@ def capture_window(target, mode="title", output_file="window_capture.png", retri
         
         if i < retries - 1:
             print(f"Window not found, retrying ({i+1}/{retries})...")
-            time.sleep(1)
+            time.sleep(RETRY_DELAYS[min(i, len(RETRY_DELAYS) - 1)])
 
     if not match:
         print(f"ERROR: No window found matching {mode}='{target}' after {retries} attempts")
@@ -78,17 +175,17 @@ def capture_window(target, mode="title", output_file="window_capture.png", retri
     hwnd, title = match
     print(f"Found window: '{title}' (HWND: {hwnd})")
     
-    bring_to_front(hwnd)
-    
     try:
         # Get window bounds
         rect = win32gui.GetWindowRect(hwnd)
-        x1, y1, x2, y2 = rect
+        if rect[2] <= rect[0] or rect[3] <= rect[1]:
+            print(f"ERROR: Window has no visible area: {rect}")
+            return False
         
-        # Capture
+        # Capture (without bringing the window to the front)
         print(f"Capturing area: {rect}")
-        img = ImageGrab.grab(bbox=(x1, y1, x2, y2))
-        img.save(output_file)
+        img = grab_window(hwnd, rect)
+        img.save(output_file, compress_level=PNG_COMPRESS_LEVEL)
         print(f"SUCCESS: Saved to {output_file}")
         return True
         
@@ -96,12 +193,15 @@ def capture_window(target, mode="title", output_file="window_capture.png", retri
         print(f"ERROR: Failed to capture: {e}")
         return False
 
-if __name__ == "__main__":
+def main(argv=None) -> int:
     parser = argparse.ArgumentParser(description="Capture a specific window.")
     parser.add_argument("target", help="Window title or PID")
     parser.add_argument("--pid", action="store_true", help="Interpret target as PID")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     mode = "pid" if args.pid else "title"
-    capture_window(args.target, mode=mode)
+    return 0 if capture_window(args.target, mode=mode) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,14 +15,19 @@ def inspect_window(pid, depth=2):
         # Print control identifiers
         # This prints a tree of controls which is exactly what we need to "see" the UI structure
         dlg.print_control_identifiers(depth=depth)
+        return True
         
     except Exception as e:
         print(f"ERROR: Failed to inspect window: {e}")
+        return False
 
-if __name__ == "__main__":
+def main(argv=None) -> int:
     parser = argparse.ArgumentParser(description="Inspect UI elements of a window.")
     parser.add_argument("pid", type=int, help="Process ID of the target application")
     parser.add_argument("--depth", type=int, default=2, help="Depth of the UI tree to print")
     
-    args = parser.parse_args()
-    inspect_window(args.pid, args.depth)
+    args = parser.parse_args(argv)
+    return 0 if inspect_window(args.pid, args.depth) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
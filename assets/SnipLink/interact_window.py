@@ -1,8 +1,57 @@
 import sys
 import argparse
+import ctypes
+from ctypes import wintypes
 import time
 from pywinauto import Application
 
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+# Characters with a special meaning in pywinauto key specs ("{ENTER}", "^c", "%f", "~", ...)
+KEY_SPEC_CHARS = set("{}()+^%~")
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", wintypes.LONG),
+                ("dy", wintypes.LONG),
+                ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t)]
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [("wVk", wintypes.WORD),
+                ("wScan", wintypes.WORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t)]
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member, so it sets sizeof(INPUT) as SendInput expects
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+_user32 = ctypes.WinDLL("user32")
+_user32.SendInput.argtypes = [wintypes.UINT, ctypes.c_void_p, ctypes.c_int]
+_user32.SendInput.restype = wintypes.UINT
+
+def is_plain_text(text):
+    """True if `text` can be typed verbatim: printable BMP characters and no key-spec syntax."""
+    return all(c.isprintable() and ord(c) <= 0xFFFF and c not in KEY_SPEC_CHARS for c in text)
+
+def send_unicode_text(text):
+    """Type `text` into the focused window with one SendInput call (KEYEVENTF_UNICODE down/up pairs)."""
+    inputs = (INPUT * (2 * len(text)))()
+    for i, char in enumerate(text):
+        for inp, flags in ((inputs[2 * i], KEYEVENTF_UNICODE), (inputs[2 * i + 1], KEYEVENTF_UNICODE | KEYEVENTF_KEYUP)):
+            inp.type = INPUT_KEYBOARD
+            inp.ki.wScan = ord(char)
+            inp.ki.dwFlags = flags
+    return _user32.SendInput(len(inputs), inputs, ctypes.sizeof(INPUT)) == len(inputs)
+
 def interact_window(pid, action, control_id=None, text=None):
     print(f"Connecting to PID: {pid}...")
     try:
@@ -17,39 +66,49 @@ def interact_window(pid, action, control_id=None, text=None):
         if action == "type":
             if not text:
                 print("ERROR: --text required for type action")
-                return
+                return False
             print(f"Typing '{text}'...")
             # If control_id is provided, type into that control, otherwise just send keys to window
-            if control_id:
-                dlg[control_id].type_keys(text, with_spaces=True)
+            target = dlg[control_id] if control_id else dlg
+            if is_plain_text(text):
+                # Plain text goes out as one input batch instead of per-key messages
+                target.set_focus()
+                if not send_unicode_text(text):
+                    print("ERROR: SendInput was blocked")
+                    return False
             else:
-                dlg.type_keys(text, with_spaces=True)
+                target.type_keys(text, with_spaces=True)
                 
         elif action == "click":
             if not control_id:
                 print("ERROR: --control required for click action")
-                return
+                return False
             print(f"Clicking '{control_id}'...")
             dlg[control_id].click()
             
         elif action == "menu":
             if not text:
                 print("ERROR: --text required for menu action (e.g., 'File->Exit')")
-                return
+                return False
             print(f"Selecting menu '{text}'...")
             dlg.menu_select(text)
             
         print("SUCCESS: Action completed.")
+        return True
         
     except Exception as e:
         print(f"ERROR: Failed to interact: {e}")
+        return False
 
-if __name__ == "__main__":
+def main(argv=None) -> int:
     parser = argparse.ArgumentParser(description="Interact with UI elements.")
     parser.add_argument("pid", type=int, help="Process ID of the target application")
     parser.add_argument("--action", choices=["type", "click", "menu"], required=True, help="Action to perform")
     parser.add_argument("--control", help="Control identifier (name, auto_id, etc.)")
     parser.add_argument("--text", help="Text to type or menu path")
     
-    args = parser.parse_args()
-    interact_window(args.pid, args.action, args.control, args.text)
+    args = parser.parse_args(argv)
+    return 0 if interact_window(args.pid, args.action, args.control, args.text) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,9 +26,19 @@ def trigger_snip():
         # Fallback
         subprocess.run(["explorer", "ms-screenclip:"], check=False)
 
-def wait_for_image(timeout=60):
+# zlib level for saved screenshots: 1 encodes several times faster than the default for slightly larger files
+PNG_COMPRESS_LEVEL = 1
+
+# Clipboard listener (Windows)
+WM_CLIPBOARDUPDATE = 0x031D
+CF_DIB = 8
+HWND_MESSAGE = -3
+QS_POSTMESSAGE = 0x0008
+PM_REMOVE = 0x0001
+WAIT_TIMEOUT = 0x00000102
+
+def _poll_for_image(timeout):
     """Polls the clipboard for an image."""
-    print("Waiting for screenshot...")
     start_time = time.time()
     while time.time() - start_time < timeout:
         img = ImageGrab.grabclipboard()
@@ -37,7 +47,69 @@ def wait_for_image(timeout=60):
         time.sleep(0.5)
     return None
 
-def main():
+def wait_for_image(timeout=60):
+    """
+    Waits for an image on the clipboard.
+    On Windows a clipboard format listener wakes us only when the clipboard changes,
+    and the image is decoded only once a bitmap is actually available.
+    """
+    print("Waiting for screenshot...")
+    if sys.platform != 'win32':
+        return _poll_for_image(timeout)
+    
+    import ctypes
+    from ctypes import wintypes
+    
+    user32 = ctypes.WinDLL("user32")
+    user32.CreateWindowExW.argtypes = [wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+                                       ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                       wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID]
+    user32.CreateWindowExW.restype = wintypes.HWND
+    user32.DestroyWindow.argtypes = [wintypes.HWND]
+    user32.AddClipboardFormatListener.argtypes = [wintypes.HWND]
+    user32.AddClipboardFormatListener.restype = wintypes.BOOL
+    user32.RemoveClipboardFormatListener.argtypes = [wintypes.HWND]
+    user32.IsClipboardFormatAvailable.argtypes = [wintypes.UINT]
+    user32.IsClipboardFormatAvailable.restype = wintypes.BOOL
+    user32.MsgWaitForMultipleObjects.argtypes = [wintypes.DWORD, ctypes.c_void_p, wintypes.BOOL,
+                                                 wintypes.DWORD, wintypes.DWORD]
+    user32.MsgWaitForMultipleObjects.restype = wintypes.DWORD
+    user32.PeekMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND,
+                                    wintypes.UINT, wintypes.UINT, wintypes.UINT]
+    user32.PeekMessageW.restype = wintypes.BOOL
+    
+    # Message-only window: receives the listener's posted messages, never shown
+    hwnd = user32.CreateWindowExW(0, "STATIC", None, 0, 0, 0, 0, 0, HWND_MESSAGE, None, None, None)
+    if not hwnd:
+        return _poll_for_image(timeout)
+    if not user32.AddClipboardFormatListener(hwnd):
+        user32.DestroyWindow(hwnd)
+        return _poll_for_image(timeout)
+    
+    msg = wintypes.MSG()
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                return None
+            if user32.MsgWaitForMultipleObjects(0, None, False, remaining_ms, QS_POSTMESSAGE) == WAIT_TIMEOUT:
+                return None
+            
+            changed = False
+            while user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_REMOVE):
+                if msg.message == WM_CLIPBOARDUPDATE:
+                    changed = True
+            
+            if changed and user32.IsClipboardFormatAvailable(CF_DIB):
+                img = ImageGrab.grabclipboard()
+                if isinstance(img, Image.Image):
+                    return img
+    finally:
+        user32.RemoveClipboardFormatListener(hwnd)
+        user32.DestroyWindow(hwnd)
+
+def main(argv=None) -> int:
     try:
         clear_clipboard()
         trigger_snip()
@@ -49,15 +121,16 @@ def main():
             # Ensure unique filename if needed, but for now overwrite is fine for this tool's purpose
             # or maybe use timestamp: filename = f"screenshot_{int(time.time())}.png"
             
-            img.save(filename, "PNG")
+            img.save(filename, "PNG", compress_level=PNG_COMPRESS_LEVEL)
             print(f"SUCCESS: Screenshot saved to {os.path.abspath(filename)}")
         else:
             print("TIMEOUT: No screenshot detected.")
-            sys.exit(1)
+            return 1
             
     except Exception as e:
         print(f"ERROR: {e}")
-        sys.exit(1)
+        return 1
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
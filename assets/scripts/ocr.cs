@@ -11,68 +11,145 @@ namespace AutoLauncher.OCR
 {
     class Program
     {
+        // Printed after each result in --serve mode so the client knows the response is complete
+        const string EndMarker = "::OCR-END::";
+
         static void Main(string[] args)
         {
             if (args.Length == 0)
             {
-                Console.WriteLine("Usage: ocr.exe <image_path>");
+                Console.WriteLine("Usage: ocr.exe <image_path | - | --serve>");
                 return;
             }
 
             string imagePath = args[0];
             try
             {
-                // Initialize OCR Engine
-                // Try to force English first
-                OcrEngine ocrEngine = null;
-                var lang = new Windows.Globalization.Language("en-US");
-                if (OcrEngine.IsLanguageSupported(lang))
-                {
-                    ocrEngine = OcrEngine.TryCreateFromLanguage(lang);
-                }
-                
+                OcrEngine ocrEngine = CreateEngine();
                 if (ocrEngine == null)
                 {
-                    ocrEngine = OcrEngine.TryCreateFromUserProfileLanguages();
+                    Console.WriteLine("Error: Could not create OCR Engine (Language not supported?)");
+                    return;
                 }
+                Console.Error.WriteLine("DEBUG: Engine Created. Language: " + ocrEngine.RecognizerLanguage.DisplayName);
 
-                if (ocrEngine == null)
+                if (imagePath == "--serve")
                 {
-                    Console.WriteLine("Error: Could not create OCR Engine (Language not supported?)");
+                    Serve(ocrEngine);
                     return;
                 }
-                Console.WriteLine("DEBUG: Engine Created. Language: " + ocrEngine.RecognizerLanguage.DisplayName);
 
-                // Load Image
-                var fileOp = StorageFile.GetFileFromPathAsync(Path.GetFullPath(imagePath));
-                var file = Await(fileOp);
-
-                var streamOp = file.OpenAsync(FileAccessMode.Read);
-                using (var stream = Await(streamOp))
+                // Load Image ("-" = PNG bytes on stdin)
+                using (var stream = OpenImage(imagePath))
                 {
-                    var decoderOp = BitmapDecoder.CreateAsync(stream);
-                    var decoder = Await(decoderOp);
+                    Recognize(ocrEngine, stream);
+                }
+            }
+            catch (Exception ex)
+            {
+                Console.WriteLine("Error: " + ex.Message);
+            }
+        }
+
+        static OcrEngine CreateEngine()
+        {
+            // Try to force English first
+            OcrEngine ocrEngine = null;
+            var lang = new Windows.Globalization.Language("en-US");
+            if (OcrEngine.IsLanguageSupported(lang))
+            {
+                ocrEngine = OcrEngine.TryCreateFromLanguage(lang);
+            }
+
+            if (ocrEngine == null)
+            {
+                ocrEngine = OcrEngine.TryCreateFromUserProfileLanguages();
+            }
+            return ocrEngine;
+        }
+
+        static void Recognize(OcrEngine ocrEngine, IRandomAccessStream stream)
+        {
+            var decoderOp = BitmapDecoder.CreateAsync(stream);
+            var decoder = Await(decoderOp);
+
+            Console.Error.WriteLine("DEBUG: Image Decoded " + decoder.PixelWidth + "x" + decoder.PixelHeight);
 
-                    Console.WriteLine("DEBUG: Image Decoded " + decoder.PixelWidth + "x" + decoder.PixelHeight);
+            var bitmapOp = decoder.GetSoftwareBitmapAsync();
+            var softwareBitmap = Await(bitmapOp);
 
-                    var bitmapOp = decoder.GetSoftwareBitmapAsync();
-                    var softwareBitmap = Await(bitmapOp);
+            var ocrOp = ocrEngine.RecognizeAsync(softwareBitmap);
+            var ocrResult = Await(ocrOp);
 
-                    var ocrOp = ocrEngine.RecognizeAsync(softwareBitmap);
-                    var ocrResult = Await(ocrOp);
+            Console.Error.WriteLine("DEBUG: Found " + ocrResult.Lines.Count + " lines.");
 
-                    Console.WriteLine("DEBUG: Found " + ocrResult.Lines.Count + " lines.");
+            foreach (var line in ocrResult.Lines)
+            {
+                Console.WriteLine(line.Text);
+            }
+        }
+
+        // Long-lived mode: read <uint32 LE length><PNG bytes> frames from stdin until EOF
+        // (or a zero-length frame) and answer each with its text followed by EndMarker.
+        // Diagnostics go to stderr so stdout only carries recognized lines and the marker.
+        static void Serve(OcrEngine ocrEngine)
+        {
+            using (var stdin = new BinaryReader(Console.OpenStandardInput()))
+            {
+                while (true)
+                {
+                    byte[] header = stdin.ReadBytes(4);
+                    if (header.Length < 4)
+                    {
+                        return;
+                    }
+
+                    int length = (int)BitConverter.ToUInt32(header, 0);
+                    if (length == 0)
+                    {
+                        return;
+                    }
+
+                    byte[] png = stdin.ReadBytes(length);
+                    if (png.Length < length)
+                    {
+                        return;
+                    }
 
-                    foreach (var line in ocrResult.Lines)
+                    try
+                    {
+                        using (var stream = new MemoryStream(png).AsRandomAccessStream())
+                        {
+                            Recognize(ocrEngine, stream);
+                        }
+                    }
+                    catch (Exception ex)
                     {
-                        Console.WriteLine(line.Text);
+                        Console.Error.WriteLine("Error: " + ex.Message);
                     }
+
+                    Console.WriteLine(EndMarker);
+                    Console.Out.Flush();
                 }
             }
-            catch (Exception ex)
+        }
+
+        // Open the image either from disk or from stdin
+        static IRandomAccessStream OpenImage(string imagePath)
+        {
+            if (imagePath == "-")
             {
-                Console.WriteLine("Error: " + ex.Message);
+                var buffer = new MemoryStream();
+                using (var stdin = Console.OpenStandardInput())
+                {
+                    stdin.CopyTo(buffer);
+                }
+                buffer.Position = 0;
+                return buffer.AsRandomAccessStream();
             }
+
+            var file = Await(StorageFile.GetFileFromPathAsync(Path.GetFullPath(imagePath)));
+            return Await(file.OpenAsync(FileAccessMode.Read));
         }
 
         // Helper to await WinRT async operations synchronously
@@ -1,6 +1,7 @@
 
 import sys
 import asyncio
+import struct
 from pathlib import Path
 
 # Try to import winsdk
@@ -8,54 +9,100 @@ try:
     from winsdk.windows.media.ocr import OcrEngine
     from winsdk.windows.graphics.imaging import BitmapDecoder, SoftwareBitmap
     from winsdk.windows.storage import StorageFile, FileAccessMode
-    from winsdk.windows.storage.streams import IRandomAccessStream
+    from winsdk.windows.storage.streams import IRandomAccessStream, InMemoryRandomAccessStream, DataWriter
     from winsdk.windows.globalization import Language
 except ImportError:
     print("Error: winsdk not installed. Please pip install winsdk")
     sys.exit(1)
 
+# Printed after each result in --serve mode so the client knows the response is complete (same as ocr.cs)
+END_MARKER = "::OCR-END::"
+
+def create_engine():
+    # Try English first
+    lang = Language("en-US")
+    engine = None
+    if OcrEngine.is_language_supported(lang):
+         engine = OcrEngine.try_create_from_language(lang)
+
+    if not engine:
+         engine = OcrEngine.try_create_from_user_profile_languages()
+    return engine
+
+async def recognize(engine, stream):
+    # Decode
+    decoder = await BitmapDecoder.create_async(stream)
+    # OcrEngine requires input to be less than MaxImageDimension?
+    # Usually fine for 1080p.
+
+    soft_bmp = await decoder.get_software_bitmap_async()
+
+    # Recognize
+    result = await engine.recognize_async(soft_bmp)
+
+    # Print
+    if result and result.lines:
+        for line in result.lines:
+            print(line.text)
+
 async def run_ocr(image_path):
     try:
         # Load File
         file = await StorageFile.get_file_from_path_async(str(Path(image_path).resolve()))
         stream = await file.open_async(FileAccessMode.READ)
-        
-        # Decode
-        decoder = await BitmapDecoder.create_async(stream)
-        # OcrEngine requires input to be less than MaxImageDimension?
-        # Usually fine for 1080p.
-        
-        soft_bmp = await decoder.get_software_bitmap_async()
-        
+
         # Create Engine
-        # Try English first
-        lang = Language("en-US")
-        engine = None
-        if OcrEngine.is_language_supported(lang):
-             engine = OcrEngine.try_create_from_language(lang)
-        
-        if not engine:
-             engine = OcrEngine.try_create_from_user_profile_languages()
-             
+        engine = create_engine()
         if not engine:
             print("Error: Could not create OCR Engine.")
             return
 
-        # Recognize
-        result = await engine.recognize_async(soft_bmp)
-        
-        # Print
-        if result and result.lines:
-            for line in result.lines:
-                print(line.text)
-        
+        await recognize(engine, stream)
+
     except Exception as e:
         print(f"Error: {e}")
 
+async def serve():
+    """
+    Keep one engine resident and OCR PNG frames from stdin until EOF or a zero length.
+    Each frame is a little-endian uint32 byte count followed by the PNG bytes.
+    """
+    engine = create_engine()
+    if not engine:
+        print("Error: Could not create OCR Engine.")
+        return
+
+    stdin = sys.stdin.buffer
+    while True:
+        header = stdin.read(4)
+        if len(header) < 4:
+            return
+        (length,) = struct.unpack("<I", header)
+        if length == 0:
+            return
+        png = stdin.read(length)
+        if len(png) < length:
+            return
+
+        try:
+            stream = InMemoryRandomAccessStream()
+            writer = DataWriter(stream)
+            writer.write_bytes(png)
+            await writer.store_async()
+            writer.detach_stream()
+            stream.seek(0)
+            await recognize(engine, stream)
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+        print(END_MARKER, flush=True)
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python ocr.py <image_path>")
+        print("Usage: python ocr.py <image_path | --serve>")
         sys.exit(1)
-        
+
     path = sys.argv[1]
-    asyncio.run(run_ocr(path))
+    if path == "--serve":
+        asyncio.run(serve())
+    else:
+        asyncio.run(run_ocr(path))
@@ -1,8 +1,14 @@
 
 param (
-    [string]$ImagePath
+    [string]$ImagePath,
+    # Long-lived mode: read <uint32 LE length><PNG bytes> frames from stdin,
+    # answer each with its text followed by the end marker line.
+    [switch]$Serve
 )
 
+$EndMarker = "::OCR-END::"
+
+# Diagnostics go to stderr: in -Serve mode stdout carries only recognized lines and the end marker
 # Bridge to handle COM object opaque types using dynamic
 try {
     Add-Type -TypeDefinition @"
@@ -28,7 +34,7 @@ try {
                      try { count = lines.Size; } catch {}
                 }
                 
-                Console.WriteLine("BRIDGE: Found " + count + " lines.");
+                Console.Error.WriteLine("BRIDGE: Found " + count + " lines.");
                 
                 for (int i = 0; i < count; i++) {
                     try {
@@ -42,22 +48,25 @@ try {
                             dynamic line = lines.GetAt((uint)i);
                             Console.WriteLine(line.Text);
                          } catch (Exception ex) {
-                            Console.WriteLine("BRIDGE: Error at " + i + ": " + ex.Message);
+                            Console.Error.WriteLine("BRIDGE: Error at " + i + ": " + ex.Message);
                          }
                     }
                 }
             } catch (Exception e) {
-                Console.WriteLine("BRIDGE: Global Error: " + e.Message);
+                Console.Error.WriteLine("BRIDGE: Global Error: " + e.Message);
             }
         }
     }
 "@ -Language CSharp
 }
 catch {
-    Write-Host "DEBUG: Failed to add type: $_"
+    [Console]::Error.WriteLine("DEBUG: Failed to add type: $_")
 }
 
-if (-not (Test-Path $ImagePath)) {
+# "-" = PNG bytes piped on stdin
+$FromStdin = ($ImagePath -eq "-")
+
+if (-not $Serve -and -not $FromStdin -and -not (Test-Path $ImagePath)) {
     Write-Error "File not found: $ImagePath"
     exit 1
 }
@@ -88,12 +97,12 @@ try {
     
     if ([Windows.Media.Ocr.OcrEngine]::IsLanguageSupported($lang)) {
         $ocrEngine = [Windows.Media.Ocr.OcrEngine]::TryCreateFromLanguage($lang)
-        Write-Host "DEBUG: Created OCR Engine with English (en-US)"
+        [Console]::Error.WriteLine("DEBUG: Created OCR Engine with English (en-US)")
     }
 
     if ($null -eq $ocrEngine) {
         $ocrEngine = [Windows.Media.Ocr.OcrEngine]::TryCreateFromUserProfileLanguages()
-        Write-Host "DEBUG: Created OCR Engine from User Profile: $($ocrEngine.RecognizerLanguage.DisplayName)"
+        [Console]::Error.WriteLine("DEBUG: Created OCR Engine from User Profile: $($ocrEngine.RecognizerLanguage.DisplayName)")
     }
     
     if ($null -eq $ocrEngine) {
@@ -101,43 +110,84 @@ try {
         exit 0
     }
 
-    # Load file
-    $path = [System.IO.Path]::GetFullPath($ImagePath)
-    $fileTask = [Windows.Storage.StorageFile]::GetFileFromPathAsync($path)
-    $storageFile = Await $fileTask ([Windows.Storage.StorageFile])
+    Function Invoke-Ocr($stream) {
+        # Create Decoder
+        $decoderTask = [Windows.Graphics.Imaging.BitmapDecoder]::CreateAsync($stream)
+        $decoder = Await $decoderTask ([Windows.Graphics.Imaging.BitmapDecoder])
+
+        [Console]::Error.WriteLine("DEBUG: Image Decoded. Size: $($decoder.PixelWidth)x$($decoder.PixelHeight)")
+
+        # Get SoftwareBitmap
+        $bitmapTask = $decoder.GetSoftwareBitmapAsync()
+        $bitmap = Await $bitmapTask ([Windows.Graphics.Imaging.SoftwareBitmap])
+
+        # Recognize
+        $ocrTask = $ocrEngine.RecognizeAsync($bitmap)
+        $result = Await $ocrTask ([Windows.Media.Ocr.OcrResult])
+
+        if ($null -eq $result) {
+            [Console]::Error.WriteLine("DEBUG: OCR Result is null")
+        }
+        else {
+            $lines = $result.Lines
+            if ($null -eq $lines) {
+                [Console]::Error.WriteLine("DEBUG: Lines collection is null")
+            }
+            else {
+                # Offload to C# Bridge
+                [OcrBridge]::PrintLines($lines)
+            }
+        }
+    }
 
-    # Open stream
-    $streamTask = $storageFile.OpenAsync([Windows.Storage.FileAccessMode]::Read)
-    $stream = Await $streamTask ([Windows.Storage.Streams.IRandomAccessStream])
+    if ($Serve) {
+        $stdin = New-Object System.IO.BinaryReader([Console]::OpenStandardInput())
+        while ($true) {
+            $header = $stdin.ReadBytes(4)
+            if ($header.Length -lt 4) { break }
 
-    # Create Decoder
-    $decoderTask = [Windows.Graphics.Imaging.BitmapDecoder]::CreateAsync($stream)
-    $decoder = Await $decoderTask ([Windows.Graphics.Imaging.BitmapDecoder])
+            $length = [BitConverter]::ToUInt32($header, 0)
+            if ($length -eq 0) { break }
 
-    Write-Host "DEBUG: Image Decoded. Size: $($decoder.PixelWidth)x$($decoder.PixelHeight)"
+            $png = $stdin.ReadBytes([int]$length)
+            if ($png.Length -lt $length) { break }
 
-    # Get SoftwareBitmap
-    $bitmapTask = $decoder.GetSoftwareBitmapAsync()
-    $bitmap = Await $bitmapTask ([Windows.Graphics.Imaging.SoftwareBitmap])
+            try {
+                $buffer = New-Object System.IO.MemoryStream(, $png)
+                Invoke-Ocr ([System.IO.WindowsRuntimeStreamExtensions]::AsRandomAccessStream($buffer))
+            }
+            catch {
+                [Console]::Error.WriteLine("Error: $_")
+            }
 
-    # Recognize
-    $ocrTask = $ocrEngine.RecognizeAsync($bitmap)
-    $result = Await $ocrTask ([Windows.Media.Ocr.OcrResult])
+            [Console]::WriteLine($EndMarker)
+            [Console]::Out.Flush()
+        }
+        exit 0
+    }
 
-    if ($null -eq $result) {
-        Write-Host "DEBUG: OCR Result is null"
+    if ($FromStdin) {
+        # Read stdin into memory
+        $buffer = New-Object System.IO.MemoryStream
+        $stdin = [Console]::OpenStandardInput()
+        $stdin.CopyTo($buffer)
+        $stdin.Dispose()
+        $buffer.Position = 0
+        $stream = [System.IO.WindowsRuntimeStreamExtensions]::AsRandomAccessStream($buffer)
     }
     else {
-        $lines = $result.Lines
-        if ($null -eq $lines) {
-            Write-Host "DEBUG: Lines collection is null"
-        }
-        else {
-            # Offload to C# Bridge
-            [OcrBridge]::PrintLines($lines)
-        }
+        # Load file
+        $path = [System.IO.Path]::GetFullPath($ImagePath)
+        $fileTask = [Windows.Storage.StorageFile]::GetFileFromPathAsync($path)
+        $storageFile = Await $fileTask ([Windows.Storage.StorageFile])
+
+        # Open stream
+        $streamTask = $storageFile.OpenAsync([Windows.Storage.FileAccessMode]::Read)
+        $stream = Await $streamTask ([Windows.Storage.Streams.IRandomAccessStream])
     }
 
+    Invoke-Ocr $stream
+
 }
 catch {
     Write-Error "OCR Error: $_"
@@ -8,21 +8,23 @@ import sys
 import os
 import ctypes
 from ctypes import wintypes
+from functools import lru_cache
+from typing import Optional
 
-from datetime import datetime
-from PyQt6.QtWidgets import QApplication, QTableWidgetItem, QHeaderView, QSystemTrayIcon, QMenu, QWidget, QHBoxLayout, QVBoxLayout, QSpacerItem, QSizePolicy, QAbstractItemView
+from datetime import datetime, timedelta
+from PyQt6.QtWidgets import QApplication, QHeaderView, QSystemTrayIcon, QMenu, QWidget, QHBoxLayout, QVBoxLayout, QSpacerItem, QSizePolicy, QAbstractItemView
 from PyQt6.QtCore import Qt, QTimer, QEvent
 from PyQt6.QtGui import QIcon, QAction
 
 # Ensure QApplication exists before importing qfluentwidgets
-# This prevents "Must construct a QApplication before a QWidget" error
+# This prevents "Must construct a QApplication before a QWidget" error.
+# main() runs this same instance instead of constructing a second one.
 if not QApplication.instance():
-    # Create a temporary QApplication for imports
-    _temp_app = QApplication(sys.argv)
+    _app = QApplication(sys.argv)
 
 from qfluentwidgets import (
     FluentWindow,
-    TableWidget,
+    TableView,
     PushButton,
     setTheme,
     Theme,
@@ -36,29 +38,67 @@ from qfluentwidgets import (
     qconfig
 )
 
-from task_manager import TaskManager, SettingsManager
+from task_manager import TaskManager, SettingsManager, Recurrence
 from theme_manager import ThemeManager
 from task_dialog import TaskDialog
-from scheduler import TaskScheduler
+from scheduler import TaskScheduler, JobSnapshot
 from settings_interface import SettingsInterface
 from addon_view import AddonView
 from about_interface import AboutInterface
 from update_manager import UpdateManager
 from language_manager import get_text, get_language_manager
-from widgets.status_badge import StatusBadge
-from widgets.status_badge import StatusBadge
+from widgets.status_badge import StatusBadgeDelegate
+from widgets.task_table_model import TaskTableModel
+from widgets.lazy_interface import LazyInterface
 from logger import get_logger
 from config import (
     APP_NAME,
     DEFAULT_WINDOW_WIDTH,
     DEFAULT_WINDOW_HEIGHT,
-    TIMER_UPDATE_INTERVAL,
+    COUNTDOWN_IDLE_INTERVAL,
     WINDOW_ICON_PATH,
     TRAY_ICON_PATH
 )
 
 logger = get_logger(__name__)
 
+# Emoji prefix per recurrence type in the schedule column, indexed by Recurrence
+_RECURRENCE_EMOJIS = ('📅', '🔄', '📆', '🗓️')
+
+# 'date_format' setting -> strftime format for one-off schedules
+_DATE_FMT_MAP = {
+    'YYYY-MM-DD': '%Y-%m-%d',
+    'DD.MM.YYYY': '%d.%m.%Y',
+    'MM/DD/YYYY': '%m/%d/%Y',
+    'DD-MM-YYYY': '%d-%m-%Y'
+}
+
+# Toolbar buttons in layout order: (attribute, icon, text key, slot method name)
+_TOOLBAR_BUTTONS = (
+    ('addButton', FluentIcon.ADD, 'main_window.add_task', '_add_task'),
+    ('editButton', FluentIcon.EDIT, 'main_window.edit_task', '_edit_task'),
+    ('deleteButton', FluentIcon.DELETE, 'main_window.delete_task', '_delete_task'),
+    ('runNowButton', FluentIcon.PLAY, 'main_window.run_now', '_run_now'),
+    ('pauseResumeButton', FluentIcon.PAUSE, 'main_window.pause_resume', '_toggle_task_pause'),
+    ('viewLogButton', FluentIcon.HISTORY, 'main_window.view_log', '_show_execution_log'),
+    ('themeButton', FluentIcon.CONSTRACT, 'main_window.toggle_theme', '_toggle_theme'),
+)
+
+# Initial task table column widths: name, path, schedule (with emoji),
+# countdown (with emoji), status (centered badge)
+_DEFAULT_COLUMN_WIDTHS = (150, 300, 200, 160, 120)
+
+
+# Refreshes walk every task in order, and an LRU smaller than the task list misses on
+# every call under that access pattern, so leave ample headroom
+@lru_cache(maxsize=1024)
+def _parse_schedule_time(value) -> Optional[datetime]:
+    """Parse a task's ISO schedule_time once per distinct string; None if missing or malformed."""
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
 
 class AutolauncherApp(FluentWindow):
     """
@@ -77,6 +117,13 @@ class AutolauncherApp(FluentWindow):
         self.task_manager = controller.task_manager
         self.scheduler = controller.scheduler
         self.update_manager = controller.update_manager
+        self.notified_versions = set()  # Versions already announced by this window
+        self._latest_update_info = None  # Shown on the About page once it is built
+        
+        # Update notification bar, reused while it is still on screen
+        self._update_info_bar = None
+        self._update_info_bar_button = None
+        self._update_info_bar_action = None
         
         # NOTE: Theme is already applied by MainController at this point
         
@@ -117,10 +164,15 @@ class AutolauncherApp(FluentWindow):
         # Reload UI text after creation to ensure correct language
         QTimer.singleShot(100, self.reload_ui_text)
         
-        # Setup countdown timer
+        # Setup countdown timer (coarse: no high-resolution system timer needed)
+        # It only runs while the task list is actually on screen, and each tick is
+        # re-armed for the moment the next visible countdown text changes
         self.countdown_timer = QTimer(self)
+        self.countdown_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.countdown_timer.setSingleShot(True)
         self.countdown_timer.timeout.connect(self._update_countdowns)
-        self.countdown_timer.start(TIMER_UPDATE_INTERVAL)
+        self.stackedWidget.currentChanged.connect(self._sync_countdown_timer)
+        self._sync_countdown_timer()
         
         logger.info("Autolauncher application initialized")
         
@@ -181,8 +233,9 @@ class AutolauncherApp(FluentWindow):
         """Handle when an update is available."""
         version = update_info['version']
         
-        # Update the About interface dashboard
-        if hasattr(self, 'aboutInterface') and hasattr(self.aboutInterface, 'dashboard'):
+        # Update the About interface dashboard (or let it pick the info up when first built)
+        self._latest_update_info = update_info
+        if hasattr(self, '_aboutPage') and self._aboutPage.is_created():
             self.aboutInterface.dashboard.show_update_available(update_info)
             
         # SPAM PREVENTION: Check if we already notified about this version
@@ -212,18 +265,14 @@ class AutolauncherApp(FluentWindow):
                         logger.info(f"Smart Update: Postponed. Next task in {delta.total_seconds()/60:.1f} mins")
                         
                         # Show notification that update is postponed
-                        info_bar = InfoBar.info(
+                        self._show_update_info_bar(
+                            InfoBar.info,
                             title=f"Update Available: v{version}",
                             content=f"Will install after tasks complete. Click to view details.",
-                            orient=Qt.Orientation.Horizontal,
-                            isClosable=True,
-                            position=InfoBarPosition.TOP,
-                            duration=-1,  # Persistent
-                            parent=self
+                            button_text="View Details",
+                            action=self._navigate_to_about_for_update,
+                            duration=-1  # Persistent
                         )
-                        view_button = PushButton("View Details")
-                        view_button.clicked.connect(lambda: self._navigate_to_about_for_update())
-                        info_bar.addWidget(view_button)
                         return
                 
                 if should_install:
@@ -257,23 +306,15 @@ class AutolauncherApp(FluentWindow):
         # For Python script mode, just show notification and open browser
         # For Python script mode, just show notification AND button to open browser
         if not self.update_manager.is_executable:
-            info_bar = InfoBar.info(
+            # Button opens the release page via update_manager helper
+            self._show_update_info_bar(
+                InfoBar.info,
                 title=f"Update Available: v{version}",
                 content="New version available. Click to view on GitHub.",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=5000, # Show for 5 seconds as requested
-                parent=self
+                button_text="View Release",
+                action=lambda: self.update_manager.open_download_page(update_info['url']),
+                duration=5000  # Show for 5 seconds as requested
             )
-            
-            # Create button to open link
-            view_btn = PushButton("View Release")
-            view_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            # Use default webbrowser module directly or via update_manager helper
-            view_btn.clicked.connect(lambda: self.update_manager.open_download_page(update_info['url']))
-            
-            info_bar.addWidget(view_btn)
             return
         
         # For executable mode (Manual/Startup modes), show notification with action to navigate to About page
@@ -281,42 +322,79 @@ class AutolauncherApp(FluentWindow):
         if not zip_asset:
             logger.warning("No update package found in release")
             # Still show notification to inform user
-            info_bar = InfoBar.info(
+            self._show_update_info_bar(
+                InfoBar.info,
                 title=f"Update Available: v{version}",
                 content="Visit the About page to learn more",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=-1,  # Persistent
-                parent=self
+                button_text="View Details",
+                action=self._navigate_to_about_for_update,
+                duration=-1  # Persistent
             )
-            # Add action button to navigate to About page
-            info_bar.addWidget(PushButton("View Details"))
-            info_bar.widget.clicked.connect(lambda: self.stackedWidget.setCurrentWidget(self.aboutInterface))
             return
 
         
         # Show prominent notification with action to view in About page
-        info_bar = InfoBar.success(
+        self._show_update_info_bar(
+            InfoBar.success,
             title=f"Update Available: v{version}",
             content="A new version is ready. Click 'View Details' to update.",
+            button_text="View Details",
+            action=self._navigate_to_about_for_update,
+            duration=5000  # Transient notification (5s) to avoid blocking screen
+        )
+        
+        logger.info(f"Showed update notification for v{version}")
+    
+    def _show_update_info_bar(self, factory, title: str, content: str, button_text: str, action, duration: int):
+        """
+        Show the update notification with one action button.
+        While a previous update bar is still open it is retargeted in place
+        instead of stacking a new bar, button and connection on top of it.
+        """
+        self._update_info_bar_action = action
+        
+        if self._update_info_bar is not None:
+            bar = self._update_info_bar
+            bar.title, bar.content = title, content
+            bar.titleLabel.setText(title)
+            bar.contentLabel.setText(content)
+            self._update_info_bar_button.setText(button_text)
+            bar.titleLabel.setVisible(bool(title))
+            bar.contentLabel.setVisible(bool(content))
+            bar.adjustSize()
+            return
+        
+        bar = factory(
+            title=title,
+            content=content,
             orient=Qt.Orientation.Horizontal,
             isClosable=True,
             position=InfoBarPosition.TOP,
-            duration=5000, # Transient notification (5s) to avoid blocking screen
+            duration=duration,
             parent=self
         )
-        
-        # Add action button to navigate to About page
-        view_button = PushButton("View Details")
-        view_button.clicked.connect(lambda: self._navigate_to_about_for_update())
-        info_bar.addWidget(view_button)
-        
-        logger.info(f"Showed update notification for v{version}")
+        button = PushButton(button_text)
+        button.setCursor(Qt.CursorShape.PointingHandCursor)
+        button.clicked.connect(self._on_update_info_bar_clicked)
+        bar.addWidget(button)
+        bar.closedSignal.connect(self._on_update_info_bar_closed)
+        self._update_info_bar = bar
+        self._update_info_bar_button = button
+    
+    def _on_update_info_bar_clicked(self):
+        """Run the action of the notification currently shown in the update bar."""
+        if self._update_info_bar_action:
+            self._update_info_bar_action()
+    
+    def _on_update_info_bar_closed(self):
+        """Forget the update bar once it has been dismissed or timed out."""
+        self._update_info_bar = None
+        self._update_info_bar_button = None
+        self._update_info_bar_action = None
     
     def _navigate_to_about_for_update(self):
         """Navigate to the About page (helper for update notifications)."""
-        self.stackedWidget.setCurrentWidget(self.aboutInterface)
+        self.stackedWidget.setCurrentWidget(self._aboutPage)
         logger.debug("Navigated to About page for update")
 
     
@@ -338,9 +416,11 @@ class AutolauncherApp(FluentWindow):
                 parent=self
             )
             
-            # Setup monitor to check when tasks complete
-            self.restart_check_timer = QTimer(self)
-            self.restart_check_timer.timeout.connect(self._check_and_install_update)
+            # Setup monitor to check when tasks complete (created once, restarted on later downloads)
+            if not hasattr(self, 'restart_check_timer'):
+                self.restart_check_timer = QTimer(self)
+                self.restart_check_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+                self.restart_check_timer.timeout.connect(self._check_and_install_update)
             self.restart_check_timer.start(30000)  # Check every 30 seconds
         else:
             # No tasks running, install immediately with countdown
@@ -402,13 +482,8 @@ class AutolauncherApp(FluentWindow):
         self.setWindowTitle(f"{get_text('main_window.title')} (Beta v{version})")
         
         # Toolbar Buttons
-        self.addButton.setText(get_text('main_window.add_task'))
-        self.editButton.setText(get_text('main_window.edit_task'))
-        self.deleteButton.setText(get_text('main_window.delete_task'))
-        self.runNowButton.setText(get_text('main_window.run_now'))
-        self.pauseResumeButton.setText(get_text('main_window.pause_resume'))
-        self.viewLogButton.setText(get_text('main_window.view_log'))
-        self.themeButton.setText(get_text('main_window.toggle_theme'))
+        for attr, _icon, text_key, _slot in _TOOLBAR_BUTTONS:
+            getattr(self, attr).setText(get_text(text_key))
         
         # Navigation Items
         if hasattr(self, 'tasksInterface'):
@@ -418,21 +493,18 @@ class AutolauncherApp(FluentWindow):
         if hasattr(self, 'settingsItem'):
             self.settingsItem.setText(get_text('main_window.settings'))
 
-        # Table Headers
-        self.columns = [
-            get_text('main_window.col_name'),
-            get_text('main_window.col_path'),
-            get_text('main_window.col_schedule'),
-            get_text('main_window.col_countdown'),
-            get_text('main_window.col_status')
-        ]
-        self.taskTable.setHorizontalHeaderLabels(self.columns)
+        # Table Headers (only depend on the language)
+        self._update_column_headers()
+        
+        # Badge and fixed countdown texts are localized
+        self.statusDelegate.clear_style_cache()
+        self._update_countdown_texts()
         
         # Refresh table content
         self._refresh_task_table()
         
-        # Reload About Interface
-        if hasattr(self, 'aboutInterface'):
+        # Reload About Interface (a page not built yet picks up the language when it is)
+        if hasattr(self, '_aboutPage') and self._aboutPage.is_created():
             self.aboutInterface.reload_ui_text()
         
         logger.debug("Main window UI text reloaded")
@@ -460,21 +532,49 @@ class AutolauncherApp(FluentWindow):
         # Create main interface
         self._create_main_widget()
         
-        # Create settings interface
-        self.settingsInterface = SettingsInterface(self.settings_manager, self)
-        self.settingsInterface.date_format_changed.connect(self._refresh_task_table)
-        self.settingsInterface.language_changed.connect(self.reload_ui_text)
+        # Settings and About pages are built on first navigation (see LazyInterface)
+        self._settingsPage = LazyInterface("settingsInterface", self._create_settings_interface, self)
         
         # Create Addon View
         self.addonInterface = AddonView(self)
         
-        # Create about interface
-        self.aboutInterface = AboutInterface(self)
+        self._aboutPage = LazyInterface("aboutInterface", self._create_about_interface, self)
         
         self._create_navigation()
+        self.stackedWidget.currentChanged.connect(self._on_page_changed)
         
         logger.debug("UI initialized")
     
+    def _create_settings_interface(self, parent):
+        """Build the settings page and wire its signals."""
+        interface = SettingsInterface(self.settings_manager, parent)
+        interface.date_format_changed.connect(self._refresh_task_table)
+        interface.language_changed.connect(self.reload_ui_text)
+        return interface
+    
+    def _create_about_interface(self, parent):
+        """Build the About page, showing an update found before it existed."""
+        interface = AboutInterface(parent)
+        if self._latest_update_info:
+            interface.dashboard.show_update_available(self._latest_update_info)
+        return interface
+    
+    @property
+    def settingsInterface(self):
+        """The settings page (built on first access)."""
+        return self._settingsPage.content()
+    
+    @property
+    def aboutInterface(self):
+        """The About page (built on first access)."""
+        return self._aboutPage.content()
+    
+    def _on_page_changed(self, index: int):
+        """Build a lazily created page the first time it is navigated to."""
+        page = self.stackedWidget.currentWidget()
+        if isinstance(page, LazyInterface):
+            page.content()
+    
     def _create_navigation(self):
         """Create navigation interface with theme toggle."""
         
@@ -496,14 +596,14 @@ class AutolauncherApp(FluentWindow):
         )
         
         self.aboutItem = self.addSubInterface(
-            self.aboutInterface,
+            self._aboutPage,
             FluentIcon.INFO,
             get_text('main_window.about'),
             position=NavigationItemPosition.BOTTOM
         )
         
         self.settingsItem = self.addSubInterface(
-            self.settingsInterface,
+            self._settingsPage,
             FluentIcon.SETTING,
             get_text('main_window.settings'),
             position=NavigationItemPosition.BOTTOM
@@ -533,36 +633,13 @@ class AutolauncherApp(FluentWindow):
         self.toolbarLayout.setSpacing(10)
         
         
-        # Create buttons
-        # Create buttons
-        self.addButton = PushButton(FluentIcon.ADD, get_text('main_window.add_task'), self)
-        self.addButton.clicked.connect(self._add_task)
-        
-        self.editButton = PushButton(FluentIcon.EDIT, get_text('main_window.edit_task'), self)
-        self.editButton.clicked.connect(self._edit_task)
-        
-        self.deleteButton = PushButton(FluentIcon.DELETE, get_text('main_window.delete_task'), self)
-        self.deleteButton.clicked.connect(self._delete_task)
-        
-        self.runNowButton = PushButton(FluentIcon.PLAY, get_text('main_window.run_now'), self)
-        self.runNowButton.clicked.connect(self._run_now)
-        
-        self.pauseResumeButton = PushButton(FluentIcon.PAUSE, get_text('main_window.pause_resume'), self)
-        self.pauseResumeButton.clicked.connect(self._toggle_task_pause)
-        
-        self.viewLogButton = PushButton(FluentIcon.HISTORY, get_text('main_window.view_log'), self)
-        self.viewLogButton.clicked.connect(self._show_execution_log)
-        
-        self.themeButton = PushButton(FluentIcon.CONSTRACT, get_text('main_window.toggle_theme'), self)
-        self.themeButton.clicked.connect(self._toggle_theme)
-        
-        # Add buttons to toolbar
-        self.toolbarLayout.addWidget(self.addButton)
-        self.toolbarLayout.addWidget(self.editButton)
-        self.toolbarLayout.addWidget(self.deleteButton)
-        self.toolbarLayout.addWidget(self.runNowButton)
-        self.toolbarLayout.addWidget(self.pauseResumeButton)
-        self.toolbarLayout.addWidget(self.viewLogButton)
+        # Create buttons (the theme button is placed after the addon indicators)
+        for attr, icon, text_key, slot in _TOOLBAR_BUTTONS:
+            button = PushButton(icon, get_text(text_key), self)
+            button.clicked.connect(getattr(self, slot))
+            setattr(self, attr, button)
+            if attr != 'themeButton':
+                self.toolbarLayout.addWidget(button)
         self.toolbarLayout.addSpacerItem(QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
         
         self.toolbarLayout.addSpacerItem(QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
@@ -583,42 +660,52 @@ class AutolauncherApp(FluentWindow):
         
         self.toolbarLayout.addWidget(self.themeButton)
         
-        # Create task table
-        self.taskTable = TableWidget(self)
+        # Create task table (view over TaskTableModel; cells are only queried when painted)
+        self.taskTable = TableView(self)
+        self.taskModel = TaskTableModel(self)
+        self._schedule_cache = {}  # (schedule_time, recurrence, date format) -> schedule string
+        self._icon_cache = {}  # program_path -> QIcon (or None if extraction failed)
+        self._task_rows = {}  # task_id -> table row, rebuilt on every full refresh
+        self._update_countdown_texts()
         
         # Define columns
-        # Define columns
-        self.columns = [
-            get_text('main_window.col_name'),
-            get_text('main_window.col_path'),
-            get_text('main_window.col_schedule'),
-            get_text('main_window.col_countdown'),
-            get_text('main_window.col_status')
-        ]
-        self.taskTable.setColumnCount(len(self.columns))
-        self.taskTable.setHorizontalHeaderLabels(self.columns)
+        self._header_language = None  # Language the column headers were last built for
+        self._update_column_headers()
+        self.taskTable.setModel(self.taskModel)
+        
+        # Status badges are painted by a delegate rather than a widget per row
+        self.statusDelegate = StatusBadgeDelegate(self.taskTable, TaskTableModel.COL_STATUS, TaskTableModel.STATUS_ROLE)
+        self.taskTable.setItemDelegateForColumn(TaskTableModel.COL_STATUS, self.statusDelegate)
         
         # Configure table properties
         self.taskTable.verticalHeader().setVisible(False)
+        # Fixed row height: no per-row size hint queries
+        self.taskTable.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.taskTable.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.taskTable.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.taskTable.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         
-        # Set column resize modes
+        # Smooth scrolling instead of jumping a whole row per step
+        self.taskTable.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.taskTable.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        
+        # Set column resize modes (user-resizable, never measured from contents)
         header = self.taskTable.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         
         # Set default column widths
-        self.taskTable.setColumnWidth(0, 150)  # Task Name
-        self.taskTable.setColumnWidth(1, 300)  # Program Path
-        self.taskTable.setColumnWidth(2, 200)  # Schedule (with emoji)
-        self.taskTable.setColumnWidth(3, 160)  # Countdown (with emoji)
-        self.taskTable.setColumnWidth(4, 120)  # Status (centered badge)
+        for column, width in enumerate(_DEFAULT_COLUMN_WIDTHS):
+            header.resizeSection(column, width)
         
-        header.setStretchLastSection(True)
+        # Status column takes the remaining width
+        header.setSectionResizeMode(TaskTableModel.COL_STATUS, QHeaderView.ResizeMode.Stretch)
         
         # Connect double-click to edit task
-        self.taskTable.cellDoubleClicked.connect(self._on_task_double_clicked)
+        self.taskTable.doubleClicked.connect(self._on_task_double_clicked)
+        
+        # Countdowns are only ticked for visible rows; catch up rows as they scroll in.
+        # Re-arming the countdown timer at 0 ms runs one update per event-loop pass, not one per pixel
+        self.taskTable.verticalScrollBar().valueChanged.connect(lambda _value: self._arm_countdown_timer(0))
         
         # Add toolbar and table to main layout
         self.mainLayout.addWidget(self.toolbar)
@@ -627,227 +714,307 @@ class AutolauncherApp(FluentWindow):
         # Load tasks into table
         self._refresh_task_table()
     
+    def _update_column_headers(self):
+        """Set translated column headers, unless they are already in the current language."""
+        language = get_language_manager().current_language
+        if language == self._header_language:
+            return
+        self._header_language = language
+        self.columns = [
+            get_text('main_window.col_name'),
+            get_text('main_window.col_path'),
+            get_text('main_window.col_schedule'),
+            get_text('main_window.col_countdown'),
+            get_text('main_window.col_status')
+        ]
+        self.taskModel.set_headers(self.columns)
+    
+    def _update_countdown_texts(self):
+        """Translate the fixed countdown texts once per language instead of once per row."""
+        self._countdown_expired_text = f"❌ {get_text('main_window.status_expired')}"
+        self._countdown_paused_text = f"⏸️ {get_text('main_window.status_paused')}"
+        self._countdown_error_text = get_text('main_window.status_error')
+    
     def _refresh_task_table(self):
         """Refresh the task table with current data."""
         
         tasks = self.task_manager.get_all_tasks()
-        self.taskTable.setRowCount(len(tasks))
-        
-        for row, task in enumerate(tasks):
-            # Task Name with Icon
-            task_name = task.get('name', '')
-            name_item = QTableWidgetItem(task_name)
-            
-            # Try to load and set icon
-            try:
-                from icon_extractor import extract_icon_from_path
-                program_path = task.get('program_path', '')
-                icon_path = extract_icon_from_path(program_path)
-                if icon_path and os.path.exists(icon_path):
-                    name_item.setIcon(QIcon(icon_path))
-            except Exception as e:
-                logger.debug(f"Could not load icon for task: {e}")
-            
-            self.taskTable.setItem(row, 0, name_item)
-            
-            # Program Path
-            self.taskTable.setItem(row, 1, QTableWidgetItem(task.get('program_path', '')))
-            
-            # Schedule
-            try:
-                schedule_time = datetime.fromisoformat(task.get('schedule_time'))
-                recurrence = task.get('recurrence', 'Once')
-                
-                # Emoji mapping for recurrence types
-                recurrence_emojis = {
-                    'Once': '📅',
-                    'Daily': '🔄',
-                    'Weekly': '📆',
-                    'Monthly': '🗓️'
-                }
-                emoji = recurrence_emojis.get(recurrence, '📅')
-                
-                if recurrence == 'Once':
-                    # Get date format from settings
-                    date_fmt_setting = self.settings_manager.get('date_format', 'YYYY-MM-DD')
-                    
-                    # Map setting to strftime format
-                    fmt_map = {
-                        'YYYY-MM-DD': '%Y-%m-%d',
-                        'DD.MM.YYYY': '%d.%m.%Y',
-                        'MM/DD/YYYY': '%m/%d/%Y',
-                        'DD-MM-YYYY': '%d-%m-%Y'
-                    }
-                    date_fmt = fmt_map.get(date_fmt_setting, '%Y-%m-%d')
-                    
-                    schedule_str = f"{emoji} {schedule_time.strftime(f'{date_fmt} %H:%M')}"
-                else:
-                    # For recurring tasks, show the pattern and time
-                    time_str = schedule_time.strftime('%H:%M')
-                    schedule_str = f"{emoji} {recurrence} @ {time_str}"
-                    
-            except:
-                schedule_str = "Invalid"
-            self.taskTable.setItem(row, 2, QTableWidgetItem(schedule_str))
-            
+        date_fmt_setting = self.settings_manager.get('date_format', 'YYYY-MM-DD')
+        snapshot = self._job_snapshot()
+        now = datetime.now()
+        
+        schedules = []
+        countdowns = []
+        icons = []
+        statuses = []
+        next_change = COUNTDOWN_IDLE_INTERVAL
+        for task in tasks:
+            icons.append(self._task_icon(task))
+            schedules.append(self._format_schedule(task, date_fmt_setting))
             # Countdown (will be updated by timer)
-            self.taskTable.setItem(row, 3, QTableWidgetItem(self._calculate_countdown(task)))
+            countdowns.append(self._calculate_countdown(task, snapshot))
+            next_change = min(next_change, self._countdown_change_in(task, snapshot))
+            # Status Badge - painted by the status column delegate
+            statuses.append(self._task_status(task, snapshot, now))
+        
+        # Suspend painting while the model resets and the pulse state changes, so the
+        # view repaints once. The table never enables sorting, so there is no re-sort pass.
+        # Countdown ticks are deliberately not wrapped: re-enabling updates repaints the
+        # whole viewport, which would undo set_countdowns() touching only changed cells.
+        self._task_rows = {task.get('id'): row for row, task in enumerate(tasks)}
+        self.taskTable.setUpdatesEnabled(False)
+        try:
+            self.taskModel.set_tasks(tasks, schedules, countdowns, icons, statuses)
+            self.statusDelegate.set_pulsing(any(status == "Running" for status, _ in statuses))
+        finally:
+            self.taskTable.setUpdatesEnabled(True)
+        
+        # A new, edited or resumed task may count down sooner than the pending tick expects
+        self._arm_countdown_timer(next_change)
+        
+        logger.debug(f"Refreshed task table with {len(tasks)} tasks")
+    
+    def _update_task_row(self, task_id: int):
+        """
+        Recompute one task's countdown and status after a scheduler event.
+        Falls back to a full refresh if the table no longer matches the task list.
+        """
+        row = self._task_rows.get(task_id)
+        task = self.task_manager.get_task(task_id)
+        if (row is None or task is None or row >= self.taskModel.rowCount()
+                or self.taskModel.task_id(row) != task_id):
+            self._refresh_task_table()
+            return
+        
+        snapshot = self._job_snapshot()
+        self.taskModel.set_row_state(
+            row, task, self._calculate_countdown(task, snapshot), self._task_status(task, snapshot, datetime.now())
+        )
+        self.statusDelegate.set_pulsing(self.taskModel.has_status("Running"))
+        
+        # Only tick sooner than already planned; other rows keep their schedule
+        next_change = self._countdown_change_in(task, snapshot)
+        if self.countdown_timer.isActive():
+            next_change = min(next_change, self.countdown_timer.remainingTime())
+        self._arm_countdown_timer(next_change)
+    
+    def _task_icon(self, task: dict):
+        """Icon of the task's program, or None. Cached per program path."""
+        program_path = task.get('program_path', '')
+        if program_path in self._icon_cache:
+            return self._icon_cache[program_path]
+        
+        icon = None
+        try:
+            from icon_extractor import extract_icon_from_path
+            icon_path = extract_icon_from_path(program_path)
+            if icon_path and os.path.exists(icon_path):
+                icon = QIcon(icon_path)
+        except Exception as e:
+            logger.debug(f"Could not load icon for task: {e}")
+        
+        self._icon_cache[program_path] = icon
+        return icon
+    
+    def _format_schedule(self, task: dict, date_fmt_setting: str) -> str:
+        """Schedule column text, cached per (schedule_time, recurrence, date format)."""
+        key = (task.get('schedule_time'), task.get('recurrence', 'Once'), date_fmt_setting)
+        schedule_str = self._schedule_cache.get(key)
+        if schedule_str is not None:
+            return schedule_str
+        
+        schedule_time = _parse_schedule_time(task.get('schedule_time'))
+        if schedule_time is None:
+            schedule_str = "Invalid"
+        else:
+            recurrence = Recurrence.parse(task.get('recurrence'))
             
-            # Status Badge - Color-coded status widget
-            task_id = task.get('id')
-            status_badge = StatusBadge()
+            emoji = _RECURRENCE_EMOJIS[recurrence] if recurrence is not None else '📅'
             
-            # Determine status
-            # Determine status
-            if not task.get('enabled', True):
-                status_badge.set_status("Disabled")
-            elif task_id in self.scheduler.active_processes:
-                status_badge.set_status("Running")
+            if recurrence is Recurrence.Once:
+                date_fmt = _DATE_FMT_MAP.get(date_fmt_setting, '%Y-%m-%d')
+                schedule_str = f"{emoji} {schedule_time.strftime(f'{date_fmt} %H:%M')}"
             else:
-                # Check for Expired first (for Once tasks that are done)
-                expired = False
-                try:
-                    schedule_time = datetime.fromisoformat(task.get('schedule_time'))
-                    recurrence = task.get('recurrence', 'Once')
-                    if recurrence == 'Once' and schedule_time <= datetime.now():
-                        status_badge.set_status("Expired")
-                        expired = True
-                except:
-                    pass
-                
-                if not expired:
-                    # Check if job is paused in scheduler
-                    if self.scheduler.is_job_paused(task_id):
-                        status_badge.set_status("Paused")
-                    else:
-                        # Check if there's a postponed retry scheduled
-                        postponed_time = self._get_postponed_time(task_id)
-                        if postponed_time:
-                            status_badge.set_status("Postponed", f"@ {postponed_time}")
-                        else:
-                            status_badge.set_status("Enabled")
-            
-            # Wrap in container for centering
-            container = QWidget()
-            layout = QHBoxLayout(container)
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(status_badge)
-            self.taskTable.setCellWidget(row, 4, container)
-            
-            # Store task ID in row
-            self.taskTable.item(row, 0).setData(Qt.ItemDataRole.UserRole, task_id)
+                # For recurring tasks, show the pattern and time
+                time_str = schedule_time.strftime('%H:%M')
+                schedule_str = f"{emoji} {task.get('recurrence')} @ {time_str}"
         
-        logger.debug(f"Refreshed task table with {len(tasks)} tasks")
+        self._schedule_cache[key] = schedule_str
+        return schedule_str
     
-    def _get_postponed_time(self, task_id: int) -> str:
-        """Get the next retry time for a postponed task, if any."""
+    def _task_status(self, task: dict, snapshot: JobSnapshot, now: datetime) -> tuple:
+        """
+        (status, subtitle) shown in a task's status badge.
+        Only dict/set lookups: job state comes from the refresh's snapshot and `now` is taken once per refresh.
+        """
+        task_id = task.get('id')
+        
+        # Determine status
+        if not task.get('enabled', True):
+            return ("Disabled", "")
+        if task_id in self.scheduler.active_processes:
+            return ("Running", "")
+        
+        # Check for Expired first (for Once tasks that are done)
+        schedule_time = _parse_schedule_time(task.get('schedule_time'))
+        recurrence = Recurrence.parse(task.get('recurrence'))
+        if schedule_time is not None and recurrence is Recurrence.Once and schedule_time <= now:
+            return ("Expired", "")
+        
+        # Check if job is paused in scheduler
+        if snapshot.is_paused(task_id):
+            return ("Paused", "")
+        
+        # Check if there's a postponed retry scheduled
+        postponed_time = self._get_postponed_time(task_id, snapshot)
+        if postponed_time:
+            return ("Postponed", f"@ {postponed_time}")
+        return ("Enabled", "")
+    
+    def _selected_task_id(self):
+        """ID of the task in the selected row, or None."""
+        rows = self.taskTable.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self.taskModel.task_id(rows[0].row())
+    
+    def _job_snapshot(self) -> JobSnapshot:
+        """Next run times of all task jobs, taken once per table refresh or countdown tick."""
         try:
-            for job in self.scheduler.scheduler.get_jobs():
-                # Look for retry jobs for this task
-                if job.name and f"retry_" in job.name:
-                    # Check if job args contain this task
-                    if job.args and len(job.args) > 0:
-                        task = job.args[0]
-                        if task.get('id') == task_id and job.next_run_time:
-                            return job.next_run_time.strftime("%H:%M")
+            return self.scheduler.snapshot_next_run_times()
         except Exception as e:
-            logger.debug(f"Error checking postponed time: {e}")
-        return None
+            logger.debug(f"Error reading scheduler jobs: {e}")
+            return JobSnapshot()
+    
+    def _get_postponed_time(self, task_id: int, snapshot: JobSnapshot) -> str:
+        """Get the next retry time for a postponed task, if any."""
+        next_retry = snapshot.postponed.get(task_id)
+        return next_retry.strftime("%H:%M") if next_retry else None
     
-    def _calculate_countdown(self, task: dict) -> str:
+    def _calculate_countdown(self, task: dict, snapshot: JobSnapshot) -> str:
         """
         Calculate countdown string for a task.
         
         Args:
             task: Task dictionary
+            snapshot: Scheduler job snapshot for this refresh/tick
             
         Returns:
             Formatted countdown string (with [Postponed] prefix if postponed)
         """
-        try:
-            task_id = task.get('id')
-            
-            # First check for postponed retry jobs
-            postponed_time = self._get_postponed_time(task_id)
-            if postponed_time:
-                # Calculate countdown to postponed time
-                from datetime import datetime as dt
-                try:
-                    # Parse the HH:MM time from postponed
-                    today = dt.now()
-                    hour, minute = map(int, postponed_time.split(':'))
-                    next_run = today.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    
-                    # If time is past, it might be tomorrow
-                    if next_run < today:
-                        from datetime import timedelta
-                        next_run += timedelta(days=1)
-                    
-                    delta = next_run - today
-                    hours, remainder = divmod(delta.seconds, 3600)
-                    minutes, seconds = divmod(remainder, 60)
-                    
-                    # Show ⏳ emoji to indicate this is a postponed/retry timer
-                    if hours > 0:
-                        return f"⏳ {hours}h {minutes}m"
-                    else:
-                        return f"⏳ {minutes}m {seconds}s"
-                except:
-                    return f"⏳ @ {postponed_time}"
-            
-            # Get next run time from scheduler for accuracy (handles recurrence)
-            next_run = self.scheduler.get_next_run_time(task_id)
-            
-            if not next_run:
-                # Fallback for 'Once' tasks that might be in the past or not scheduled
-                schedule_time = datetime.fromisoformat(task.get('schedule_time'))
-                now = datetime.now()
-                if schedule_time <= now and task.get('recurrence', 'Once') == 'Once':
-                    return f"❌ {get_text('main_window.status_expired')}"
-                return f"⏸️ {get_text('main_window.status_paused')}"
-            
-            # Calculate delta using timezone-naive datetimes if needed
-            now = datetime.now(next_run.tzinfo)
-            delta = next_run - now
-            
-            days = delta.days
+        task_id = task.get('id')
+        if task_id is None:
+            return ""
+        
+        # First check for postponed retry jobs
+        postponed_run = snapshot.postponed.get(task_id)
+        if postponed_run:
+            # Calculate countdown to postponed time
+            delta = max(postponed_run - datetime.now(postponed_run.tzinfo), timedelta(0))
             hours, remainder = divmod(delta.seconds, 3600)
             minutes, seconds = divmod(remainder, 60)
             
-            # Show ⏱️ emoji for normal scheduled countdown
-            if days > 0:
-                return f"⏱️ {days}d {hours}h {minutes}m"
-            elif hours > 0:
-                return f"⏱️ {hours}h {minutes}m {seconds}s"
+            # Show ⏳ emoji to indicate this is a postponed/retry timer
+            if hours > 0:
+                return f"⏳ {hours}h {minutes}m"
             else:
-                return f"⏱️ {minutes}m {seconds}s"
-                
-        except Exception as e:
-            logger.error(f"Error calculating countdown: {e}")
-
-            return get_text('main_window.status_error')
+                return f"⏳ {minutes}m {seconds}s"
+        
+        # Get next run time from scheduler for accuracy (handles recurrence)
+        next_run = snapshot.primary.get(task_id)
+        
+        if not next_run:
+            # Fallback for 'Once' tasks that might be in the past or not scheduled
+            schedule_time = _parse_schedule_time(task.get('schedule_time'))
+            if schedule_time is None:
+                logger.error(f"Error calculating countdown: invalid schedule_time {task.get('schedule_time')!r}")
+                return self._countdown_error_text
+            if schedule_time <= datetime.now() and Recurrence.parse(task.get('recurrence')) is Recurrence.Once:
+                return self._countdown_expired_text
+            return self._countdown_paused_text
+        
+        # Calculate delta using timezone-naive datetimes if needed
+        now = datetime.now(next_run.tzinfo)
+        delta = next_run - now
+        
+        days = delta.days
+        hours, remainder = divmod(delta.seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        
+        # Show ⏱️ emoji for normal scheduled countdown
+        if days > 0:
+            return f"⏱️ {days}d {hours}h {minutes}m"
+        elif hours > 0:
+            return f"⏱️ {hours}h {minutes}m {seconds}s"
+        else:
+            return f"⏱️ {minutes}m {seconds}s"
     
     def _update_countdowns(self):
-        """Update countdown timers for all tasks."""
-        
-        for row in range(self.taskTable.rowCount()):
-            task_id = self.taskTable.item(row, 0).data(Qt.ItemDataRole.UserRole)
-            task = self.task_manager.get_task(task_id)
-            
-            if task:
-                countdown = self._calculate_countdown(task)
-                # Reuse existing item instead of creating new one (prevents style corruption)
-                existing_item = self.taskTable.item(row, 3)
-                if existing_item:
-                    existing_item.setText(countdown)
-                else:
-                    self.taskTable.setItem(row, 3, QTableWidgetItem(countdown))
+        """Update countdown timers for the rows currently scrolled into view."""
+        
+        # Off-screen rows keep their last text; they are recomputed once scrolled into view.
+        # The model holds the last rendered strings and repaints only the cells that changed.
+        # Add/edit/delete rebuild the whole table via _refresh_task_table, while start/finish/
+        # postpone/pause rewrite just their row via _update_task_row; neither needs extra
+        # invalidation here.
+        snapshot = self._job_snapshot()
+        countdowns = self.taskModel.countdowns()
+        next_change = COUNTDOWN_IDLE_INTERVAL
+        for row in self._visible_rows():
+            # The model's own copy of the task list, so rows always line up with its columns
+            task = self.taskModel.task(row)
+            countdowns[row] = self._calculate_countdown(task, snapshot)
+            next_change = min(next_change, self._countdown_change_in(task, snapshot))
+        self.taskModel.set_countdowns(countdowns)
+        self._arm_countdown_timer(next_change)
+    
+    def _countdown_change_in(self, task: dict, snapshot: JobSnapshot) -> int:
+        """
+        Milliseconds until the task's countdown text next changes.
+        Texts with seconds change on each second boundary, day/hour texts without
+        seconds only on minute boundaries, and paused/expired texts not at all.
+        """
+        task_id = task.get('id')
+        # Retry countdowns drop the seconds from one hour out, regular ones from one day out
+        run_time = snapshot.postponed.get(task_id)
+        seconds_shown_below = timedelta(hours=1)
+        if not run_time:
+            run_time = snapshot.primary.get(task_id)
+            seconds_shown_below = timedelta(days=1)
+            if not run_time:
+                return COUNTDOWN_IDLE_INTERVAL
+        
+        delta = run_time - datetime.now(run_time.tzinfo)
+        if delta <= timedelta(0):
+            # Overdue: the scheduler is about to run it, keep checking every second
+            return 1000
+        wait = delta.microseconds // 1000
+        if delta >= seconds_shown_below:
+            wait += (delta.seconds % 60) * 1000
+        # Land just past the boundary so the new value is already shown
+        return wait + 10
+    
+    def _arm_countdown_timer(self, msec: int):
+        """(Re)start the countdown timer for the next text change, if the table is on screen."""
+        if not hasattr(self, 'countdown_timer') or not self._countdowns_visible():
+            return
+        self.countdown_timer.start(min(msec, COUNTDOWN_IDLE_INTERVAL))
+    
+    def _visible_rows(self) -> range:
+        """Rows of the task table intersecting the viewport."""
+        row_count = self.taskModel.rowCount()
+        first = self.taskTable.rowAt(0)
+        if first < 0:
+            return range(0)
+        last = self.taskTable.rowAt(self.taskTable.viewport().height() - 1)
+        if last < 0:
+            last = row_count - 1
+        return range(first, last + 1)
     
     def _run_now(self):
         """Execute the selected task immediately."""
-        selected_rows = self.taskTable.selectedItems()
-        if not selected_rows:
+        task_id = self._selected_task_id()
+        if task_id is None:
             InfoBar.warning(
                 title=get_text('main_window.no_selection'),
                 content=get_text('main_window.select_task_run'),
@@ -859,7 +1026,6 @@ class AutolauncherApp(FluentWindow):
             )
             return
         
-        task_id = self.taskTable.item(selected_rows[0].row(), 0).data(Qt.ItemDataRole.UserRole)
         task = self.task_manager.get_task(task_id)
         
         if task:
@@ -895,6 +1061,8 @@ class AutolauncherApp(FluentWindow):
             if dialog.validate_input():
                 task_data = dialog.get_task_data()
                 name = task_data.get('name', 'Unknown')
+                # Drop a stale (e.g. failed) icon lookup for this path before the refresh
+                self._icon_cache.pop(task_data.get('program_path', ''), None)
 
                 # Add task via controller
                 if self.controller.add_task(task_data):
@@ -933,8 +1101,8 @@ class AutolauncherApp(FluentWindow):
     def _edit_task(self):
         """Edit the selected task."""
         
-        selected_rows = self.taskTable.selectedItems()
-        if not selected_rows:
+        task_id = self._selected_task_id()
+        if task_id is None:
             InfoBar.warning(
                 title=get_text('main_window.no_selection'),
                 content=get_text('main_window.select_task_edit'),
@@ -946,10 +1114,10 @@ class AutolauncherApp(FluentWindow):
             )
             return
         
-        task_id = self.taskTable.item(selected_rows[0].row(), 0).data(Qt.ItemDataRole.UserRole)
         task = self.task_manager.get_task(task_id)
         
         if task:
+            old_program_path = task.get('program_path', '')
             dialog = TaskDialog(self, task_data=task, settings_manager=self.settings_manager)
             result = dialog.exec()
             
@@ -964,6 +1132,9 @@ class AutolauncherApp(FluentWindow):
                     
                     if self.task_manager.update_task(task_id, updated_task):
                         self.scheduler.update_job(updated_task)
+                        # Re-extract the icon for the edited path on the next refresh
+                        self._icon_cache.pop(old_program_path, None)
+                        self._icon_cache.pop(updated_task.get('program_path', ''), None)
                         self._refresh_task_table()
                         
                         InfoBar.success(
@@ -987,18 +1158,18 @@ class AutolauncherApp(FluentWindow):
                         parent=self
                     )
     
-    def _on_task_double_clicked(self, row: int, column: int):
+    def _on_task_double_clicked(self, index):
         """Handle double-click on task table - opens edit dialog."""
         # Select the row
-        self.taskTable.selectRow(row)
+        self.taskTable.selectRow(index.row())
         # Call edit task
         self._edit_task()
     
     def _delete_task(self):
         """Delete the selected task."""
         
-        selected_rows = self.taskTable.selectedItems()
-        if not selected_rows:
+        task_id = self._selected_task_id()
+        if task_id is None:
             InfoBar.warning(
                 title="No Selection",
                 content="Please select a task to delete",
@@ -1010,7 +1181,6 @@ class AutolauncherApp(FluentWindow):
             )
             return
         
-        task_id = self.taskTable.item(selected_rows[0].row(), 0).data(Qt.ItemDataRole.UserRole)
         task = self.task_manager.get_task(task_id)
         
         if task:
@@ -1182,13 +1352,13 @@ class AutolauncherApp(FluentWindow):
     def _handle_task_started(self, task_id: int, task_name: str):
         """Handle task started event."""
         logger.info(f"Task started: {task_name} (ID: {task_id})")
-        # Refresh table to show Running status
-        self._refresh_task_table()
+        # Refresh the task's row to show Running status
+        self._update_task_row(task_id)
     
     def _handle_task_finished(self, task_id: int):
         """Handle task finished event."""
         logger.info(f"Task finished: ID {task_id}")
-        self._refresh_task_table()
+        self._update_task_row(task_id)
     
     def _handle_task_postponed(self, task_id: int, new_time_str: str):
         """Handle task postponed event."""
@@ -1203,14 +1373,43 @@ class AutolauncherApp(FluentWindow):
                 duration=3000,
                 parent=self
             )
-        # Refresh table to show Postponed status
-        self._refresh_task_table()
+        # Refresh the task's row to show Postponed status
+        self._update_task_row(task_id)
+    
+    
+    def _countdowns_visible(self) -> bool:
+        """True if the task table can currently be seen."""
+        return (self.isVisible()
+                and not (self.windowState() & Qt.WindowState.WindowMinimized)
+                and self.stackedWidget.currentWidget() is self.mainWidget)
     
+    def _sync_countdown_timer(self, *args):
+        """Run the countdown timer only while the task table is visible."""
+        if not hasattr(self, 'countdown_timer'):
+            return
+        if self._countdowns_visible():
+            if not self.countdown_timer.isActive():
+                # Catch up immediately (the table may show stale values from before the
+                # pause); this also arms the timer for the next change
+                self._update_countdowns()
+        else:
+            self.countdown_timer.stop()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._sync_countdown_timer()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._sync_countdown_timer()
     
     def changeEvent(self, event):
         """Handle system theme changes and enforce user preference."""
         super().changeEvent(event)
         
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._sync_countdown_timer()
+        
         # Check for theme change events or window activation
         # Adding ActivationChange to catch when window wakes up/gains focus
         # Guard against early calls before settings_manager is initialized
@@ -1220,8 +1419,8 @@ class AutolauncherApp(FluentWindow):
     
     def _toggle_task_pause(self):
         """Toggle pause/resume for the selected task."""
-        selected_rows = self.taskTable.selectedItems()
-        if not selected_rows:
+        task_id = self._selected_task_id()
+        if task_id is None:
             InfoBar.warning(
                 title="No Selection",
                 content="Please select a task to pause/resume",
@@ -1233,7 +1432,6 @@ class AutolauncherApp(FluentWindow):
             )
             return
         
-        task_id = self.taskTable.item(selected_rows[0].row(), 0).data(Qt.ItemDataRole.UserRole)
         task = self.task_manager.get_task(task_id)
         
         if task:
@@ -1248,7 +1446,8 @@ class AutolauncherApp(FluentWindow):
                     self.scheduler.remove_job(task_id)
                     status_msg = "Paused"
                 
-                self._refresh_task_table()
+                # Only this task's countdown and status change
+                self._update_task_row(task_id)
                 
                 InfoBar.success(
                     title=f"Task {status_msg}",
@@ -1417,14 +1616,18 @@ def main():
     
     # ---------------------------------------------------------
     
-    # Create application
-    app = QApplication(sys.argv)
+    # Reuse the application created at import time (or by an embedding script)
+    app = QApplication.instance() or QApplication(sys.argv)
     
     # Initialize Main Controller (Logic/Data)
     # This also initializes settings and applies theme immediately
     from main_controller import MainController
     controller = MainController()
     
+    # Every quit path (tray, updater restart) ends here: notify addons, stop the
+    # scheduler and wait out an in-flight update check before Qt tears down
+    app.aboutToQuit.connect(controller.shutdown)
+    
     # Create main window (View) and inject controller
     window = AutolauncherApp(controller)
     window.show()
@@ -71,8 +71,7 @@ hiddenimports = [
     'cv2',
     'numpy',
     'numpy.core.multiarray',
-    'mss',
-] + collect_submodules('pywinauto') + collect_submodules('mss') + collect_submodules('numpy')
+] + collect_submodules('pywinauto') + collect_submodules('numpy')
 
 a = Analysis(
     ['autolauncher.py'],
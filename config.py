@@ -116,6 +116,7 @@ BACKUP_COUNT = 3  # Keep 3 backup log files
 DEFAULT_WINDOW_WIDTH = 1100
 DEFAULT_WINDOW_HEIGHT = 650
 TIMER_UPDATE_INTERVAL = 1000  # Update countdown every 1 second (in milliseconds)
+COUNTDOWN_IDLE_INTERVAL = 30000  # Longest wait between countdown refreshes when no visible text changes sooner (ms)
 
 # Theme Settings
 DEFAULT_THEME = "Light"  # Options: "Light", "Dark", "Auto"
@@ -181,6 +182,10 @@ CONFIRMATION_BUTTON_LABELS = [
     "Accept",
 ]
 
+# Press Enter when a confirmation dialog is found but none of the labels above match.
+# Only sent while the detected dialog window itself is in the foreground.
+CONFIRMATION_ENTER_FALLBACK = True
+
 # Default Blocklist - Programs that will postpone task execution in Auto mode
 # Users can customize this list in Settings
 DEFAULT_BLOCKLIST_PROCESSES = [
@@ -63,6 +63,10 @@ class MSLLHOOKSTRUCT(ctypes.Structure):
 # Type for hook callback
 HOOKPROC = ctypes.WINFUNCTYPE(ctypes.c_long, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
 
+# Pointer types used by the hook callbacks (built once, not per event)
+PKBDLLHOOKSTRUCT = ctypes.POINTER(KBDLLHOOKSTRUCT)
+PMSLLHOOKSTRUCT = ctypes.POINTER(MSLLHOOKSTRUCT)
+
 
 class InputMonitor:
     """
@@ -122,12 +126,15 @@ class InputMonitor:
         self._user32.UnhookWindowsHookEx.argtypes = [HHOOK]
         self._user32.UnhookWindowsHookEx.restype = wintypes.BOOL
         
+        # Bound once: the hook callbacks run on every keyboard/mouse event system-wide
+        self._call_next_hook = self._user32.CallNextHookEx
+        
         logger.info("InputMonitor initialized")
     
     def _keyboard_hook_callback(self, nCode, wParam, lParam):
         """Callback for keyboard events."""
         if nCode >= 0:
-            kb_struct = ctypes.cast(lParam, ctypes.POINTER(KBDLLHOOKSTRUCT)).contents
+            kb_struct = ctypes.cast(lParam, PKBDLLHOOKSTRUCT).contents
             is_injected = (kb_struct.flags & LLKHF_INJECTED) != 0
             
             if not is_injected:
@@ -136,12 +143,12 @@ class InputMonitor:
                     self._has_detected_input = True
                     logger.info("Real KEYBOARD input detected")
         
-        return ctypes.windll.user32.CallNextHookEx(None, nCode, wParam, lParam)
+        return self._call_next_hook(None, nCode, wParam, lParam)
 
     def _mouse_hook_callback(self, nCode, wParam, lParam):
         """Callback for mouse events."""
         if nCode >= 0:
-            ms_struct = ctypes.cast(lParam, ctypes.POINTER(MSLLHOOKSTRUCT)).contents
+            ms_struct = ctypes.cast(lParam, PMSLLHOOKSTRUCT).contents
             is_injected = (ms_struct.flags & LLMHF_INJECTED) != 0
             
             if not is_injected:
@@ -152,7 +159,7 @@ class InputMonitor:
                     self._has_detected_input = True
                     logger.info("Real MOUSE input detected")
         
-        return ctypes.windll.user32.CallNextHookEx(None, nCode, wParam, lParam)
+        return self._call_next_hook(None, nCode, wParam, lParam)
     
     def _hook_thread(self):
         """Background thread that runs the message loop for hooks."""
@@ -9,7 +9,7 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from logger import get_logger
 
 logger = get_logger(__name__)
@@ -31,6 +31,8 @@ class LanguageManager:
         self.default_language = default_language
         self.current_language = default_language
         self.translations: Dict[str, Dict] = {}
+        # (language, key_path) -> resolved text; keyed by language so switching needs no invalidation
+        self._text_cache: Dict[Tuple[str, str], str] = {}
         self._load_translations()
 
     def _get_translations_dir(self) -> Path:
@@ -62,6 +64,7 @@ class LanguageManager:
             return
 
         logger.info(f"Loading translations from: {translations_dir}")
+        self._text_cache.clear()
 
         # Load all JSON files in the translations directory
         for lang_file in translations_dir.glob("*.json"):
@@ -106,7 +109,16 @@ class LanguageManager:
             Translated text, or key_path if translation not found
         """
         lang = language or self.current_language
-
+        cache_key = (lang, key_path)
+        cached = self._text_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        text = self._resolve_text(key_path, lang)
+        self._text_cache[cache_key] = text
+        return text
+
+    def _resolve_text(self, key_path: str, lang: str) -> str:
+        """Look up key_path in the nested translation dict for lang (with default-language fallback)."""
         # If language not loaded, try default
         if lang not in self.translations:
             lang = self.default_language
@@ -5,13 +5,13 @@ Implementation of the MVC pattern to decouple logic from the View.
 """
 
 from datetime import datetime, timedelta
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer, Qt
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, QTimer, Qt
 from PyQt6.QtWidgets import QApplication
 
 from task_manager import TaskManager, SettingsManager
 from theme_manager import ThemeManager
 from scheduler import TaskScheduler
-from update_manager import UpdateManager
+from update_manager import UpdateManager, API_REQUEST_TIMEOUT
 from language_manager import get_language_manager
 from logger import get_logger
 from config import TIMER_UPDATE_INTERVAL
@@ -20,6 +20,25 @@ from addon_manager import AddonManager
 
 logger = get_logger(__name__)
 
+# Shutdown waits out an in-flight update check: a QThread destroyed while running aborts
+# the process. Connect and read timeouts apply separately, so allow both plus slack.
+UPDATE_CHECK_SHUTDOWN_WAIT_MS = (2 * API_REQUEST_TIMEOUT + 5) * 1000
+
+
+class UpdateCheckThread(QThread):
+    """Runs a silent update check off the GUI thread."""
+
+    result = pyqtSignal(object, object)  # update_info or None, error or None
+
+    def __init__(self, update_manager, parent=None):
+        super().__init__(parent)
+        self.update_manager = update_manager
+
+    def run(self):
+        update_info, error = self.update_manager.check_for_updates_silent()
+        self.result.emit(update_info, error)
+
+
 class MainController(QObject):
     """
     Central controller for the Autolauncher application.
@@ -67,6 +86,14 @@ class MainController(QObject):
         self.pending_update_info = None
         self.notified_versions = set()
         self.update_deferred_until_task_complete = False  # Smart Auto-Update flag
+        self._update_check_thread = None  # In-flight silent update check
+        
+        # One timer drives the startup check and then the periodic checks.
+        # Very coarse: second granularity is plenty for multi-second intervals.
+        self._update_timer = QTimer(self)
+        self._update_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self._update_timer.timeout.connect(self._on_update_timer)
+        self._periodic_update_checks = False
         
         # 4. Initialize Language
         self._init_language()
@@ -121,6 +148,9 @@ class MainController(QObject):
         logger.info("Shutting down MainController...")
         self.addon_manager.notify_app_shutdown()
         self.scheduler.shutdown()
+        if self._update_check_thread is not None and self._update_check_thread.isRunning():
+            if not self._update_check_thread.wait(UPDATE_CHECK_SHUTDOWN_WAIT_MS):
+                logger.warning("Update check still running at shutdown")
 
         
     # --- Task Management Methods ---
@@ -161,35 +191,54 @@ class MainController(QObject):
     def check_for_updates(self, silent=True):
         """Check for updates with Smart Auto-Update logic."""
         if silent:
-            update_info, error = self.update_manager.check_for_updates_silent()
-            if error:
-                self.update_check_error.emit(error)
+            # Network I/O runs on a worker thread; the result is handled back on the GUI thread
+            # Set until the worker's finished signal is handled, even after isRunning() turns False
+            if self._update_check_thread is not None:
+                logger.debug("Update check already in progress - skipping")
                 return
             
-            if update_info:
-                version = update_info['version']
-                
-                # Check spam prevention
-                if version in self.notified_versions:
-                    logger.debug(f"Skipping duplicate update alert for {version}")
-                    return
-                
-                # Smart Auto-Update: Check if we should defer
-                if self._should_install_update_now():
-                    self.notified_versions.add(version)
-                    self.update_available.emit(update_info)
-                    logger.info(f"Update {version} available - notifying user")
-                else:
-                    # Defer the update until after task completes
-                    self.pending_update_info = update_info
-                    self.update_deferred_until_task_complete = True
-                    logger.info(f"Update {version} deferred - task imminent within 30 minutes")
-            else:
-                self.no_update_available.emit()
+            thread = UpdateCheckThread(self.update_manager, self)
+            thread.result.connect(self._on_silent_update_check_result)
+            thread.finished.connect(self._on_update_check_thread_finished)
+            thread.finished.connect(thread.deleteLater)
+            self._update_check_thread = thread
+            thread.start()
         else:
             # Interactive check (not implemented yet for controller)
             pass
     
+    def _on_update_check_thread_finished(self):
+        """Forget the finished worker (it deletes itself), unless a newer check replaced it."""
+        if self.sender() is self._update_check_thread:
+            self._update_check_thread = None
+    
+    def _on_silent_update_check_result(self, update_info, error):
+        """Handle the outcome of a background update check."""
+        if error:
+            self.update_check_error.emit(error)
+            return
+        
+        if update_info:
+            version = update_info['version']
+            
+            # Check spam prevention
+            if version in self.notified_versions:
+                logger.debug(f"Skipping duplicate update alert for {version}")
+                return
+            
+            # Smart Auto-Update: Check if we should defer
+            if self._should_install_update_now():
+                self.notified_versions.add(version)
+                self.update_available.emit(update_info)
+                logger.info(f"Update {version} available - notifying user")
+            else:
+                # Defer the update until after task completes
+                self.pending_update_info = update_info
+                self.update_deferred_until_task_complete = True
+                logger.info(f"Update {version} deferred - task imminent within 30 minutes")
+        else:
+            self.no_update_available.emit()
+    
     def _should_install_update_now(self) -> bool:
         """
         Smart Auto-Update: Determine if an update should proceed now.
@@ -241,23 +290,30 @@ class MainController(QObject):
         frequency = self.settings_manager.get('auto_update_frequency', 'startup')
         
         if frequency == 'manual':
+            self._update_timer.stop()
             logger.info("Controller: Auto-update checks are disabled (manual mode)")
             return
             
-        # Setup initial check on startup
+        self._periodic_update_checks = frequency == 'automatic'
+        
+        # Setup initial check on startup; the periodic phase starts after it
         if frequency in ['startup', 'automatic']:
-            self.initial_update_timer = QTimer(self)
-            self.initial_update_timer.setSingleShot(True)
-            self.initial_update_timer.timeout.connect(self._perform_startup_update_check)
-            self.initial_update_timer.start(10000)  # 10 seconds after startup
+            self._update_timer.setSingleShot(True)
+            self._update_timer.start(10000)  # 10 seconds after startup (restarts if already pending)
             logger.info("Controller: Scheduled startup update check in 10 seconds")
-        
-        # Setup periodic check timer
-        if frequency == 'automatic':
-            self.periodic_update_timer = QTimer(self)
-            self.periodic_update_timer.timeout.connect(self._perform_periodic_update_check)
-            self.periodic_update_timer.start(120000)  # 2 minutes
-            logger.info("Controller: Enabled automatic update checking every 2 minutes")
+    
+    def _on_update_timer(self):
+        """Run the due update check and move from the startup to the periodic phase."""
+        if self._update_timer.isSingleShot():
+            self._perform_startup_update_check()
+            
+            # Setup periodic check timer
+            if self._periodic_update_checks:
+                self._update_timer.setSingleShot(False)
+                self._update_timer.start(120000)  # 2 minutes
+                logger.info("Controller: Enabled automatic update checking every 2 minutes")
+        else:
+            self._perform_periodic_update_check()
 
     def _perform_startup_update_check(self):
         """Perform update check on startup."""
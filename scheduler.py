@@ -8,6 +8,7 @@ import subprocess
 import ctypes
 import time
 import psutil
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from pathlib import Path
@@ -32,6 +33,15 @@ from process_tracker import resolve_shortcut, get_spawned_processes
 logger = get_logger(__name__)
 
 
+@dataclass
+class JobSnapshot:
+    """Next run times of the user task jobs, read from the job store in one pass."""
+    primary: Dict[int, Optional[datetime]] = field(default_factory=dict)  # task_id -> next run (None while paused)
+    postponed: Dict[int, datetime] = field(default_factory=dict)  # task_id -> earliest retry run
+
+    def is_paused(self, task_id: int) -> bool:
+        """Same rule as TaskScheduler.is_job_paused: the job exists but has no next run."""
+        return task_id in self.primary and self.primary[task_id] is None
 
 
 
@@ -356,6 +366,23 @@ class TaskScheduler(QObject):
                     soonest = job.next_run_time
         return soonest
     
+    def snapshot_next_run_times(self) -> JobSnapshot:
+        """
+        Walk the job store once and index next run times by task ID.
+        Lets the UI answer per-row countdown/status questions without a job lookup per row.
+        """
+        snapshot = JobSnapshot()
+        for job in self.scheduler.get_jobs():
+            if job.id.startswith('task_'):
+                try:
+                    snapshot.primary[int(job.id[len('task_'):])] = job.next_run_time
+                except ValueError:
+                    continue
+            elif job.name and job.name.startswith('retry_') and job.args and job.next_run_time:
+                # Jobs come sorted by next run time, so the first retry seen is the earliest
+                snapshot.postponed.setdefault(job.args[0].get('id'), job.next_run_time)
+        return snapshot
+    
     def execute_immediately(self, task: Dict) -> bool:
         """Execute a task immediately (bypassing checks)."""
         try:
@@ -954,8 +981,10 @@ class TaskScheduler(QObject):
         return False
 
     def shutdown(self):
-        """Shutdown the scheduler."""
+        """Shutdown the scheduler (safe to call more than once)."""
         try:
+            if not self.scheduler.running:
+                return
             self.scheduler.shutdown(wait=False)
             # Terminate all active processes? Maybe not, user might want them open.
             logger.info("TaskScheduler shut down")
@@ -3,8 +3,10 @@ Task Manager Module for Autolauncher.
 Handles data persistence using JSON for storing and retrieving scheduled tasks.
 """
 
+import copy
 import json
 import os
+from enum import IntEnum
 from typing import List, Dict, Optional
 from pathlib import Path
 from datetime import datetime
@@ -14,6 +16,22 @@ from config import TASKS_FILE, SETTINGS_FILE, DEFAULT_THEME
 logger = get_logger(__name__)
 
 
+class Recurrence(IntEnum):
+    """
+    Recurrence types of a task. Member names are the strings stored in
+    tasks.json, so `Recurrence.Daily.name == 'Daily'`.
+    """
+    Once = 0
+    Daily = 1
+    Weekly = 2
+    Monthly = 3
+
+    @classmethod
+    def parse(cls, value: Optional[str]) -> Optional['Recurrence']:
+        """Map a stored recurrence string to its member ('Once' if missing, None if unknown)."""
+        return cls.__members__.get(value or 'Once')
+
+
 class TaskManager:
     """
     Manages task data persistence using JSON files.
@@ -269,6 +287,10 @@ class SettingsManager:
     Manages application settings persistence.
     """
     
+    # settings file -> (mtime_ns, parsed settings), shared by all instances so that
+    # short-lived SettingsManager() lookups only parse the JSON when the file changed
+    _snapshots: Dict[Path, tuple] = {}
+    
     def __init__(self, settings_file: Path = SETTINGS_FILE):
         """
         Initialize the SettingsManager.
@@ -289,8 +311,16 @@ class SettingsManager:
         """
         try:
             if self.settings_file.exists():
+                mtime_ns = self.settings_file.stat().st_mtime_ns
+                snapshot = self._snapshots.get(self.settings_file)
+                if snapshot and snapshot[0] == mtime_ns:
+                    # Deep copies: list settings must not be shared between instances
+                    self.settings = copy.deepcopy(snapshot[1])
+                    return self.settings
+                
                 with open(self.settings_file, 'r', encoding='utf-8') as f:
                     self.settings = json.load(f)
+                self._snapshots[self.settings_file] = (mtime_ns, copy.deepcopy(self.settings))
                 logger.debug(f"Loaded settings from {self.settings_file}")
             else:
                 # Create default settings
@@ -324,6 +354,7 @@ class SettingsManager:
             
             # Atomic replacement
             os.replace(temp_file, self.settings_file)
+            self._snapshots[self.settings_file] = (self.settings_file.stat().st_mtime_ns, copy.deepcopy(self.settings))
             
             logger.debug(f"Saved settings to {self.settings_file}")
             return True
@@ -341,6 +372,9 @@ class SettingsManager:
         return self.settings.get(key, default)
     
     def set(self, key: str, value) -> bool:
-        """Set a setting value and save."""
+        """Set a setting value and save (no write if a scalar value is unchanged)."""
+        # Containers may have been mutated in place, so only scalars are compared
+        if isinstance(value, (str, int, float, type(None))) and key in self.settings and self.settings[key] == value:
+            return True
         self.settings[key] = value
         return self.save_settings()
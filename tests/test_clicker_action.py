@@ -24,9 +24,8 @@ def test_clicker():
         print("Error: Could not find simulation window.")
         return
 
-    print("Attempting to click 'Confirm' using PID-directed search...")
-    # PASS THE PID! This enables the "Candidate Window" logic for this specific window.
-    success = detector.click_confirmation_button([target_pid], ["Confirm"])
+    print("Attempting to click 'Confirm' in the simulation window...")
+    success = detector.click_confirmation_button(target_hwnd, ["Confirm"])
     
     if success:
         print("SUCCESS: Clicker reported success!")
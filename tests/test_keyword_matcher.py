@@ -0,0 +1,70 @@
+import unittest
+import os
+import importlib.util
+
+# Load the module by path: importing the addon package would pull in its Windows-only dependencies
+_MODULE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "addons", "c4n_al_sentinel_addon", "keyword_matcher.py"
+)
+_spec = importlib.util.spec_from_file_location("keyword_matcher", _MODULE_PATH)
+keyword_matcher = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(keyword_matcher)
+KeywordMatcher = keyword_matcher.KeywordMatcher
+
+
+class TestKeywordMatcherFind(unittest.TestCase):
+    def test_case_insensitive(self):
+        matcher = KeywordMatcher(["Not Responding"])
+        self.assertEqual(matcher.find("Game (NOT RESPONDING)"), "not responding")
+
+    def test_no_match_and_empty_text(self):
+        matcher = KeywordMatcher(["update"])
+        self.assertIsNone(matcher.find("Game Launcher"))
+        self.assertIsNone(matcher.find(""))
+
+    def test_overlapping_keywords(self):
+        matcher = KeywordMatcher(["responding", "not responding"])
+        self.assertIn(matcher.find("App - Not Responding"), {"responding", "not responding"})
+        # Only the shorter keyword is present
+        self.assertEqual(matcher.find("App - Responding"), "responding")
+
+    def test_duplicates_and_empty_keywords_dropped(self):
+        matcher = KeywordMatcher(["Update", "update", ""])
+        self.assertEqual(matcher.keywords, ("update",))
+        self.assertFalse(KeywordMatcher([]))
+
+
+class TestKeywordMatcherUtf16(unittest.TestCase):
+    def test_ascii_fast_path(self):
+        matcher = KeywordMatcher(["not responding"])
+        raw = "Game (Not Responding)".encode("utf-16-le")
+        self.assertEqual(matcher.find_utf16le(raw), "not responding")
+        self.assertIsNone(matcher.find_utf16le("Game".encode("utf-16-le")))
+
+    def test_odd_byte_offset_is_not_a_match(self):
+        matcher = KeywordMatcher(["ab"])
+        # Code units U+6120 U+6200 U+2000 contain the bytes of "ab" only at offset 1
+        raw = bytes([0x20, 0x61, 0x00, 0x62, 0x00, 0x20])
+        self.assertIn("ab".encode("utf-16-le"), raw)
+        self.assertIsNone(matcher.find_utf16le(raw))
+
+    def test_non_ascii_keyword_uses_unicode_folding(self):
+        matcher = KeywordMatcher(["Ärger"])
+        self.assertEqual(matcher.find_utf16le("Viel ÄRGER hier".encode("utf-16-le")), "ärger")
+
+    def test_leftover_buffer_bytes(self):
+        # A reused title buffer: a short title written over a longer, older one
+        matcher = KeywordMatcher(["not responding"])
+        buffer = bytearray("Game (Not Responding)".encode("utf-16-le"))
+        current = "OK".encode("utf-16-le") + b"\x00\x00"
+        buffer[:len(current)] = current
+
+        # Only the characters actually copied are matched
+        self.assertIsNone(matcher.find_utf16le(bytes(buffer[:2 * 2])))
+        # Reading past them picks up the stale tail
+        self.assertEqual(matcher.find_utf16le(bytes(buffer)), "not responding")
+
+
+if __name__ == '__main__':
+    unittest.main()
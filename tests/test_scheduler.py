@@ -2,6 +2,7 @@ import unittest
 import sys
 import os
 from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 from datetime import datetime, timedelta
 
 # Add parent directory to path
@@ -102,5 +103,36 @@ class TestTaskScheduler(unittest.TestCase):
         
         self.assertNotIn(task_id, self.scheduler.active_processes)
 
+
+class TestJobSnapshot(unittest.TestCase):
+    def _snapshot(self, jobs):
+        # Only the APScheduler job list is used, so a stand-in scheduler is enough
+        owner = SimpleNamespace(scheduler=SimpleNamespace(get_jobs=lambda: jobs))
+        return TaskScheduler.snapshot_next_run_times(owner)
+
+    def test_primary_and_postponed_jobs(self):
+        now = datetime.now()
+        retry_soon = now + timedelta(minutes=5)
+        jobs = [  # APScheduler returns jobs sorted by next run time, paused jobs last
+            SimpleNamespace(id="a1", name="retry_Game_1200", args=[{'id': 2}], next_run_time=retry_soon),
+            SimpleNamespace(id="task_1", name="Game", args=[{'id': 1}], next_run_time=now + timedelta(hours=1)),
+            SimpleNamespace(id="a2", name="retry_Game_1230", args=[{'id': 2}], next_run_time=now + timedelta(minutes=35)),
+            SimpleNamespace(id="process_cleanup", name="cleanup", args=[], next_run_time=now + timedelta(minutes=1)),
+            SimpleNamespace(id="task_x", name="Odd", args=[], next_run_time=now),
+            SimpleNamespace(id="task_3", name="Paused", args=[{'id': 3}], next_run_time=None),
+        ]
+        snapshot = self._snapshot(jobs)
+        
+        self.assertEqual(snapshot.primary, {1: now + timedelta(hours=1), 3: None})
+        self.assertEqual(snapshot.postponed, {2: retry_soon})  # Earliest retry wins
+        self.assertTrue(snapshot.is_paused(3))
+        self.assertFalse(snapshot.is_paused(1))
+        self.assertFalse(snapshot.is_paused(2))  # No primary job at all
+
+    def test_empty_job_store(self):
+        snapshot = self._snapshot([])
+        self.assertEqual(snapshot.primary, {})
+        self.assertEqual(snapshot.postponed, {})
+
 if __name__ == '__main__':
     unittest.main()
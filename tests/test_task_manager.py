@@ -10,7 +10,7 @@ from datetime import datetime
 # Add parent directory to path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from task_manager import TaskManager
+from task_manager import TaskManager, SettingsManager, Recurrence
 
 class TestTaskManager(unittest.TestCase):
     def setUp(self):
@@ -118,5 +118,61 @@ class TestTaskManager(unittest.TestCase):
         self.assertEqual(len(tasks), 1)
         self.assertEqual(tasks[0]['name'], "Persistent Task")
 
+
+class TestRecurrence(unittest.TestCase):
+    def test_parse_known_names(self):
+        self.assertIs(Recurrence.parse("Daily"), Recurrence.Daily)
+        self.assertIs(Recurrence.parse("Monthly"), Recurrence.Monthly)
+
+    def test_parse_missing_is_once(self):
+        self.assertIs(Recurrence.parse(None), Recurrence.Once)
+        self.assertIs(Recurrence.parse(""), Recurrence.Once)
+
+    def test_parse_unknown_is_none(self):
+        self.assertIsNone(Recurrence.parse("Hourly"))
+        self.assertIsNone(Recurrence.parse("daily"))  # Stored names are case-sensitive
+
+
+class TestSettingsManager(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.settings_file = Path(self.test_dir) / "settings.json"
+        manager = SettingsManager(self.settings_file)
+        manager.settings['disabled_addons'] = ["addon-a"]
+        manager.save_settings()
+
+    def tearDown(self):
+        SettingsManager._snapshots.pop(self.settings_file, None)
+        shutil.rmtree(self.test_dir)
+
+    def test_snapshot_lists_are_not_shared(self):
+        first = SettingsManager(self.settings_file)
+        second = SettingsManager(self.settings_file)
+        
+        # In-place change on one instance, never saved
+        first.settings['disabled_addons'].append("addon-b")
+        
+        self.assertEqual(second.settings['disabled_addons'], ["addon-a"])
+        self.assertEqual(SettingsManager(self.settings_file).settings['disabled_addons'], ["addon-a"])
+
+    def test_saved_change_is_seen_by_new_instances(self):
+        manager = SettingsManager(self.settings_file)
+        manager.settings['disabled_addons'].append("addon-b")
+        manager.save_settings()
+        
+        # Saving must not keep a reference to the live list either
+        manager.settings['disabled_addons'].append("addon-c")
+        self.assertEqual(SettingsManager(self.settings_file).settings['disabled_addons'], ["addon-a", "addon-b"])
+
+    def test_reload_after_external_write(self):
+        manager = SettingsManager(self.settings_file)
+        with open(self.settings_file, 'w', encoding='utf-8') as f:
+            json.dump({'theme': 'Dark'}, f)
+        # Force a different mtime even on coarse-resolution filesystems
+        stat = self.settings_file.stat()
+        os.utime(self.settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        self.assertEqual(manager.load_settings(), {'theme': 'Dark'})
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from PyQt6.QtCore import Qt
+    from widgets.task_table_model import TaskTableModel
+except ImportError:
+    TaskTableModel = None
+
+
+@unittest.skipIf(TaskTableModel is None, "PyQt6 not installed")
+class TestTaskTableModel(unittest.TestCase):
+    def setUp(self):
+        self.model = TaskTableModel()
+        self.tasks = [{'id': i, 'name': f"Task {i}"} for i in range(4)]
+        self.model.set_tasks(
+            self.tasks,
+            ["s"] * 4,
+            ["a", "b", "c", "d"],
+            [None] * 4,
+            [("Enabled", "")] * 4,
+        )
+        self.changes = []
+        self.model.dataChanged.connect(
+            lambda top, bottom, roles: self.changes.append((top.row(), bottom.row(), top.column()))
+        )
+
+    def test_unchanged_countdowns_emit_nothing(self):
+        self.model.set_countdowns(["a", "b", "c", "d"])
+        self.assertEqual(self.changes, [])
+
+    def test_changed_rows_span_one_signal(self):
+        self.model.set_countdowns(["a", "x", "c", "y"])
+        self.assertEqual(self.changes, [(1, 3, TaskTableModel.COL_COUNTDOWN)])
+        self.assertEqual(self.model.data(self.model.index(3, TaskTableModel.COL_COUNTDOWN)), "y")
+
+    def test_countdowns_returns_a_copy(self):
+        countdowns = self.model.countdowns()
+        countdowns[0] = "changed"
+        self.assertEqual(self.model.data(self.model.index(0, TaskTableModel.COL_COUNTDOWN)), "a")
+
+    def test_rows_do_not_follow_the_source_list(self):
+        # The task manager's list can grow before the table is refreshed
+        self.tasks.append({'id': 4, 'name': "Task 4"})
+        self.assertEqual(self.model.rowCount(), 4)
+
+    def test_status_role(self):
+        index = self.model.index(0, TaskTableModel.COL_STATUS)
+        self.assertEqual(self.model.data(index, TaskTableModel.STATUS_ROLE), ("Enabled", ""))
+        self.assertIsNone(self.model.data(index, Qt.ItemDataRole.DisplayRole))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,7 @@ import webbrowser
 import subprocess
 import tempfile
 import shutil
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List, Callable
@@ -26,6 +27,7 @@ ETAG_CACHE_FILE = "etag_cache.json"
 GITHUB_REPO = "Code4neverCompany/Code4never-AutoLauncher"
 # Allow overriding URL for testing
 GITHUB_API_URL = os.environ.get("AUTOLAUNCHER_UPDATE_URL", f"https://api.github.com/repos/{GITHUB_REPO}/releases")
+API_REQUEST_TIMEOUT = 10  # Seconds, applied by requests to the connect and to each read separately
 
 class UpdateManager:
     """
@@ -39,6 +41,8 @@ class UpdateManager:
         # Allow forcing executable mode for testing
         self.is_executable = getattr(sys, 'frozen', False) or os.environ.get("AUTOLAUNCHER_TEST_MODE") == "1"
         self.etag_cache = self._load_etag_cache()
+        # Silent checks run on a worker thread while About-page checks run on the GUI thread
+        self._etag_lock = threading.RLock()
         logger.info(f"UpdateManager initialized. Current Version: {self.get_current_version()}")
         logger.info(f"Running as: {'Executable' if self.is_executable else 'Python Script'}")
 
@@ -91,11 +95,35 @@ class UpdateManager:
     def _save_etag_cache(self):
         """Save ETag cache to file."""
         try:
-            with open(ETAG_CACHE_FILE, 'w') as f:
+            with self._etag_lock, open(ETAG_CACHE_FILE, 'w') as f:
                 json.dump(self.etag_cache, f, indent=2)
         except Exception as e:
             logger.warning(f"Could not save ETag cache: {e}")
     
+    def _conditional_headers(self) -> Dict:
+        """Build request headers carrying the cached release-list validators."""
+        headers = {'User-Agent': 'AutoLauncher-Updater'}  # Required by GitHub API
+        with self._etag_lock:
+            etag = self.etag_cache.get('releases_etag')
+            last_modified = self.etag_cache.get('releases_last_modified')
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+    
+    def _store_validators(self, response, releases):
+        """Remember ETag / Last-Modified from a 200 response together with its body."""
+        new_etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not new_etag and not last_modified:
+            return
+        with self._etag_lock:
+            self.etag_cache['releases_etag'] = new_etag
+            self.etag_cache['releases_last_modified'] = last_modified
+            self.etag_cache['last_releases_data'] = releases
+            self._save_etag_cache()
+    
     def _compare_versions(self, version1: str, version2: str) -> int:
         """
         Compare two version strings (supports 1.0.0 and 1.0.0a).
@@ -153,36 +181,27 @@ class UpdateManager:
         try:
             logger.info("Checking for updates...")
             
-            # Prepare headers with ETag if available
-            headers = {
-                'User-Agent': 'AutoLauncher-Updater'  # Required by GitHub API
-            }
-            etag = self.etag_cache.get('releases_etag')
-            if etag:
-                headers['If-None-Match'] = etag
-                logger.debug(f"Using cached ETag: {etag[:20]}...")
+            # Prepare headers with ETag / Last-Modified if available
+            headers = self._conditional_headers()
+            if 'If-None-Match' in headers:
+                logger.debug(f"Using cached ETag: {headers['If-None-Match'][:20]}...")
             
             # Fetch list of releases
-            response = requests.get(GITHUB_API_URL, headers=headers, timeout=10)
+            response = requests.get(GITHUB_API_URL, headers=headers, timeout=API_REQUEST_TIMEOUT)
             
             # Handle 304 Not Modified - no changes since last check
             if response.status_code == 304:
                 logger.info("No changes detected (304 Not Modified)")
                 # Use cached data if available
-                if 'last_releases_data' in self.etag_cache:
-                    releases = self.etag_cache['last_releases_data']
-                else:
+                with self._etag_lock:
+                    releases = self.etag_cache.get('last_releases_data')
+                if releases is None:
                     return None, None
             elif response.status_code == 200:
                 releases = response.json()
                 
-                # Cache the ETag and response data
-                new_etag = response.headers.get('ETag')
-                if new_etag:
-                    self.etag_cache['releases_etag'] = new_etag
-                    self.etag_cache['last_releases_data'] = releases
-                    self._save_etag_cache()
-                    logger.debug(f"Cached new ETag: {new_etag[:20]}...")
+                # Cache the validators and response data
+                self._store_validators(response, releases)
                 
                 if not releases:
                     logger.info("No releases found.")
@@ -246,7 +265,7 @@ class UpdateManager:
         try:
             logger.info("Fetching all releases from GitHub...")
             headers = {'User-Agent': 'AutoLauncher-Updater'}
-            response = requests.get(GITHUB_API_URL, headers=headers, timeout=10)
+            response = requests.get(GITHUB_API_URL, headers=headers, timeout=API_REQUEST_TIMEOUT)
             
             if response.status_code == 200:
                 releases = response.json()
@@ -296,11 +315,16 @@ class UpdateManager:
             Same as check_for_updates() but with reduced logging verbosity
         """
         try:
-            headers = {'User-Agent': 'AutoLauncher-Updater'}
-            response = requests.get(GITHUB_API_URL, headers=headers, timeout=10)
+            response = requests.get(GITHUB_API_URL, headers=self._conditional_headers(), timeout=API_REQUEST_TIMEOUT)
             
-            if response.status_code == 200:
-                releases = response.json()
+            if response.status_code in (200, 304):
+                if response.status_code == 304:
+                    # Not modified: no body was sent, reuse the releases from the last 200
+                    with self._etag_lock:
+                        releases = self.etag_cache.get('last_releases_data')
+                else:
+                    releases = response.json()
+                    self._store_validators(response, releases)
                 if not releases:
                     return None, None
                     
@@ -5,6 +5,8 @@ Custom widgets for card-based task display.
 
 from .task_card import TaskCard
 from .countdown_indicator import CountdownIndicator
-from .status_badge import StatusBadge
+from .status_badge import StatusBadge, StatusBadgeDelegate
+from .task_table_model import TaskTableModel
+from .lazy_interface import LazyInterface
 
-__all__ = ['TaskCard', 'CountdownIndicator', 'StatusBadge']
+__all__ = ['TaskCard', 'CountdownIndicator', 'StatusBadge', 'StatusBadgeDelegate', 'TaskTableModel', 'LazyInterface']
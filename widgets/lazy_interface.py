@@ -0,0 +1,37 @@
+"""
+LazyInterface Widget
+Navigation page placeholder that builds its real content on first use.
+"""
+
+from typing import Callable, Optional
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+
+
+class LazyInterface(QWidget):
+    """
+    Stand-in registered with the navigation under the real page's object name.
+    The wrapped widget is constructed by `factory` the first time content()
+    is called and then fills the placeholder.
+    """
+
+    def __init__(self, object_name: str, factory: Callable[[QWidget], QWidget], parent=None):
+        super().__init__(parent)
+        self.setObjectName(object_name)
+        self._factory = factory
+        self._content: Optional[QWidget] = None
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(0)
+
+    def is_created(self) -> bool:
+        """Whether the real page has been built yet."""
+        return self._content is not None
+
+    def content(self) -> QWidget:
+        """The real page, built on first access."""
+        if self._content is None:
+            self._content = self._factory(self)
+            self._layout.addWidget(self._content)
+        return self._content
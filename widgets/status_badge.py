@@ -1,11 +1,72 @@
 """
 StatusBadge Widget
-Colored badge indicating task status with multiple states.
+Colored badge indicating task status with multiple states, plus an item
+delegate that paints the same badge inside table cells.
 """
 
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtProperty
+from PyQt6.QtCore import Qt, QPropertyAnimation, QVariantAnimation, QEasingCurve, QRect, pyqtProperty
 from PyQt6.QtGui import QPainter, QColor, QFont
-from PyQt6.QtWidgets import QWidget
+from PyQt6.QtWidgets import QWidget, QStyledItemDelegate
+
+
+# Status -> (translation key under 'widgets.', background color)
+_BADGE_STYLES = {
+    "Running": ("status_running", QColor(0, 120, 215)),      # Fluent Blue
+    "Enabled": ("status_enabled", QColor(16, 124, 16)),      # Success Green
+    "Disabled": ("status_disabled", QColor(100, 100, 100)),  # Grey
+    "Expired": ("status_expired", QColor(180, 100, 0)),      # Orange
+    "Paused": ("status_paused", QColor(140, 140, 40)),       # Yellow-ish
+    "Error": ("status_error", QColor(200, 0, 0)),            # Red
+    "Postponed": ("status_postponed", QColor(243, 156, 18)), # Orange
+    "Failed": ("status_failed", QColor(231, 76, 60)),        # Red
+}
+_UNKNOWN_BADGE_COLOR = QColor(127, 140, 141)  # Gray
+
+BADGE_HEIGHT = 24
+BADGE_WIDTH = 80
+BADGE_WIDTH_WITH_SUBTITLE = 120
+
+
+def badge_style(status: str):
+    """Localized display text and background color for a status."""
+    from language_manager import get_language_manager
+    key, color = _BADGE_STYLES.get(status, ("status_unknown", _UNKNOWN_BADGE_COLOR))
+    text = get_language_manager().get_text(f"widgets.{key}")
+    if text == f"widgets.{key}":  # Missing translation
+        text = status
+    return text, color
+
+
+def paint_badge(painter: QPainter, rect: QRect, bg_color: QColor, text: str, subtitle: str = "",
+                opacity: float = 1.0):
+    """Draw a status pill (rounded background, bold text, optional subtitle) into rect."""
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    
+    bg_color = QColor(bg_color)
+    if opacity != 1.0:
+        bg_color.setAlphaF(opacity)
+    
+    # Draw rounded rectangle
+    painter.setBrush(bg_color)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawRoundedRect(rect, 12, 12)
+    
+    # Draw Text
+    painter.setPen(Qt.GlobalColor.white)
+    font = QFont("Segoe UI", 8, QFont.Weight.Bold)
+    painter.setFont(font)
+
+    if subtitle:
+        # Draw main status slightly up
+        painter.drawText(rect.adjusted(0, -6, 0, -6), Qt.AlignmentFlag.AlignCenter, text)
+        # Draw subtitle slightly down and smaller
+        font.setPointSize(7)
+        font.setWeight(QFont.Weight.Normal)
+        painter.setFont(font)
+        painter.setPen(QColor(220, 220, 220))
+        painter.drawText(rect.adjusted(0, 8, 0, 8), Qt.AlignmentFlag.AlignCenter, subtitle)
+    else:
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
 
 
 class StatusBadge(QWidget):
@@ -71,89 +132,93 @@ class StatusBadge(QWidget):
         """
         self._status = status
         self._subtitle = subtitle
-        
-        # Get translator
-        from language_manager import get_language_manager
-        lang_mgr = get_language_manager()
-        
-        # Helper to translate
-        def tr(key, default):
-            return lang_mgr.get_text(f"widgets.{key}", default)
+        self._display_text, self._bg_color = badge_style(status)
         
         if status == "Running":
-            self._display_text = tr("status_running", "Running")
-            self._bg_color = QColor(0, 120, 215)  # Fluent Blue
             self.start_pulse()
-        elif status == "Enabled":
-            self._display_text = tr("status_enabled", "Enabled")
-            self._bg_color = QColor(16, 124, 16)  # Success Green
-            self.stop_pulse()
-        elif status == "Disabled":
-            self._display_text = tr("status_disabled", "Disabled")
-            self._bg_color = QColor(100, 100, 100) # Grey
-            self.stop_pulse()
-        elif status == "Expired":
-            self._display_text = tr("status_expired", "Expired")
-            self._bg_color = QColor(180, 100, 0)   # Orange
-            self.stop_pulse()
-        elif status == "Paused":
-            self._display_text = tr("status_paused", "Paused")
-            self._bg_color = QColor(140, 140, 40)  # Yellow-ish
-            self.stop_pulse()
-        elif status == "Error":
-             self._display_text = tr("status_error", "Error")
-             self._bg_color = QColor(200, 0, 0)     # Red
-             self.stop_pulse()
-        elif status == "Postponed": # Original status, not in the provided snippet, but should be handled
-            self._display_text = tr("status_postponed", "Postponed")
-            self._bg_color = QColor(243, 156, 18) # Orange
-            self.stop_pulse()
-        elif status == "Failed": # Original status, not in the provided snippet, but should be handled
-            self._display_text = tr("status_failed", "Failed")
-            self._bg_color = QColor(231, 76, 60) # Red
-            self.stop_pulse()
-        else: # Default for unknown statuses
-            self._display_text = tr("status_unknown", status)
-            self._bg_color = QColor(127, 140, 141) # Gray
+        else:
             self.stop_pulse()
         
         # Adjust width based on content
         if subtitle:
-            self.setFixedWidth(120)
+            self.setFixedWidth(BADGE_WIDTH_WITH_SUBTITLE)
         else:
-            self.setFixedWidth(80)
+            self.setFixedWidth(BADGE_WIDTH)
         
         self.update()
     
     def paintEvent(self, event):
         """Custom paint for status badge."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        paint_badge(painter, self.rect(), self._bg_color, self._display_text, self._subtitle, self._pulse_opacity)
+
+
+class StatusBadgeDelegate(QStyledItemDelegate):
+    """
+    Paints a status pill straight into an item view cell, so a table needs no
+    StatusBadge widget per row. The cell's model data for `role` must be a
+    (status, subtitle) tuple. The view's regular delegate still paints the cell
+    background (selection/hover) underneath.
+    """
+    
+    def __init__(self, view, column: int, role: int):
+        super().__init__(view)
+        self._view = view
+        self._column = column
+        self._role = role
+        self._base = view.itemDelegate()
+        self._styles = {}  # status -> (display text, color); cleared on language change
+        self._pulse_opacity = 1.0
         
-        # Use localized bg_color
-        bg_color = QColor(self._bg_color)
-        if self.pulseOpacity != 1.0:
-            bg_color.setAlphaF(self._pulse_opacity)
+        # Pulse animation for running status (same curve as StatusBadge)
+        self._pulse_animation = QVariantAnimation(self)
+        self._pulse_animation.setDuration(1000)
+        self._pulse_animation.setStartValue(1.0)
+        self._pulse_animation.setEndValue(0.5)
+        self._pulse_animation.setEasingCurve(QEasingCurve.Type.InOutSine)
+        self._pulse_animation.setLoopCount(-1)  # Infinite loop
+        self._pulse_animation.valueChanged.connect(self._on_pulse)
+    
+    def clear_style_cache(self):
+        """Forget localized texts (call after a language change)."""
+        self._styles.clear()
+    
+    def set_pulsing(self, pulsing: bool):
+        """Animate Running badges (only needed while some row is Running)."""
+        if pulsing:
+            if self._pulse_animation.state() != QVariantAnimation.State.Running:
+                self._pulse_animation.start()
+        elif self._pulse_animation.state() == QVariantAnimation.State.Running:
+            self._pulse_animation.stop()
+            self._pulse_opacity = 1.0
+    
+    def _on_pulse(self, value):
+        self._pulse_opacity = value
+        # Repaint only the badge column
+        viewport = self._view.viewport()
+        x = self._view.columnViewportPosition(self._column)
+        viewport.update(QRect(x, 0, self._view.columnWidth(self._column), viewport.height()))
+    
+    def paint(self, painter, option, index):
+        self._base.paint(painter, option, index)
         
-        # Draw rounded rectangle
-        painter.setBrush(bg_color)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(0, 0, self.width(), self.height(), 12, 12)
+        badge = index.data(self._role)
+        if not badge:
+            return
+        status, subtitle = badge
         
-        # Draw Text
-        painter.setPen(Qt.GlobalColor.white)
-        text_rect = self.rect() # Use self.rect() for the bounding rectangle
-        font = QFont("Segoe UI", 8, QFont.Weight.Bold)
-        painter.setFont(font)
-
-        if self._subtitle:
-             # Draw main status slightly up
-             painter.drawText(text_rect.adjusted(0, -6, 0, -6), Qt.AlignmentFlag.AlignCenter, self._display_text)
-             # Draw subtitle slightly down and smaller
-             font.setPointSize(7)
-             font.setWeight(QFont.Weight.Normal)
-             painter.setFont(font)
-             painter.setPen(QColor(220, 220, 220))
-             painter.drawText(text_rect.adjusted(0, 8, 0, 8), Qt.AlignmentFlag.AlignCenter, self._subtitle)
-        else:
-             painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, self._display_text)
+        style = self._styles.get(status)
+        if style is None:
+            style = self._styles[status] = badge_style(status)
+        text, color = style
+        
+        # Centered pill, same size as a StatusBadge widget
+        width = BADGE_WIDTH_WITH_SUBTITLE if subtitle else BADGE_WIDTH
+        cell = option.rect
+        rect = QRect(cell.x() + (cell.width() - width) // 2, cell.y() + (cell.height() - BADGE_HEIGHT) // 2,
+                     width, BADGE_HEIGHT)
+        
+        painter.save()
+        paint_badge(painter, rect, color, text, subtitle,
+                    self._pulse_opacity if status == "Running" else 1.0)
+        painter.restore()
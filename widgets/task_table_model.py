@@ -0,0 +1,133 @@
+"""
+TaskTableModel
+Item model behind the main window's task table.
+"""
+
+from typing import List, Optional, Tuple
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QIcon
+
+
+class TaskTableModel(QAbstractTableModel):
+    """
+    Read-only model over the task list.
+    Display strings and statuses are computed by the window and stored column-wise,
+    so the view only queries the cells it paints and countdown ticks touch one column.
+    """
+
+    COL_NAME = 0
+    COL_PATH = 1
+    COL_SCHEDULE = 2
+    COL_COUNTDOWN = 3
+    COL_STATUS = 4
+    COLUMN_COUNT = 5
+
+    # (status, subtitle) of the status column, painted by StatusBadgeDelegate
+    STATUS_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers: List[str] = [""] * self.COLUMN_COUNT
+        self._tasks: List[dict] = []
+        self._schedules: List[str] = []
+        self._countdowns: List[str] = []
+        self._icons: List[Optional[QIcon]] = []
+        self._statuses: List[Tuple[str, str]] = []
+
+    # --- Qt model interface ---
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tasks)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole
+                and 0 <= section < self.COLUMN_COUNT):
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.COL_NAME:
+                return self._tasks[row].get('name', '')
+            if column == self.COL_PATH:
+                return self._tasks[row].get('program_path', '')
+            if column == self.COL_SCHEDULE:
+                return self._schedules[row]
+            if column == self.COL_COUNTDOWN:
+                return self._countdowns[row]
+        elif role == Qt.ItemDataRole.DecorationRole and column == self.COL_NAME:
+            return self._icons[row]
+        elif role == Qt.ItemDataRole.UserRole:
+            return self._tasks[row].get('id')
+        elif role == self.STATUS_ROLE and column == self.COL_STATUS:
+            return self._statuses[row]
+        return None
+
+    # --- Updates from the window ---
+
+    def set_headers(self, labels: List[str]):
+        """Replace the column titles."""
+        self._headers = list(labels)
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    def set_tasks(self, tasks: List[dict], schedules: List[str], countdowns: List[str],
+                  icons: List[Optional[QIcon]], statuses: List[Tuple[str, str]]):
+        """Replace all rows (parallel lists, one entry per task)."""
+        self.beginResetModel()
+        # Own copy: the task manager's list can grow before a refresh catches up with it
+        self._tasks = list(tasks)
+        self._schedules = schedules
+        self._countdowns = countdowns
+        self._icons = icons
+        self._statuses = statuses
+        self.endResetModel()
+
+    def set_countdowns(self, countdowns: List[str]):
+        """
+        Replace the countdown column and repaint only the rows whose text changed
+        (one dataChanged spanning the first to last changed row).
+        """
+        previous = self._countdowns
+        self._countdowns = countdowns
+        if len(previous) != len(countdowns):
+            changed = range(len(countdowns))
+        else:
+            changed = [row for row, (old, new) in enumerate(zip(previous, countdowns)) if old != new]
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], self.COL_COUNTDOWN),
+                self.index(changed[-1], self.COL_COUNTDOWN),
+                [Qt.ItemDataRole.DisplayRole]
+            )
+
+    def countdowns(self) -> List[str]:
+        """Copy of the countdown column."""
+        return list(self._countdowns)
+
+    def set_row_state(self, row: int, task: dict, countdown: str, status: Tuple[str, str]):
+        """
+        Replace one row's task, countdown and status, repainting only the countdown and status
+        cells (the task manager may have swapped in a new dict for the same task).
+        """
+        self._tasks[row] = task
+        self._countdowns[row] = countdown
+        self._statuses[row] = status
+        self.dataChanged.emit(self.index(row, self.COL_COUNTDOWN), self.index(row, self.COL_STATUS))
+
+    def has_status(self, status: str) -> bool:
+        """Whether any row currently shows `status`."""
+        return any(row_status == status for row_status, _ in self._statuses)
+
+    def task(self, row: int) -> dict:
+        return self._tasks[row]
+
+    def task_id(self, row: int):
+        return self._tasks[row].get('id')